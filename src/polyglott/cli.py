@@ -3,17 +3,16 @@
 import argparse
 import glob
 import os
+import re
 import sys
 from collections import Counter
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Pattern
 
 from polyglott import __version__
-from polyglott.parser import POParser, MultiPOParser
-from polyglott.exporter import export_to_csv
-from polyglott.linter import Glossary, Severity, run_checks
-from polyglott.formatter import format_text_output
-from polyglott.context import load_context_rules, load_preset, match_context
+
+# Subcommand dependencies (polib, pandas, yaml) are imported inside the
+# command handlers so --help, --version and argument errors stay fast.
 
 
 def resolve_po_files(
@@ -44,7 +43,7 @@ def resolve_po_files(
     if include_patterns:
         for pattern in include_patterns:
             expanded = os.path.expanduser(pattern)
-            matches = glob.glob(expanded, recursive=True)
+            matches = _scan_glob(expanded)
             if not matches:
                 print(f"Warning: Pattern '{pattern}' matched no files.", file=sys.stderr)
             files.update(matches)
@@ -53,14 +52,10 @@ def resolve_po_files(
     if not files:
         raise ValueError("No PO files specified. Use positional arguments or --include.")
 
-    # 4. Remove files matching any --exclude pattern
+    # 4. Remove files matching any --exclude pattern (one regex for all patterns)
     if exclude_patterns:
-        excluded = set()
-        for pattern in exclude_patterns:
-            expanded = os.path.expanduser(pattern)
-            matches = glob.glob(expanded, recursive=True)
-            excluded.update(matches)
-        files -= excluded
+        exclude_re = compile_globs(exclude_patterns)
+        files = {f for f in files if not exclude_re.fullmatch(f.replace(os.sep, '/'))}
 
     # 5. Raise error if all files were excluded
     if not files:
@@ -70,6 +65,102 @@ def resolve_po_files(
     return sorted(files)
 
 
+# Characters that make a path component a glob pattern (same as glob.magic_check)
+_GLOB_MAGIC_RE = re.compile(r'[*?[]')
+
+
+def _scan_glob(pattern: str) -> List[str]:
+    """Expand a glob pattern like glob.glob(pattern, recursive=True).
+
+    The common case of wildcards in the file name only (e.g. 'locale/*.po')
+    is handled with a single os.scandir pass over the directory and one
+    precompiled regex. Everything else is left to glob.
+
+    Args:
+        pattern: Glob pattern with '~' already expanded
+
+    Returns:
+        Matching paths, in directory order
+    """
+    dirname, name = os.path.split(pattern)
+    if _GLOB_MAGIC_RE.search(dirname) or not _GLOB_MAGIC_RE.search(name) or '**' in name:
+        return glob.glob(pattern, recursive=True)
+
+    name_re = re.compile(_glob_segment_to_regex(name))
+    try:
+        with os.scandir(dirname or os.curdir) as it:
+            return [os.path.join(dirname, entry.name) for entry in it if name_re.fullmatch(entry.name)]
+    except OSError:
+        # Missing or unreadable directory: glob reports no matches too
+        return []
+
+
+def compile_globs(patterns: List[str]) -> Pattern[str]:
+    """Compile glob patterns into a single regex with glob.glob semantics.
+
+    '*', '?' and '[...]' don't cross '/', '**' matches any number of
+    directories, and wildcards don't match names starting with '.'.
+    Matching against candidate paths avoids walking the filesystem once
+    per pattern.
+
+    Args:
+        patterns: Glob patterns (with '~' expanded like --include)
+
+    Returns:
+        Compiled regex; use fullmatch() on '/'-separated paths
+    """
+    alternatives = []
+    for pattern in patterns:
+        segments = os.path.expanduser(pattern).replace(os.sep, '/').split('/')
+        regex = ''
+        for i, segment in enumerate(segments):
+            is_last = i == len(segments) - 1
+            if segment == '**':
+                # Zero or more non-hidden directories (or files, at the end)
+                regex += r'(?:[^/.][^/]*(?:/|$))*' if is_last else r'(?:[^/.][^/]*/)*'
+                continue
+            regex += _glob_segment_to_regex(segment) + ('' if is_last else '/')
+        alternatives.append(regex)
+    return re.compile('|'.join(f'(?:{regex})' for regex in alternatives))
+
+
+def _glob_segment_to_regex(segment: str) -> str:
+    """Translate one path segment of a glob pattern to a regex.
+
+    Args:
+        segment: Pattern segment without '/' separators
+
+    Returns:
+        Regex source matching a single path component
+    """
+    # Wildcards at the start of a segment don't match hidden names
+    regex = r'(?!\.)' if segment[:1] in ('*', '?', '[') else ''
+    i = 0
+    while i < len(segment):
+        char = segment[i]
+        if char == '*':
+            regex += '[^/]*'
+        elif char == '?':
+            regex += '[^/]'
+        elif char == '[':
+            end = segment.find(']', i + 2)
+            if end == -1:
+                regex += re.escape(char)
+            else:
+                body = segment[i + 1:end].replace('\\', '\\\\').replace('[', '\\[')
+                if body.startswith('!'):
+                    body = '^/' + body[1:]
+                elif body.startswith('^'):
+                    # A literal '^' in glob, as in fnmatch.translate
+                    body = '\\' + body
+                regex += f'[{body}]'
+                i = end
+        else:
+            regex += re.escape(char)
+        i += 1
+    return regex
+
+
 def load_context_rules_from_args(args: argparse.Namespace) -> Optional[List[dict]]:
     """Load context rules from CLI arguments.
 
@@ -90,6 +181,8 @@ def load_context_rules_from_args(args: argparse.Namespace) -> Optional[List[dict
     if has_context_rules and has_preset:
         raise ValueError("Cannot specify both --context-rules and --preset")
 
+    from polyglott.context import load_context_rules, load_preset
+
     if has_context_rules:
         return load_context_rules(args.context_rules)
     elif has_preset:
@@ -108,6 +201,12 @@ def cmd_lint(args: argparse.Namespace) -> int:
         Exit code (0=clean, 1=errors, 2=warnings only)
     """
     try:
+        from polyglott.parser import POParser, MultiPOParser
+        from polyglott.exporter import export_to_csv
+        from polyglott.linter import Glossary, Severity, run_checks
+        from polyglott.formatter import format_text_output
+        from polyglott.context import match_context
+
         # Load context rules if specified
         try:
             context_rules = load_context_rules_from_args(args)
@@ -151,7 +250,7 @@ def cmd_lint(args: argparse.Namespace) -> int:
                     print(f"Error: File not found: {filepath}", file=sys.stderr)
                     return 1
 
-            parser = MultiPOParser(files)
+            parser = MultiPOParser(files, jobs=args.jobs)
             entries = parser.parse()
             multi_file = True
 
@@ -239,6 +338,10 @@ def cmd_scan(args: argparse.Namespace) -> int:
         Exit code (0 for success, 1 for error)
     """
     try:
+        from polyglott.parser import POParser
+        from polyglott.exporter import export_to_csv
+        from polyglott.context import match_context
+
         # Load context rules if specified
         try:
             context_rules = load_context_rules_from_args(args)
@@ -308,6 +411,7 @@ def cmd_import(args: argparse.Namespace) -> int:
         from polyglott.master import (
             load_master, save_master, create_master, merge_master, infer_language
         )
+        from polyglott.parser import MultiPOParser
 
         # Validate language
         try:
@@ -341,7 +445,7 @@ def cmd_import(args: argparse.Namespace) -> int:
                 return 1
 
         # Parse all PO files
-        parser = MultiPOParser(files)
+        parser = MultiPOParser(files, jobs=args.jobs)
         entries = parser.parse()
 
         # Load glossary if provided
@@ -394,7 +498,7 @@ def cmd_export(args: argparse.Namespace) -> int:
     """
     try:
         from polyglott.master import load_master, infer_language
-        from polyglott.po_writer import export_to_po
+        from polyglott.po_writer import export_to_po_batch
 
         # Validate language (for informational purposes)
         try:
@@ -442,15 +546,15 @@ def cmd_export(args: argparse.Namespace) -> int:
         total_overwrites = 0
         file_results = []
 
-        for po_file in files:
-            result = export_to_po(
-                master_entries,
-                po_file,
-                statuses,
-                dry_run=dry_run,
-                verbose=verbose
-            )
+        results = export_to_po_batch(
+            master_entries,
+            files,
+            statuses,
+            dry_run=dry_run,
+            verbose=verbose
+        )
 
+        for po_file, result in zip(files, results):
             total_writes += result.writes
             total_overwrites += result.overwrites
             file_results.append((po_file, result))
@@ -539,7 +643,7 @@ def cmd_translate(args: argparse.Namespace) -> int:
 
         # Initialize DeepL backend
         try:
-            backend = DeepLBackend(auth_key)
+            backend = DeepLBackend(auth_key, eager_validate=True)
         except TranslationError as e:
             print(f"Error: {e}", file=sys.stderr)
             return 1
@@ -671,9 +775,33 @@ def _dry_run_translate(entries: List, target_lang: str, source_lang: str) -> int
     return 0
 
 
-def main() -> int:
+def _jobs_count(value: str) -> int:
+    """Parse and validate the --jobs argument.
+
+    Args:
+        value: Raw argument value
+
+    Returns:
+        Number of worker processes (0 = one per CPU)
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not a non-negative integer
+    """
+    try:
+        jobs = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid job count: '{value}'")
+    if jobs < 0:
+        raise argparse.ArgumentTypeError("job count must be 0 or greater")
+    return jobs
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     """Main entry point for the CLI.
 
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+
     Returns:
         Exit code
     """
@@ -697,6 +825,15 @@ def main() -> int:
         help='Glob pattern to exclude (repeatable)'
     )
 
+    # Parallel parsing — used by import, lint
+    jobs_parser = argparse.ArgumentParser(add_help=False)
+    jobs_parser.add_argument(
+        '-j', '--jobs',
+        type=_jobs_count,
+        default=1,
+        help='Parse PO files in N worker processes (0 = one per CPU, default: 1)'
+    )
+
     # Sort control — used by scan, import, export
     sort_parser = argparse.ArgumentParser(add_help=False)
     sort_parser.add_argument(
@@ -784,7 +921,8 @@ def main() -> int:
     # Import subcommand — uses all relevant parent parsers
     import_parser = subparsers.add_parser(
         "import",
-        parents=[master_parser, po_input_parser, sort_parser, glossary_parser, context_parser, lang_parser],
+        parents=[master_parser, po_input_parser, jobs_parser, sort_parser, glossary_parser, context_parser,
+                 lang_parser],
         help="Import PO file translations into master CSV"
     )
 
@@ -818,7 +956,7 @@ def main() -> int:
     # Cannot use po_input_parser because lint has optional positional 'file' instead of 'po_files'
     lint_parser = subparsers.add_parser(
         "lint",
-        parents=[glossary_parser, context_parser],
+        parents=[jobs_parser, glossary_parser, context_parser],
         help="Check PO file(s) for quality issues"
     )
 
@@ -899,7 +1037,7 @@ def main() -> int:
     )
 
     # Parse arguments
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Execute command
     if args.command == "scan":
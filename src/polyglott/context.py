@@ -1,11 +1,19 @@
 """Context inference from PO file source references."""
 
+import os
+import re
 from collections import Counter
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Union
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 # Built-in presets
 PRESETS = {
     'django': [
@@ -24,6 +32,74 @@ PRESETS = {
 }
 
 
+class CompiledRules:
+    """Context rules compiled into a single regex for fast matching.
+
+    Each rule becomes a lookahead alternative, tried in rule order, so one
+    regex match per filepath finds the first rule whose pattern occurs as a
+    substring. Results are memoized per filepath, since the same source
+    files are referenced by many entries.
+    """
+
+    def __init__(self, rules: List[Dict[str, str]]):
+        """Compile a list of rule dictionaries.
+
+        Args:
+            rules: List of rule dictionaries with 'pattern' and 'context'
+        """
+        self.rules = list(rules)
+        self._contexts = [rule['context'] for rule in self.rules]
+        self._regex = re.compile(
+            '|'.join(f"(?=.*?({re.escape(rule['pattern'])}))" for rule in self.rules),
+            re.DOTALL
+        ) if self.rules else None
+        self._memo: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def match(self, filepath: str) -> str:
+        """Match a single filepath against the rules.
+
+        Args:
+            filepath: File path to match
+
+        Returns:
+            Context string of the first matching rule, empty string otherwise
+        """
+        context = self._memo.get(filepath)
+        if context is None:
+            context = ''
+            if self._regex is not None:
+                m = self._regex.match(filepath)
+                if m:
+                    context = self._contexts[m.lastindex - 1]
+            self._memo[filepath] = context
+        return context
+
+
+RulesLike = Union[List[Dict[str, str]], CompiledRules]
+
+
+def compile_rules(rules: RulesLike) -> CompiledRules:
+    """Compile context rules, reusing a cached compilation for identical rules.
+
+    Args:
+        rules: List of rule dictionaries, or an already compiled CompiledRules
+
+    Returns:
+        CompiledRules instance
+    """
+    if isinstance(rules, CompiledRules):
+        return rules
+    return _compile_rules_cached(tuple((rule['pattern'], rule['context']) for rule in rules))
+
+
+@lru_cache(maxsize=32)
+def _compile_rules_cached(pairs: Tuple[Tuple[str, str], ...]) -> CompiledRules:
+    return CompiledRules([{'pattern': pattern, 'context': context} for pattern, context in pairs])
+
+
 def load_context_rules(path: str) -> List[Dict[str, str]]:
     """Load context rules from a YAML file.
 
@@ -41,9 +117,34 @@ def load_context_rules(path: str) -> List[Dict[str, str]]:
     if not rules_path.exists():
         raise FileNotFoundError(f"Context rules file not found: {path}")
 
+    # Key the cache on mtime and size so edited files are reparsed
+    st = os.stat(rules_path)
+    rules = _load_context_rules_cached(str(rules_path), st.st_mtime_ns, st.st_size)
+
+    # Hand out copies so callers can't mutate the cached rules
+    return [dict(rule) for rule in rules]
+
+
+@lru_cache(maxsize=32)
+def _load_context_rules_cached(
+    path: str, mtime_ns: int, size: int
+) -> Tuple[Dict[str, str], ...]:
+    """Parse and validate a context rules file.
+
+    Args:
+        path: Path to the YAML rules file
+        mtime_ns: File modification time, used only as part of the cache key
+        size: File size in bytes, used only as part of the cache key
+
+    Returns:
+        Tuple of validated rule dictionaries
+
+    Raises:
+        ValueError: If the YAML is malformed or missing required fields
+    """
     try:
-        with open(rules_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        with open(path, 'r', encoding='utf-8') as f:
+            data = yaml.load(f, Loader=SafeLoader)
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML in context rules file: {e}")
 
@@ -80,7 +181,7 @@ def load_context_rules(path: str) -> List[Dict[str, str]]:
             'context': rule['context']
         })
 
-    return validated_rules
+    return tuple(validated_rules)
 
 
 def load_preset(name: str) -> List[Dict[str, str]]:
@@ -102,12 +203,13 @@ def load_preset(name: str) -> List[Dict[str, str]]:
     return PRESETS[name]
 
 
-def match_context(references: str, rules: List[Dict[str, str]]) -> Tuple[str, str]:
+def match_context(references: str, rules: RulesLike) -> Tuple[str, str]:
     """Match references against context rules and determine context.
 
     Args:
         references: Space-separated string of filepath:lineno references
-        rules: List of rule dictionaries with 'pattern' and 'context'
+        rules: List of rule dictionaries with 'pattern' and 'context',
+            or a CompiledRules instance
 
     Returns:
         Tuple of (context, context_sources)
@@ -122,71 +224,36 @@ def match_context(references: str, rules: List[Dict[str, str]]) -> Tuple[str, st
         5. No references: references string is empty => empty string, empty sources
     """
     # Handle empty references
-    if not references or not references.strip():
+    if not references:
         return ('', '')
 
-    # Parse references into list of filepaths
-    ref_list = references.strip().split()
-    filepaths = []
-    for ref in ref_list:
-        # Strip :lineno suffix
-        if ':' in ref:
-            filepath = ref.rsplit(':', 1)[0]
-            filepaths.append(filepath)
-
-    if not filepaths:
-        return ('', '')
-
-    # Match each filepath against rules
-    matched_contexts = []
-    filepath_context_map = {}
-
-    for filepath in filepaths:
-        matched_context = _match_single_reference(filepath, rules)
-        if matched_context:
-            matched_contexts.append(matched_context)
-            filepath_context_map[filepath] = matched_context
+    # Match each reference's filepath (with :lineno stripped) against rules.
+    # References without a :lineno suffix are skipped.
+    compiled = compile_rules(rules)
+    filepaths = [
+        filepath
+        for filepath, sep, _ in (ref.rpartition(':') for ref in references.split())
+        if sep
+    ]
+    matches = [(fp, ctx) for fp in filepaths if (ctx := compiled.match(fp))]
 
     # No matches at all
-    if not matched_contexts:
+    if not matches:
         return ('', '')
 
-    # Count occurrences of each context
-    context_counts = Counter(matched_contexts)
-    unique_contexts = list(context_counts.keys())
+    # Count occurrences of each context (one vote per reference)
+    top = Counter(ctx for _, ctx in matches).most_common(2)
 
     # Unanimous: all references match the same context
-    if len(unique_contexts) == 1:
-        return (unique_contexts[0], '')
+    if len(top) == 1:
+        return (top[0][0], '')
 
-    # Multiple contexts: determine majority or ambiguous
-    max_count = max(context_counts.values())
-    contexts_with_max = [ctx for ctx, count in context_counts.items() if count == max_count]
+    # Build context_sources string (one pair per distinct filepath)
+    context_sources = ';'.join(f"{fp}={ctx}" for fp, ctx in dict(matches).items())
 
-    # Build context_sources string
-    context_sources_list = [f"{fp}={ctx}" for fp, ctx in filepath_context_map.items()]
-    context_sources = ';'.join(context_sources_list)
-
-    if len(contexts_with_max) == 1:
+    if top[0][1] > top[1][1]:
         # Clear majority
-        return (contexts_with_max[0], context_sources)
+        return (top[0][0], context_sources)
     else:
         # Tie
         return ('ambiguous', context_sources)
-
-
-def _match_single_reference(filepath: str, rules: List[Dict[str, str]]) -> str:
-    """Match a single filepath against rules.
-
-    Args:
-        filepath: File path to match
-        rules: List of rule dictionaries
-
-    Returns:
-        Context string if matched, empty string otherwise
-    """
-    for rule in rules:
-        pattern = rule['pattern']
-        if pattern in filepath:
-            return rule['context']
-    return ''
@@ -1,6 +1,5 @@
 """Text output formatter for lint violations."""
 
-import re
 from collections import defaultdict
 from typing import Dict, List
 
@@ -90,17 +89,14 @@ def _extract_line_number(references: str) -> str:
     Returns:
         Line number as string, or empty string if not found
     """
-    if not references:
-        return ""
-
-    # Split by space and take first reference
-    refs = references.split()
+    # Only split off the first reference; the rest is never looked at
+    refs = references.split(None, 1)
     if not refs:
         return ""
 
     # Extract line number from "file:line" format
-    match = re.search(r':(\d+)$', refs[0])
-    if match:
-        return match.group(1)
+    _, sep, line = refs[0].rpartition(':')
+    if sep and line.isdecimal():
+        return line
 
     return ""
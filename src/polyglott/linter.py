@@ -4,12 +4,18 @@ import re
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Pattern
 
 import yaml
 
 from polyglott.parser import POEntryData
 
+# Percent-style: %(name)s, %(count)d, etc.
+_PERCENT_PLACEHOLDER_RE = re.compile(r'%\([^)]+\)[diouxXeEfFgGcrsa%]')
+
+# Brace-style: {0}, {name}, {}, {name:format}
+_BRACE_PLACEHOLDER_RE = re.compile(r'\{[^}]*\}')
+
 
 class Severity(Enum):
     """Violation severity levels."""
@@ -60,6 +66,40 @@ class Glossary:
         except Exception as e:
             raise ValueError(f"Failed to read glossary file: {e}")
 
+        self._load(data)
+
+    @classmethod
+    def from_string(cls, yaml_text: str) -> 'Glossary':
+        """Load glossary from YAML text instead of a file.
+
+        Args:
+            yaml_text: Glossary in the same YAML format as the file
+
+        Returns:
+            Glossary instance (filepath is None)
+
+        Raises:
+            ValueError: If the glossary is invalid
+        """
+        try:
+            data = yaml.safe_load(yaml_text)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML in glossary: {e}")
+
+        glossary = cls.__new__(cls)
+        glossary.filepath = None
+        glossary._load(data)
+        return glossary
+
+    def _load(self, data) -> None:
+        """Validate parsed glossary YAML and build the term patterns.
+
+        Args:
+            data: Result of parsing the glossary YAML
+
+        Raises:
+            ValueError: If the glossary is invalid
+        """
         if not isinstance(data, dict):
             raise ValueError("Glossary must be a YAML dictionary")
 
@@ -83,16 +123,21 @@ class Glossary:
         # Precompile regex patterns for performance
         self._patterns = {}
         for source_term, translation in self.terms.items():
-            # Word boundary pattern for case-insensitive source matching
-            pattern = re.compile(
-                r'\b' + re.escape(source_term) + r'\b',
-                re.IGNORECASE
-            )
+            # Word boundary patterns for case-insensitive matching
             self._patterns[source_term] = {
-                'source_pattern': pattern,
+                'source_pattern': _word_pattern(source_term),
+                'translation_pattern': _word_pattern(str(translation)),
                 'translation': translation
             }
 
+        # One alternation of all source terms, longest first, so entries
+        # that mention no term are rejected with a single scan of msgid
+        alternatives = sorted(self.terms, key=len, reverse=True)
+        self._any_source_pattern = re.compile(
+            r'\b(?:' + '|'.join(map(re.escape, alternatives)) + r')\b',
+            re.IGNORECASE
+        )
+
     def check_term(self, msgid: str, msgstr: str) -> Optional[str]:
         """Check if msgstr uses correct glossary terms.
 
@@ -106,26 +151,34 @@ class Glossary:
         if not msgstr:  # Skip untranslated entries
             return None
 
+        if not self._any_source_pattern.search(msgid):
+            return None
+
         for source_term, data in self._patterns.items():
             # Check if source term appears in msgid (case-insensitive)
             if data['source_pattern'].search(msgid):
-                expected_translation = data['translation']
-
                 # Check if translation uses the expected term (case-insensitive)
-                translation_pattern = re.compile(
-                    r'\b' + re.escape(expected_translation) + r'\b',
-                    re.IGNORECASE
-                )
-
-                if not translation_pattern.search(msgstr):
+                if not data['translation_pattern'].search(msgstr):
                     return (
-                        f"Expected glossary term '{expected_translation}' "
+                        f"Expected glossary term '{data['translation']}' "
                         f"for '{source_term}' not found in translation"
                     )
 
         return None
 
 
+def _word_pattern(term: str) -> Pattern[str]:
+    """Compile a case-insensitive whole-word pattern for a glossary term.
+
+    Args:
+        term: Literal term to match
+
+    Returns:
+        Compiled pattern
+    """
+    return re.compile(r'\b' + re.escape(term) + r'\b', re.IGNORECASE)
+
+
 class CheckRegistry:
     """Registry for linting checks with decorator-based registration."""
 
@@ -336,13 +389,11 @@ def _extract_placeholders(text: str) -> set:
     """
     placeholders = set()
 
-    # Percent-style: %(name)s, %(count)d, etc.
-    percent_pattern = r'%\([^)]+\)[diouxXeEfFgGcrsa%]'
-    placeholders.update(re.findall(percent_pattern, text))
-
-    # Brace-style: {0}, {name}, {}, {name:format}
-    brace_pattern = r'\{[^}]*\}'
-    placeholders.update(re.findall(brace_pattern, text))
+    # Most strings have no placeholders; skip the regex scans entirely
+    if '%' in text:
+        placeholders.update(_PERCENT_PLACEHOLDER_RE.findall(text))
+    if '{' in text:
+        placeholders.update(_BRACE_PLACEHOLDER_RE.findall(text))
 
     return placeholders
 
@@ -399,13 +450,13 @@ def run_checks(
     """
     violations = []
 
-    # Get active checks
+    # Get active checks, resolved to plain functions once up front
     active_checks = registry.get_active_checks(include_checks, exclude_checks)
+    check_funcs = [check_data['function'] for check_data in active_checks.values()]
 
     # Run checks on each entry
     for entry in entries:
-        for check_name, check_data in active_checks.items():
-            check_func = check_data['function']
+        for check_func in check_funcs:
             violation = check_func(entry, glossary)
             if violation:
                 violations.append(violation)
@@ -1,13 +1,18 @@
 """Master CSV management for consolidated translation workflow."""
 
 import csv
+import io
+import re
+import sys
 from collections import Counter
 from dataclasses import dataclass, field
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, TextIO, Union
 
 from polyglott.parser import POEntryData
-from polyglott.context import match_context
+from polyglott.context import RulesLike, compile_rules, match_context
 
 
 # Reserved columns that POlyglott reads and writes
@@ -22,10 +27,27 @@ POLYGLOTT_COLUMNS = [
     'candidate',  # Stage 7: non-destructive machine translation
 ]
 
+# POLYGLOTT_COLUMNS name MasterEntry fields, so one C-level getter reads a
+# whole row of POlyglott values as a tuple
+_polyglott_values = attrgetter(*POLYGLOTT_COLUMNS)
+_STATUS_INDEX = POLYGLOTT_COLUMNS.index('status')
 
-@dataclass
+# Language codes can be simple (de, fr: 2-3 letters) or complex
+# (en-us, zh-hans: 2-3 letters, hyphen, 2-4 letters)
+_LANG_CODE_RE = re.compile(r'[a-z]{2,3}(?:-[a-z]{2,4})?')
+_LANG_SUFFIX_RE = re.compile(r'-([a-z]{2,3}(?:-[a-z]{2,4})?)$')
+
+# Read master CSVs in 1 MiB chunks rather than the 8 KiB default
+_READ_BUFFER_SIZE = 1 << 20
+
+
+@dataclass(slots=True)
 class MasterEntry:
-    """Represents a single entry in the master CSV."""
+    """Represents a single entry in the master CSV.
+
+    Slotted like POEntryData. Entries stay mutable because the translate
+    command fills in msgstr, status and candidate in place.
+    """
 
     msgid: str
     msgstr: str
@@ -149,12 +171,12 @@ def _check_glossary_score(msgid: str, msgstr: str, glossary) -> str:
     return ""
 
 
-def _compute_context(po_entry: POEntryData, context_rules: Optional[List[dict]]) -> tuple:
+def _compute_context(po_entry: POEntryData, context_rules: Optional[RulesLike]) -> tuple:
     """Compute context and context_sources for a PO entry.
 
     Args:
         po_entry: PO entry with references
-        context_rules: Optional list of context rules
+        context_rules: Optional context rules, ideally already compiled
 
     Returns:
         Tuple of (context, context_sources)
@@ -168,14 +190,14 @@ def _compute_context(po_entry: POEntryData, context_rules: Optional[List[dict]])
 def create_master(
         po_entries: List[POEntryData],
         glossary=None,
-        context_rules: Optional[List[dict]] = None
+        context_rules: Optional[RulesLike] = None
 ) -> List[MasterEntry]:
     """Create initial master CSV from PO entries.
 
     Args:
         po_entries: List of PO entries from one or more files
         glossary: Optional Glossary instance for scoring
-        context_rules: Optional list of context rules
+        context_rules: Optional list of context rules, or CompiledRules
 
     Returns:
         List of MasterEntry objects sorted by msgid
@@ -183,6 +205,10 @@ def create_master(
     # Deduplicate entries
     deduped = deduplicate_entries(po_entries)
 
+    # Compile context rules once rather than per entry
+    if context_rules:
+        context_rules = compile_rules(context_rules)
+
     # Create master entries
     master_entries = []
     for msgid, po_entry in deduped.items():
@@ -221,7 +247,7 @@ def merge_master(
         existing: Dict[str, MasterEntry],
         po_entries: List[POEntryData],
         glossary=None,
-        context_rules: Optional[List[dict]] = None
+        context_rules: Optional[RulesLike] = None
 ) -> List[MasterEntry]:
     """Merge existing master CSV with current PO file state.
 
@@ -231,7 +257,7 @@ def merge_master(
         existing: Dictionary of existing master entries (msgid -> MasterEntry)
         po_entries: List of current PO entries from files
         glossary: Optional Glossary instance for scoring
-        context_rules: Optional list of context rules
+        context_rules: Optional list of context rules, or CompiledRules
 
     Returns:
         List of MasterEntry objects sorted by msgid
@@ -239,6 +265,10 @@ def merge_master(
     # Deduplicate current PO entries
     current = deduplicate_entries(po_entries)
 
+    # Compile context rules once rather than per entry
+    if context_rules:
+        context_rules = compile_rules(context_rules)
+
     result = []
 
     # Process all msgids from both existing and current
@@ -271,7 +301,7 @@ def _apply_merge_rules(
         existing: MasterEntry,
         current_po: POEntryData,
         glossary,
-        context_rules: Optional[List[dict]]
+        context_rules: Optional[RulesLike]
 ) -> MasterEntry:
     """Apply status transition rules when entry exists in both master and PO.
 
@@ -374,7 +404,7 @@ def _handle_missing_entry(existing: MasterEntry) -> MasterEntry:
 def _create_new_entry(
         current_po: POEntryData,
         glossary,
-        context_rules: Optional[List[dict]]
+        context_rules: Optional[RulesLike]
 ) -> MasterEntry:
     """Create master entry for new msgid appearing in PO files.
 
@@ -446,24 +476,14 @@ def infer_language(master_csv_path: str, lang_override: Optional[str] = None) ->
     # Remove .csv suffix
     stem = filename[:-4]
 
-    # Try to match language patterns from the end
-    # Language codes can be:
-    # - Simple: de, en, fr (2-3 letters)
-    # - Complex: en-us, pt-br, zh-hans (2-3 letters, hyphen, 2-4 letters)
-    import re
-
-    # Try complex pattern first (e.g., en-us, zh-hans)
-    complex_match = re.search(r'-([a-z]{2,3}-[a-z]{2,4})$', stem)
-    if complex_match:
-        return complex_match.group(1)
-
-    # Try simple pattern (e.g., de, fr)
-    simple_match = re.search(r'-([a-z]{2,3})$', stem)
-    if simple_match:
-        return simple_match.group(1)
+    # Language code from the end of the name; complex codes win over simple
+    # ones because their match starts further left
+    suffix_match = _LANG_SUFFIX_RE.search(stem)
+    if suffix_match:
+        return suffix_match.group(1)
 
     # Special case: the entire filename is just the language code (e.g., de.csv)
-    if re.match(r'^[a-z]{2,3}(-[a-z]{2,4})?$', stem):
+    if _LANG_CODE_RE.fullmatch(stem):
         return stem
 
     raise ValueError(
@@ -473,7 +493,7 @@ def infer_language(master_csv_path: str, lang_override: Optional[str] = None) ->
     )
 
 
-def load_master(path: str) -> Dict[str, MasterEntry]:
+def load_master(path: Union[str, TextIO]) -> Dict[str, MasterEntry]:
     """Load existing master CSV into dictionary with column sovereignty.
 
     POlyglott columns are loaded into MasterEntry fields.
@@ -481,60 +501,89 @@ def load_master(path: str) -> Dict[str, MasterEntry]:
     Missing POlyglott columns are added with empty defaults.
 
     Args:
-        path: Path to master CSV file
+        path: Path to master CSV file, or a text stream to read it from
+            (opened with newline='', as for the csv module)
 
     Returns:
-        Dictionary mapping msgid to MasterEntry
+        Dictionary mapping msgid to MasterEntry (empty if the file doesn't exist)
 
     Raises:
         ValueError: If CSV is malformed or missing msgid column
     """
-    master_path = Path(path)
-
-    if not master_path.exists():
+    is_stream = hasattr(path, 'read')
+    if not is_stream and not Path(path).exists():
         return {}
 
-    entries = {}
-
     try:
-        with open(master_path, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-
-            # Validate that msgid column exists (minimum requirement)
-            if not reader.fieldnames or 'msgid' not in reader.fieldnames:
-                raise ValueError(
-                    f"Master CSV missing required 'msgid' column. "
-                    f"Found columns: {reader.fieldnames}"
-                )
-
-            for row in reader:
-                msgid = row['msgid']
-
-                # Separate POlyglott columns from user columns
-                extra_columns = {}
-                for col_name, col_value in row.items():
-                    if col_name not in POLYGLOTT_COLUMNS:
-                        extra_columns[col_name] = col_value
-
-                # Create entry with POlyglott columns (use empty string for missing)
-                entries[msgid] = MasterEntry(
-                    msgid=msgid,
-                    msgstr=row.get('msgstr', ''),
-                    status=row.get('status', ''),
-                    score=row.get('score', ''),
-                    context=row.get('context', ''),
-                    context_sources=row.get('context_sources', ''),
-                    candidate=row.get('candidate', ''),
-                    extra_columns=extra_columns
-                )
-
+        if is_stream:
+            return _read_master(path)
+        with open(path, 'r', encoding='utf-8-sig', newline='', buffering=_READ_BUFFER_SIZE) as f:
+            return _read_master(f)
     except Exception as e:
         raise ValueError(f"Failed to load master CSV: {e}")
 
+
+def _read_master(f: TextIO) -> Dict[str, MasterEntry]:
+    """Parse master CSV rows from an open text stream.
+
+    Args:
+        f: Stream positioned at the header row
+
+    Returns:
+        Dictionary mapping msgid to MasterEntry
+
+    Raises:
+        ValueError: If the msgid column is missing
+    """
+    entries = {}
+
+    # A stream decoded as plain UTF-8 still starts with the BOM, which would
+    # stop the csv module from seeing the opening quote of the first name
+    header_line = f.readline()
+    if header_line.startswith('\ufeff'):
+        header_line = header_line[1:]
+
+    reader = csv.reader(chain([header_line], f))
+    fieldnames = next(reader, None)
+
+    # Validate that msgid column exists (minimum requirement)
+    if not fieldnames or 'msgid' not in fieldnames:
+        raise ValueError(
+            f"Master CSV missing required 'msgid' column. "
+            f"Found columns: {fieldnames}"
+        )
+
+    # Resolve column positions once instead of building a dict per row.
+    # POLYGLOTT_COLUMNS lists the MasterEntry fields in declaration order;
+    # None marks a POlyglott column missing from this file.
+    index = {name: i for i, name in enumerate(fieldnames)}
+    polyglott_indices = [index.get(col_name) for col_name in POLYGLOTT_COLUMNS]
+    # Separate POlyglott columns from user columns
+    user_indices = [
+        (col_name, i) for i, col_name in enumerate(fieldnames)
+        if col_name not in POLYGLOTT_COLUMNS
+    ]
+    width = len(fieldnames)
+
+    for row in reader:
+        if not row:
+            continue
+        if len(row) < width:
+            row += [''] * (width - len(row))
+
+        # Create entry with POlyglott columns (use empty string for missing)
+        values = [row[i] if i is not None else '' for i in polyglott_indices]
+        # A handful of status values repeat on every row; share one string each
+        values[_STATUS_INDEX] = sys.intern(values[_STATUS_INDEX])
+        entries[values[0]] = MasterEntry(
+            *values,
+            extra_columns={col_name: row[i] for col_name, i in user_indices}
+        )
+
     return entries
 
 
-def save_master(entries: List[MasterEntry], path: str) -> None:
+def save_master(entries: List[MasterEntry], path: Union[str, TextIO]) -> None:
     """Save master entries to CSV file with column sovereignty.
 
     POlyglott columns are written first (in POLYGLOTT_COLUMNS order).
@@ -542,13 +591,9 @@ def save_master(entries: List[MasterEntry], path: str) -> None:
 
     Args:
         entries: List of MasterEntry objects
-        path: Path to output CSV file
+        path: Path to output CSV file, or a text stream to write it to.
+            Files get a UTF-8 BOM; streams receive the CSV text only.
     """
-    master_path = Path(path)
-
-    # Ensure parent directory exists
-    master_path.parent.mkdir(parents=True, exist_ok=True)
-
     # Collect all user column names across all entries (preserve order of first appearance)
     user_columns = []
     seen_cols = set()
@@ -561,25 +606,31 @@ def save_master(entries: List[MasterEntry], path: str) -> None:
     # Build complete fieldnames: POlyglott columns first, then user columns
     fieldnames = POLYGLOTT_COLUMNS + user_columns
 
-    with open(master_path, 'w', encoding='utf-8-sig', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, quoting=csv.QUOTE_ALL)
+    # Rows as tuples in fieldnames order; no per-row dict or key lookups
+    if user_columns:
+        rows = (
+            _polyglott_values(entry)
+            + tuple(entry.extra_columns.get(col_name, '') for col_name in user_columns)
+            for entry in entries
+        )
+    else:
+        rows = map(_polyglott_values, entries)
 
-        writer.writeheader()
+    # Serialize into memory and write the file in one call instead of
+    # issuing a small write per row
+    buffer = io.StringIO(newline='')
+    writer = csv.writer(buffer, quoting=csv.QUOTE_ALL)
+    writer.writerow(fieldnames)
+    writer.writerows(rows)
 
-        for entry in entries:
-            # Start with POlyglott columns
-            row = {
-                'msgid': entry.msgid,
-                'msgstr': entry.msgstr,
-                'status': entry.status,
-                'score': entry.score,
-                'context': entry.context,
-                'context_sources': entry.context_sources,
-                'candidate': entry.candidate,
-            }
-
-            # Add user columns (empty string if entry doesn't have this column)
-            for col_name in user_columns:
-                row[col_name] = entry.extra_columns.get(col_name, '')
-
-            writer.writerow(row)
+    if hasattr(path, 'write'):
+        path.write(buffer.getvalue())
+        return
+
+    master_path = Path(path)
+
+    # Ensure parent directory exists
+    master_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(master_path, 'w', encoding='utf-8-sig', newline='') as f:
+        f.write(buffer.getvalue())
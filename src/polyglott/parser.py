@@ -1,15 +1,28 @@
 """PO file parser using polib."""
 
+import codecs
+import io
+import mmap
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
 
 import polib
 
+_T = TypeVar('_T')
 
-@dataclass
+
+@dataclass(slots=True)
 class POEntryData:
-    """Represents a single PO entry with all metadata."""
+    """Represents a single PO entry with all metadata.
+
+    Slotted: large catalogs hold tens of thousands of these, and skipping
+    the per-instance __dict__ saves memory and speeds attribute access.
+    """
 
     msgid: str
     msgstr: str
@@ -24,7 +37,7 @@ class POEntryData:
     source_file: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class POStatistics:
     """Statistics for a PO file."""
 
@@ -97,8 +110,9 @@ class POParser:
         # Check if this is a plural entry
         is_plural = bool(entry.msgid_plural)
 
-        # Extract common metadata
-        msgctxt = entry.msgctxt or None
+        # Extract common metadata. Contexts repeat across entries (and
+        # files), so they share one interned string per value.
+        msgctxt = sys.intern(entry.msgctxt) if entry.msgctxt else None
         extracted_comments = entry.comment or ""
         translator_comments = entry.tcomment or ""
 
@@ -152,11 +166,21 @@ class POParser:
             POStatistics object with counts
         """
         total = len(self.po)
-        untranslated = len(self.po.untranslated_entries())
-        fuzzy = len(self.po.fuzzy_entries())
+        untranslated = 0
+        fuzzy = 0
+        plurals = 0
 
-        # Count plural entries
-        plurals = sum(1 for entry in self.po if entry.msgid_plural)
+        # One pass, counting like polib's untranslated_entries() and
+        # fuzzy_entries(): obsolete entries only count towards plurals
+        for entry in self.po:
+            if entry.msgid_plural:
+                plurals += 1
+            if entry.obsolete:
+                continue
+            if entry.fuzzy:
+                fuzzy += 1
+            elif not entry.translated():
+                untranslated += 1
 
         return POStatistics(
             total=total,
@@ -166,30 +190,534 @@ class POParser:
         )
 
 
+class POStreamError(ValueError):
+    """Raised when iter_po_entries can't read a file the way polib would.
+
+    This covers syntax errors and non-UTF-8 files. Callers should fall back
+    to POParser, which reports the error (or decodes the file) via polib.
+    """
+
+
+# Streaming parser tables, mirroring polib's _POFileParser state machine.
+# Symbols: tc/gc/oc/fl = translator comment, extracted comment, occurrence,
+# flags; pc/pm/pp = previous msgctxt/msgid/msgid_plural; ct/mi/mp/ms/mx =
+# msgctxt, msgid, msgid_plural, msgstr, msgstr[n]; mc = continuation line.
+_ALL_STATES = frozenset(['st', 'he', 'gc', 'oc', 'fl', 'ct', 'pc', 'pm', 'pp', 'tc', 'ms', 'mp', 'mx', 'mi'])
+_ALLOWED_STATES: Dict[str, frozenset] = {
+    'tc': frozenset(['st', 'he', 'gc', 'oc', 'fl', 'tc', 'pc', 'pm', 'pp', 'ms', 'mp', 'mx', 'mi']),
+    'gc': _ALL_STATES,
+    'oc': _ALL_STATES,
+    'fl': _ALL_STATES,
+    'pc': _ALL_STATES,
+    'pm': _ALL_STATES,
+    'pp': _ALL_STATES,
+    'ct': frozenset(['st', 'he', 'gc', 'oc', 'fl', 'tc', 'pc', 'pm', 'pp', 'ms', 'mx']),
+    'mi': frozenset(['st', 'he', 'gc', 'oc', 'fl', 'ct', 'tc', 'pc', 'pm', 'pp', 'ms', 'mx']),
+    'mp': frozenset(['tc', 'gc', 'pc', 'pm', 'pp', 'mi']),
+    'ms': frozenset(['mi', 'mp', 'tc']),
+    'mx': frozenset(['mi', 'mx', 'mp', 'tc']),
+    'mc': frozenset(['ct', 'mi', 'mp', 'ms', 'mx', 'pm', 'pp', 'pc']),
+}
+# Symbols that don't start a new entry after a msgstr
+_CONTINUES_ENTRY = frozenset(['mp', 'ms', 'mx', 'mc'])
+_KEYWORDS = {'msgctxt': 'ct', 'msgid': 'mi', 'msgstr': 'ms', 'msgid_plural': 'mp'}
+_PREVIOUS_KEYWORDS = {'msgctxt': 'pc', 'msgid': 'pm', 'msgid_plural': 'pp'}
+
+_UNESCAPED_QUOTE_RE = re.compile(r'([^\\]|^)"')
+_ESCAPE_RE = re.compile(r'\\(\\|n|t|r|v|b|f|")')
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'v': '\v', 'b': '\b', 'f': '\f', '\\': '\\', '"': '"'}
+_CHARSET_RE = re.compile(r'"?Content-Type:.+? charset=([\w_\-:\.]+)', re.ASCII)
+
+
+def _unescape(value: str) -> str:
+    """Unescape a PO string literal body (same escapes as polib).
+
+    Args:
+        value: String between the quotes
+
+    Returns:
+        Unescaped string
+    """
+    if '\\' not in value:
+        return value
+    return _ESCAPE_RE.sub(lambda m: _ESCAPES[m.group(1)], value)
+
+
+class _RawEntry:
+    """Fields of one PO entry collected by _POStreamReader."""
+
+    __slots__ = (
+        'msgctxt', 'msgid', 'msgid_plural', 'msgstr', 'msgstr_plural',
+        'comment', 'tcomment', 'references', 'fuzzy', 'obsolete'
+    )
+
+    def __init__(self):
+        self.msgctxt: Optional[str] = None
+        self.msgid = ''
+        self.msgid_plural = ''
+        self.msgstr = ''
+        self.msgstr_plural: Dict[int, str] = {}
+        self.comment = ''
+        self.tcomment = ''
+        self.references: List[str] = []
+        self.fuzzy = False
+        self.obsolete = False
+
+
+class _POStreamReader:
+    """Line-by-line PO state machine that yields _RawEntry objects.
+
+    Follows polib's parser transition for transition, so any file it
+    accepts parses to the same entries. Anything polib would reject
+    raises POStreamError instead.
+    """
+
+    def __init__(self, filepath: str):
+        """Initialize reader state.
+
+        Args:
+            filepath: Path to the PO file (used in error messages)
+        """
+        self.filepath = filepath
+        self.state = 'st'
+        self.entry = _RawEntry()
+        self.line_number = 0
+        self.last_token: Optional[str] = None
+        self.obsolete_line = False
+        self.plural_index = 0
+        self.charset_known = False
+
+    def _error(self, detail: str = '') -> POStreamError:
+        """Build a syntax error for the current line."""
+        return POStreamError(
+            f"Syntax error in po file {self.filepath} (line {self.line_number}){detail}"
+        )
+
+    def feed(self, line: str) -> Optional[_RawEntry]:
+        """Process one line of the file.
+
+        Args:
+            line: Raw line including its newline
+
+        Returns:
+            The entry completed by this line, if any
+
+        Raises:
+            POStreamError: On syntax polib would reject or a non-UTF-8 charset
+        """
+        self.line_number += 1
+        if self.line_number == 1 and line.startswith('\ufeff'):
+            line = line[1:]
+        if not self.charset_known and 'Content-Type:' in line:
+            self._check_charset(line)
+
+        line = line.strip()
+        if not line:
+            return None
+
+        tokens = line.split(None, 2)
+        nb_tokens = len(tokens)
+        self.last_token = tokens[0]
+
+        if tokens[0] == '#~|':
+            return None
+
+        if tokens[0] == '#~' and nb_tokens > 1:
+            line = line[3:].strip()
+            tokens = tokens[1:]
+            nb_tokens -= 1
+            self.obsolete_line = True
+            self.last_token = tokens[0]
+        else:
+            self.obsolete_line = False
+
+        # msgid, msgid_plural, msgctxt and msgstr
+        symbol = _KEYWORDS.get(tokens[0])
+        if symbol is not None and nb_tokens > 1:
+            line = line[len(tokens[0]):].lstrip()
+            if _UNESCAPED_QUOTE_RE.search(line[1:-1]):
+                raise self._error(": unescaped double quote found")
+            return self._process(symbol, line)
+
+        if tokens[0] == '#:':
+            return self._process('oc', line) if nb_tokens > 1 else None
+        if line[:1] == '"':
+            if _UNESCAPED_QUOTE_RE.search(line[1:-1]):
+                raise self._error(": unescaped double quote found")
+            return self._process('mc', line)
+        if line[:7] == 'msgstr[':
+            return self._process('mx', line)
+        if tokens[0] == '#,':
+            return self._process('fl', line) if nb_tokens > 1 else None
+        if tokens[0] == '#' or tokens[0].startswith('##'):
+            return self._process('tc', line + ' ' if line == '#' else line)
+        if tokens[0] == '#.':
+            return self._process('gc', line) if nb_tokens > 1 else None
+        if tokens[0] == '#|':
+            if nb_tokens <= 1:
+                raise self._error()
+            line = line[2:].lstrip()
+            if tokens[1].startswith('"'):
+                return self._process('mc', line)
+            symbol = _PREVIOUS_KEYWORDS.get(tokens[1]) if nb_tokens > 2 else None
+            if symbol is None:
+                raise self._error()
+            return self._process(symbol, line[len(tokens[1]):].lstrip())
+
+        raise self._error()
+
+    def close(self) -> Optional[_RawEntry]:
+        """Finish parsing.
+
+        Returns:
+            The last entry, unless the file ended in comments
+        """
+        if self.last_token is not None and not self.last_token.startswith('#'):
+            return self.entry
+        return None
+
+    def _check_charset(self, line: str) -> None:
+        """Reject files whose header declares a charset other than UTF-8."""
+        match = _CHARSET_RE.search(line)
+        if not match:
+            return
+        try:
+            charset = codecs.lookup(match.group(1).strip()).name
+        except LookupError:
+            # polib ignores unknown charsets and keeps looking
+            return
+        if charset != 'utf-8':
+            raise POStreamError(f"PO file {self.filepath} uses charset {charset}")
+        self.charset_known = True
+
+    def _process(self, symbol: str, token: str) -> Optional[_RawEntry]:
+        """Apply one state machine transition.
+
+        Args:
+            symbol: Line type symbol
+            token: Line content with the keyword/marker prefix removed
+
+        Returns:
+            The previous entry if this line started a new one
+        """
+        if self.state not in _ALLOWED_STATES[symbol]:
+            raise self._error()
+
+        if symbol == 'mc':
+            self._continue(_unescape(token[1:-1]))
+            return None
+
+        if symbol == 'tc' and self.state in ('st', 'he'):
+            # File header comment, not part of any entry
+            self.state = 'he'
+            return None
+
+        completed = None
+        if self.state in ('ms', 'mx') and symbol not in _CONTINUES_ENTRY:
+            completed = self.entry
+            self.entry = _RawEntry()
+
+        entry = self.entry
+        if symbol == 'mi':
+            entry.obsolete = self.obsolete_line
+            entry.msgid = _unescape(token[1:-1])
+        elif symbol == 'ms':
+            entry.msgstr = _unescape(token[1:-1])
+        elif symbol == 'mx':
+            try:
+                index = int(token[7])
+            except (IndexError, ValueError):
+                raise self._error()
+            entry.msgstr_plural[index] = _unescape(token[token.find('"') + 1:-1])
+            self.plural_index = index
+        elif symbol == 'mp':
+            entry.msgid_plural = _unescape(token[1:-1])
+        elif symbol == 'ct':
+            entry.msgctxt = _unescape(token[1:-1])
+        elif symbol == 'oc':
+            for occurrence in token[3:].split():
+                # Same normalization as polib: references without a numeric
+                # line number come out as "path:"
+                _, sep, lineno = occurrence.rpartition(':')
+                entry.references.append(
+                    occurrence if sep and lineno.isdigit() else f"{occurrence}:"
+                )
+        elif symbol == 'fl':
+            if 'fuzzy' in (flag.strip() for flag in token[3:].split(',')):
+                entry.fuzzy = True
+        elif symbol == 'gc':
+            # Like polib, only separate lines once the comment is non-empty
+            if entry.comment:
+                entry.comment += '\n'
+            entry.comment += token[3:]
+        elif symbol == 'tc':
+            tcomment = token.lstrip('#')
+            if entry.tcomment:
+                entry.tcomment += '\n'
+            entry.tcomment += tcomment[1:] if tcomment.startswith(' ') else tcomment
+        # Previous msgctxt/msgid/msgid_plural (pc/pm/pp) only affect state
+
+        self.state = symbol
+        return completed
+
+    def _continue(self, value: str) -> None:
+        """Append a continuation line to the field for the current state."""
+        entry = self.entry
+        if self.state == 'mi':
+            entry.msgid += value
+        elif self.state == 'ms':
+            entry.msgstr += value
+        elif self.state == 'mx':
+            entry.msgstr_plural[self.plural_index] += value
+        elif self.state == 'mp':
+            entry.msgid_plural += value
+        elif self.state == 'ct':
+            entry.msgctxt += value
+
+
+def _raw_to_entries(raw: _RawEntry, source_file: Optional[str]) -> List[POEntryData]:
+    """Convert a streamed entry to POEntryData (one per plural form).
+
+    Args:
+        raw: Entry collected by _POStreamReader
+        source_file: Optional source file name
+
+    Returns:
+        List of POEntryData, matching POParser._process_entry
+    """
+    msgctxt = sys.intern(raw.msgctxt) if raw.msgctxt else None
+    extracted_comments = raw.comment
+    translator_comments = raw.tcomment
+    references = " ".join(raw.references)
+
+    if raw.msgid_plural:
+        return [
+            POEntryData(
+                msgid=raw.msgid_plural,
+                msgstr=msgstr,
+                msgctxt=msgctxt,
+                extracted_comments=extracted_comments,
+                translator_comments=translator_comments,
+                references=references,
+                fuzzy=raw.fuzzy,
+                obsolete=raw.obsolete,
+                is_plural=True,
+                plural_index=idx,
+                source_file=source_file
+            )
+            for idx, msgstr in raw.msgstr_plural.items()
+        ]
+
+    return [POEntryData(
+        msgid=raw.msgid,
+        msgstr=raw.msgstr,
+        msgctxt=msgctxt,
+        extracted_comments=extracted_comments,
+        translator_comments=translator_comments,
+        references=references,
+        fuzzy=raw.fuzzy,
+        obsolete=raw.obsolete,
+        is_plural=False,
+        plural_index=None,
+        source_file=source_file
+    )]
+
+
+def _iter_po_lines(filepath: str) -> Iterator[str]:
+    """Yield the lines of a PO file, read through a read-only memory map.
+
+    Lines are taken from the mapped pages one at a time and decoded as
+    UTF-8, with the same universal-newline handling as reading the file
+    in text mode.
+
+    Args:
+        filepath: Path to the PO file
+
+    Yields:
+        Decoded lines (a leading BOM is kept, as with open())
+
+    Raises:
+        OSError: If the file can't be opened
+        POStreamError: If the file isn't valid UTF-8
+    """
+    with open(filepath, 'rb') as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be mapped
+            return
+
+    with mapped:
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        for chunk in iter(mapped.readline, b''):
+            try:
+                line = chunk.decode('utf-8')
+            except UnicodeDecodeError as e:
+                raise POStreamError(f"PO file {filepath} is not valid UTF-8: {e}") from e
+            if '\r' in line:
+                # '\r\n' and lone '\r' line endings
+                yield from io.StringIO(line, newline=None)
+            else:
+                yield line
+
+
+def _iter_raw_entries(filepath: str) -> Iterator[_RawEntry]:
+    """Yield the raw entries of a PO file in file order, minus the header.
+
+    Args:
+        filepath: Path to the PO file
+
+    Yields:
+        _RawEntry objects, obsolete ones included where they appear
+
+    Raises:
+        OSError: If the file can't be opened
+        POStreamError: If the file has a syntax error or isn't UTF-8
+    """
+    reader = _POStreamReader(str(filepath))
+    header_skipped = False
+
+    def completed_entries() -> Iterator[_RawEntry]:
+        for line in _iter_po_lines(filepath):
+            raw = reader.feed(line)
+            if raw is not None:
+                yield raw
+        raw = reader.close()
+        if raw is not None:
+            yield raw
+
+    for raw in completed_entries():
+        if raw.msgid == '' and not raw.obsolete:
+            # polib moves the msgid "" entry into the file metadata. Which
+            # one it picks when there are several depends on the whole file.
+            if header_skipped:
+                raise POStreamError(f"PO file {filepath} has several entries with an empty msgid")
+            header_skipped = True
+        else:
+            yield raw
+
+
+def iter_po_entries(filepath: str, source_file: Optional[str] = None) -> Iterator[POEntryData]:
+    """Stream entries from a PO file without building a polib.POFile.
+
+    Reads the file line by line and yields the same entries, in the same
+    order, as POParser.parse(): the header entry is skipped and obsolete
+    entries come last. Only the obsolete entries are held in memory.
+
+    Args:
+        filepath: Path to the PO file
+        source_file: Optional source file name for multi-file mode
+
+    Yields:
+        POEntryData objects
+
+    Raises:
+        OSError: If the file can't be opened
+        POStreamError: If the file has a syntax error or isn't UTF-8;
+            entries yielded before the error should be discarded
+    """
+    obsolete = []
+
+    for raw in _iter_raw_entries(filepath):
+        if raw.obsolete:
+            obsolete.append(raw)
+        else:
+            yield from _raw_to_entries(raw, source_file)
+
+    for raw in obsolete:
+        yield from _raw_to_entries(raw, source_file)
+
+
+def iter_po_messages(filepath: str) -> Iterator[Tuple[str, str]]:
+    """Stream (msgid, msgstr) pairs as iterating a polib.POFile gives them.
+
+    Entries come in file order, obsolete ones included, and plural entries
+    keep polib's empty msgstr. Used by export_to_po to plan an export
+    without loading the file into polib.
+
+    Args:
+        filepath: Path to the PO file
+
+    Yields:
+        (msgid, msgstr) tuples
+
+    Raises:
+        OSError: If the file can't be opened
+        POStreamError: If the file has a syntax error or isn't UTF-8
+    """
+    for raw in _iter_raw_entries(filepath):
+        yield raw.msgid, raw.msgstr
+
+
+def _parse_file(filepath: str) -> List[POEntryData]:
+    """Parse a single PO file for MultiPOParser.
+
+    Uses the streaming reader, falling back to polib for files it can't
+    handle. Module-level so it can be pickled for worker processes.
+
+    Args:
+        filepath: Path to the PO file
+
+    Returns:
+        List of POEntryData objects with source_file set to the filename
+    """
+    # Pass the filename (not full path) as source_file
+    source_file = Path(filepath).name
+    try:
+        return list(iter_po_entries(filepath, source_file=source_file))
+    except (POStreamError, OSError):
+        # Let polib decode the file or report the error
+        parser = POParser(filepath)
+        return parser.parse(source_file=source_file)
+
+
+def _file_statistics(filepath: str) -> POStatistics:
+    """Calculate statistics for a single PO file for MultiPOParser.
+
+    Module-level so it can be pickled for worker processes.
+    """
+    return POParser(filepath).get_statistics()
+
+
 class MultiPOParser:
     """Parser for multiple PO files."""
 
-    def __init__(self, filepaths: List[str]):
+    def __init__(self, filepaths: List[str], jobs: int = 1):
         """Initialize parser with multiple PO file paths.
 
         Args:
             filepaths: List of paths to PO files
+            jobs: Number of worker processes for parsing (0 = one per CPU)
         """
         self.filepaths = filepaths
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+
+    def _map_files(self, func: Callable[[str], _T]) -> Iterator[_T]:
+        """Apply func to every file, in a process pool when jobs > 1.
+
+        Results come back in file order either way.
+        """
+        workers = min(self.jobs, len(self.filepaths))
+        if workers > 1:
+            chunksize = max(1, len(self.filepaths) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                yield from executor.map(func, self.filepaths, chunksize=chunksize)
+        else:
+            for filepath in self.filepaths:
+                yield func(filepath)
 
     def parse(self) -> List[POEntryData]:
         """Parse all PO files and combine entries.
 
+        With jobs > 1, files are parsed in a process pool. Entries are
+        still returned in file order, so the result matches a serial parse.
+
         Returns:
             List of POEntryData objects from all files
         """
         all_entries = []
-
-        for filepath in self.filepaths:
-            parser = POParser(filepath)
-            # Pass the filename (not full path) as source_file
-            source_file = Path(filepath).name
-            entries = parser.parse(source_file=source_file)
+        for entries in self._map_files(_parse_file):
             all_entries.extend(entries)
 
         return all_entries
@@ -197,6 +725,8 @@ class MultiPOParser:
     def get_combined_statistics(self) -> POStatistics:
         """Calculate combined statistics across all files.
 
+        With jobs > 1, per-file statistics are computed in a process pool.
+
         Returns:
             POStatistics object with combined counts
         """
@@ -205,9 +735,7 @@ class MultiPOParser:
         fuzzy = 0
         plurals = 0
 
-        for filepath in self.filepaths:
-            parser = POParser(filepath)
-            stats = parser.get_statistics()
+        for stats in self._map_files(_file_statistics):
             total += stats.total
             untranslated += stats.untranslated
             fuzzy += stats.fuzzy
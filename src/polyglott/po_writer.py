@@ -1,15 +1,19 @@
 """Write master CSV translations back to PO files."""
 
+import os
+import stat
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, Iterable, List, Set, Tuple
 
 import polib
 
 from polyglott.master import MasterEntry
+from polyglott.parser import POStreamError, iter_po_messages
 
 
-@dataclass
+@dataclass(slots=True)
 class ExportResult:
     """Result of exporting master CSV to PO files."""
 
@@ -19,42 +23,83 @@ class ExportResult:
     details: List[str]  # Per-entry detail messages (for verbose mode)
 
 
-def export_to_po(
-        master_entries: List[MasterEntry],
+def _save_po(po: polib.POFile, po_path: str) -> bool:
+    """Save a PO file atomically, skipping the write if nothing changed.
+
+    Serializes the file the way po.save() would and compares the bytes with
+    the file on disk. A changed file is written to a temporary file next to
+    the real file (symlinks are resolved) and moved into place, so readers
+    never see a partial file. The original mode and, where permitted, owner
+    are kept. Files with several hard links are written in place instead,
+    since replacing them would split them from their other links.
+
+    Args:
+        po: PO file to save
+        po_path: Path to write
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    # po.save() writes in text mode with universal newlines
+    data = str(po).replace('\n', os.linesep).encode(po.encoding)
+
+    path = Path(os.path.realpath(po_path))
+    try:
+        if path.read_bytes() == data:
+            return False
+        st = path.stat()
+    except FileNotFoundError:
+        st = None
+
+    if st is not None and st.st_nlink > 1:
+        path.write_bytes(data)
+        return True
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        if st is not None:
+            os.chmod(tmp_name, stat.S_IMODE(st.st_mode))
+            try:
+                os.chown(tmp_name, st.st_uid, st.st_gid)
+            except (AttributeError, PermissionError):
+                # No os.chown on Windows; only root may give files away
+                pass
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+    return True
+
+
+def _plan_export(
+        messages: Iterable[Tuple[str, str]],
+        master_lookup: Dict[str, MasterEntry],
         po_path: str,
         statuses: Set[str],
-        dry_run: bool = False,
-        verbose: bool = False
-) -> ExportResult:
-    """Export master CSV translations to a PO file.
+        verbose: bool
+) -> Tuple[ExportResult, List[int]]:
+    """Decide what exporting the master would do to each PO entry.
 
     Args:
-        master_entries: List of master entries
-        po_path: Path to PO file to update
-        statuses: Set of statuses to export (e.g., {'accepted', 'machine'})
-        dry_run: If True, don't modify files
+        messages: (msgid, msgstr) pairs in polib iteration order
+        master_lookup: Master entries by msgid
+        po_path: Path to the PO file (for detail messages)
+        statuses: Set of statuses to export
         verbose: If True, generate per-entry detail messages
 
     Returns:
-        ExportResult with statistics and optional details
+        Tuple of (ExportResult, positions of the entries to update)
     """
-    # Load PO file
-    po = polib.pofile(po_path)
-
-    # Build master lookup: msgid -> MasterEntry
-    master_lookup: Dict[str, MasterEntry] = {
-        entry.msgid: entry for entry in master_entries
-    }
-
     writes = 0
     overwrites = 0
     skips = 0
     details = []
+    updates = []
 
-    # Process each PO entry
-    for po_entry in po:
-        msgid = po_entry.msgid
-
+    for position, (msgid, msgstr) in enumerate(messages):
         # Skip if not in master
         if msgid not in master_lookup:
             if verbose:
@@ -80,23 +125,129 @@ def export_to_po(
             skips += 1
             continue
 
-        # Determine action: write, overwrite, or skip
-        if not po_entry.msgstr:
-            action = "write"
-        elif po_entry.msgstr != master_entry.msgstr:
-            action = "overwrite"
-        else:
-            action = "skip"  # PO already matches master
-
-        # Skip if already matches (no need to write)
-        if action == "skip":
+        # Skip if PO already matches master (no need to write)
+        if msgstr == master_entry.msgstr:
             skips += 1
             if verbose:
                 details.append(f"SKIP     {po_path}: \"{msgid}\" — already matches master")
             continue
 
+        updates.append(position)
+
+        # Record action: write or overwrite
+        if msgstr:
+            overwrites += 1
+            if verbose:
+                details.append(
+                    f"OVERWRITE {po_path}: \"{msgid}\" — \"{msgstr}\" → \"{master_entry.msgstr}\""
+                )
+        else:
+            writes += 1
+            if verbose:
+                details.append(
+                    f"WRITE    {po_path}: \"{msgid}\" → \"{master_entry.msgstr}\""
+                )
+
+    result = ExportResult(
+        writes=writes,
+        overwrites=overwrites,
+        skips=skips,
+        details=details
+    )
+    return result, updates
+
+
+def export_to_po(
+        master_entries: List[MasterEntry],
+        po_path: str,
+        statuses: Set[str],
+        dry_run: bool = False,
+        verbose: bool = False
+) -> ExportResult:
+    """Export master CSV translations to a PO file.
+
+    The PO file is first scanned with the streaming reader. Dry runs and
+    exports that change nothing return from there without loading the file
+    into polib, and the file is left untouched. Otherwise, or if the
+    streaming reader can't handle the file, polib applies the updates.
+
+    Args:
+        master_entries: List of master entries
+        po_path: Path to PO file to update
+        statuses: Set of statuses to export (e.g., {'accepted', 'machine'})
+        dry_run: If True, don't modify files
+        verbose: If True, generate per-entry detail messages
+
+    Returns:
+        ExportResult with statistics and optional details
+    """
+    return export_to_po_batch(master_entries, [po_path], statuses, dry_run, verbose)[0]
+
+
+def export_to_po_batch(
+        master_entries: List[MasterEntry],
+        po_paths: List[str],
+        statuses: Set[str],
+        dry_run: bool = False,
+        verbose: bool = False
+) -> List[ExportResult]:
+    """Export master CSV translations to several PO files.
+
+    Same as calling export_to_po for each file, but the master lookup is
+    built once for all of them.
+
+    Args:
+        master_entries: List of master entries
+        po_paths: Paths to PO files to update
+        statuses: Set of statuses to export (e.g., {'accepted', 'machine'})
+        dry_run: If True, don't modify files
+        verbose: If True, generate per-entry detail messages
+
+    Returns:
+        One ExportResult per PO file, in po_paths order
+    """
+    # Build master lookup: msgid -> MasterEntry
+    master_lookup: Dict[str, MasterEntry] = {
+        entry.msgid: entry for entry in master_entries
+    }
+
+    return [
+        _export_file(master_lookup, po_path, statuses, dry_run, verbose)
+        for po_path in po_paths
+    ]
+
+
+def _export_file(
+        master_lookup: Dict[str, MasterEntry],
+        po_path: str,
+        statuses: Set[str],
+        dry_run: bool,
+        verbose: bool
+) -> ExportResult:
+    """Export master translations to one PO file (see export_to_po)."""
+    # Fast path: plan from the streaming reader
+    try:
+        result, updates = _plan_export(
+            iter_po_messages(po_path), master_lookup, po_path, statuses, verbose
+        )
+    except (OSError, POStreamError):
+        pass  # Let polib load the file (or report the error)
+    else:
+        if dry_run or not updates:
+            return result
+
+    # Load PO file
+    po = polib.pofile(po_path)
+    result, updates = _plan_export(
+        ((po_entry.msgid, po_entry.msgstr) for po_entry in po),
+        master_lookup, po_path, statuses, verbose
+    )
+
+    for position in updates:
+        po_entry = po[position]
+        master_entry = master_lookup[po_entry.msgid]
+
         # Update msgstr
-        old_msgstr = po_entry.msgstr
         po_entry.msgstr = master_entry.msgstr
 
         # Handle fuzzy flag based on status
@@ -110,27 +261,8 @@ def export_to_po(
                 po_entry.flags.append('fuzzy')
         # For 'review' status: leave fuzzy flag unchanged
 
-        # Record action
-        if action == "overwrite":
-            overwrites += 1
-            if verbose:
-                details.append(
-                    f"OVERWRITE {po_path}: \"{msgid}\" — \"{old_msgstr}\" → \"{master_entry.msgstr}\""
-                )
-        else:  # action == "write"
-            writes += 1
-            if verbose:
-                details.append(
-                    f"WRITE    {po_path}: \"{msgid}\" → \"{master_entry.msgstr}\""
-                )
-
     # Save PO file (unless dry run)
     if not dry_run:
-        po.save(po_path)
+        _save_po(po, po_path)
 
-    return ExportResult(
-        writes=writes,
-        overwrites=overwrites,
-        skips=skips,
-        details=details
-    )
+    return result
@@ -16,13 +16,18 @@ Key features:
 
 Translation Pipeline:
     msgid → pre-filter → decode entities → split multiline
-      → [for each line: tokenize → DeepL API → restore → normalize spacing]
+      → [for each line: tokenize] → DeepL API (one request)
+      → [for each line: restore → normalize spacing]
       → rejoin multiline → re-encode entities → msgstr
 """
 
 import html
 import re
-from typing import Protocol, Dict, List, Optional, Tuple
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Protocol, Dict, List, Optional, Tuple, Union
 
 try:
     import deepl
@@ -33,6 +38,28 @@ except ImportError:
 # Regex patterns for placeholder detection
 PERCENT_FMT = re.compile(r'%\([^)]+\)[sdif]')  # %(name)s, %(count)d, etc.
 BRACE_FMT = re.compile(r'\{[^}]+\}')  # {name}, {count}, etc.
+PLACEHOLDER_FMT = re.compile(f'{PERCENT_FMT.pattern}|{BRACE_FMT.pattern}')  # Either kind
+
+# <x id="N">placeholder</x> wrappers added by tokenize()
+XML_TAG = re.compile(r'<x id="\d+">([^<]+)</x>')
+XML_TAG_SPLIT = re.compile(r'(<x id="\d+">[^<]+</x>)')  # Keeps tags when splitting
+
+# Request options for Strategy C: XML tag handling, with the content of
+# <x> tags left untouched
+DEEPL_TAG_OPTIONS = MappingProxyType({'tag_handling': 'xml', 'ignore_tags': 'x'})
+
+# Spacing fix-ups applied by normalize_spacing()
+WHITESPACE_RUN = re.compile(r'\s+')
+SPACE_BEFORE_PUNCT = re.compile(r'\s+([.,!?;:])')
+
+# Named, decimal and hex character references, for protect_entities()
+ENTITY_REF = re.compile(r'&[a-zA-Z]+;|&#\d+;|&#x[0-9a-fA-F]+;')
+
+# Passthrough detection for is_passthrough(): known tokens (compared
+# uppercased), and text made only of punctuation, whitespace and placeholders
+PASSTHROUGH_TOKENS = frozenset({'OK', 'N/A', '—', '–', '-', '...', '…'})
+PASSTHROUGH_TOKEN_MAX_LEN = max(len(token) for token in PASSTHROUGH_TOKENS)
+PASSTHROUGH_ONLY = re.compile(rf'(?:[.,!?;:\-–—…\s]|{PLACEHOLDER_FMT.pattern})*')
 
 
 class TranslationError(Exception):
@@ -106,24 +133,20 @@ def tokenize(text: str) -> Tuple[str, List[str]]:
         ('Hello <x id="0">%(name)s</x>!', ['%(name)s'])
     """
     placeholders = []
-    placeholder_map = {}  # Map placeholder to its ID
-
-    # Find all unique placeholders and assign IDs
-    for pattern in [PERCENT_FMT, BRACE_FMT]:
-        for match in pattern.finditer(text):
-            placeholder = match.group(0)
-            if placeholder not in placeholder_map:
-                placeholder_id = len(placeholders)
-                placeholder_map[placeholder] = placeholder_id
-                placeholders.append(placeholder)
-
-    # Replace all occurrences with XML tags
-    wrapped = text
-    for placeholder, placeholder_id in placeholder_map.items():
-        wrapped = wrapped.replace(
-            placeholder,
-            f'<x id="{placeholder_id}">{placeholder}</x>'
-        )
+    tags = {}  # Map placeholder to its <x> tag
+
+    def wrap(match: re.Match) -> str:
+        # IDs follow first appearance; repeats reuse the same tag
+        placeholder = match.group(0)
+        tag = tags.get(placeholder)
+        if tag is None:
+            tag = f'<x id="{len(placeholders)}">{placeholder}</x>'
+            tags[placeholder] = tag
+            placeholders.append(placeholder)
+        return tag
+
+    # Find and wrap all placeholders in one pass
+    wrapped = PLACEHOLDER_FMT.sub(wrap, text)
 
     return wrapped, placeholders
 
@@ -144,9 +167,12 @@ def restore(text: str) -> str:
         >>> restore('Hello <x id="0">%(name)s</x>!')
         'Hello %(name)s!'
     """
+    # Most translated lines carry no placeholders
+    if '<x id="' not in text:
+        return text
+
     # Match <x id="N">content</x> and replace with just content
-    pattern = re.compile(r'<x id="\d+">([^<]+)</x>')
-    return pattern.sub(r'\1', text)
+    return XML_TAG.sub(r'\1', text)
 
 
 def escape_xml_text(text: str) -> str:
@@ -168,8 +194,7 @@ def escape_xml_text(text: str) -> str:
         'Save <x id="0">%(name)s</x> &amp; continue'
     """
     # Split on <x id="N">...</x> tags to isolate non-tag portions
-    tag_pattern = re.compile(r'(<x id="\d+">[^<]+</x>)')
-    parts = tag_pattern.split(text)
+    parts = XML_TAG_SPLIT.split(text)
 
     # Escape XML-unsafe chars in non-tag parts only (odd indices are tags)
     escaped_parts = []
@@ -231,10 +256,10 @@ def normalize_spacing(text: str) -> str:
         'Hello %(name)s!'
     """
     # First collapse all multiple spaces to single space
-    text = re.sub(r'\s+', ' ', text)
+    text = WHITESPACE_RUN.sub(' ', text)
 
     # Remove spaces before punctuation (whether after placeholder or not)
-    text = re.sub(r'\s+([.,!?;:])', r'\1', text)
+    text = SPACE_BEFORE_PUNCT.sub(r'\1', text)
 
     return text.strip()
 
@@ -265,28 +290,19 @@ def is_passthrough(text: str) -> bool:
     """
     text = text.strip()
 
-    # Empty or whitespace
-    if not text:
-        return True
-
-    # Common non-translatable tokens
-    if text.upper() in {'OK', 'N/A', '—', '–', '-', '...', '…'}:
-        return True
-
-    # Punctuation only
-    if re.match(r'^[.,!?;:\-–—…\s]+$', text):
+    # Common non-translatable tokens (uppercasing never shortens a string,
+    # so longer text can't match)
+    if len(text) <= PASSTHROUGH_TOKEN_MAX_LEN and text.upper() in PASSTHROUGH_TOKENS:
         return True
 
-    # Remove all placeholders and check if anything remains
-    remaining = PERCENT_FMT.sub('', text)
-    remaining = BRACE_FMT.sub('', remaining)
-    remaining = remaining.strip()
-
-    # If only whitespace/punctuation remains, it's placeholder-only
-    if not remaining or re.match(r'^[.,!?;:\-–—…\s]+$', remaining):
-        return True
+    # Translatable text usually starts with a letter or digit, which neither
+    # punctuation nor a placeholder can
+    if text and text[0].isalnum():
+        return False
 
-    return False
+    # Empty, punctuation only, or placeholders with nothing but
+    # whitespace/punctuation around them
+    return PASSTHROUGH_ONLY.fullmatch(text) is not None
 
 
 def protect_entities(text: str) -> Tuple[str, Dict[str, str]]:
@@ -306,11 +322,14 @@ def protect_entities(text: str) -> Tuple[str, Dict[str, str]]:
         >>> protect_entities("Save &amp; close")
         ('Save & close', {'&': '&amp;'})
     """
+    # Every entity starts with '&'; most strings have none
+    if '&' not in text:
+        return text, {}
+
     entities = {}
 
     # Find all entities in original text
-    entity_pattern = re.compile(r'&[a-zA-Z]+;|&#\d+;|&#x[0-9a-fA-F]+;')
-    for match in entity_pattern.finditer(text):
+    for match in ENTITY_REF.finditer(text):
         entity = match.group(0)
         decoded = html.unescape(entity)
         if entity != decoded:  # Only track actual entities
@@ -337,6 +356,15 @@ def restore_entities(text: str, entities: Dict[str, str]) -> str:
         >>> restore_entities("Save & close", {'&': '&amp;'})
         'Save &amp; close'
     """
+    if not entities:
+        return text
+
+    # Entities almost always decode to a single character. Then one
+    # str.translate() pass re-encodes them all, and no replacement can be
+    # re-encoded by a later one.
+    if all(len(decoded) == 1 for decoded in entities):
+        return text.translate(str.maketrans(entities))
+
     # Sort to ensure '&' is replaced FIRST to avoid double-encoding
     # We need to replace '&' → '&amp;' before replacing '<' → '&lt;',
     # otherwise we'd replace the '&' in '&lt;' giving '&amp;lt;'
@@ -370,20 +398,56 @@ def translate_multiline(
     Returns:
         List of translated lines
     """
-    translated_lines = []
+    def batch_func(texts, *args):
+        return [translator_func(text, *args) for text in texts]
 
-    for line in lines:
-        if not line.strip():
-            # Preserve empty lines
-            translated_lines.append(line)
-        else:
-            # Translate non-empty line
-            translated = translator_func(line, source_lang, target_lang, context)
-            translated_lines.append(translated)
+    return translate_multiline_batch(lines, batch_func, source_lang, target_lang, context)
+
+
+def translate_multiline_batch(
+    lines: List[str],
+    batch_func,
+    source_lang: str,
+    target_lang: str,
+    context: Optional[str] = None
+) -> List[str]:
+    """
+    Translate multiline text with one call for all non-empty lines.
+
+    Like translate_multiline(), but batch_func receives every non-empty line
+    at once (e.g., to send them in a single API request) and returns the
+    translations in the same order. Empty lines are preserved.
+
+    Args:
+        lines: List of lines to translate
+        batch_func: Function that translates a list of lines
+        source_lang: Source language code
+        target_lang: Target language code
+        context: Optional context hint
+
+    Returns:
+        List of translated lines
+    """
+    positions = [i for i, line in enumerate(lines) if line.strip()]
+    if not positions:
+        return list(lines)
+
+    translated_lines = list(lines)
+    translated = batch_func([lines[i] for i in positions], source_lang, target_lang, context)
+    for i, text in zip(positions, translated):
+        translated_lines[i] = text
 
     return translated_lines
 
 
+# Default mappings for ambiguous codes (prefer US English, European Portuguese)
+LANGUAGE_DEFAULTS = {
+    'en': 'en-US',
+    'pt': 'pt-PT',
+}
+TARGET_LANG_DEFAULTS = {code.upper(): variant.upper() for code, variant in LANGUAGE_DEFAULTS.items()}
+
+
 def map_language_code(code: str) -> str:
     """
     DEPRECATED: Use map_source_lang() or map_target_lang() instead.
@@ -406,13 +470,7 @@ def map_language_code(code: str) -> str:
         >>> map_language_code("de")
         'de'
     """
-    # Default mappings for ambiguous codes (prefer US English, European Portuguese)
-    mappings = {
-        'en': 'en-US',
-        'pt': 'pt-PT',
-    }
-
-    return mappings.get(code.lower(), code)
+    return LANGUAGE_DEFAULTS.get(code.lower(), code)
 
 
 def map_source_lang(code: str) -> str:
@@ -472,13 +530,7 @@ def map_target_lang(code: str) -> str:
     # Base code without regional variant
     base_code = code.upper()
 
-    # Default mappings for ambiguous codes (prefer US English, European Portuguese)
-    mappings = {
-        'EN': 'EN-US',
-        'PT': 'PT-PT',
-    }
-
-    return mappings.get(base_code, base_code)
+    return TARGET_LANG_DEFAULTS.get(base_code, base_code)
 
 
 class DeepLBackend:
@@ -495,18 +547,31 @@ class DeepLBackend:
     - HTML entity handling
     - Multiline translation
     - Passthrough detection
+    - Bounded cache of recent translations
     - Graceful error handling
     """
 
-    def __init__(self, auth_key: str):
+    # Number of translate_entry() results kept for repeated requests
+    cache_size = 4096
+
+    # DeepL accepts at most this many texts in one translate request
+    max_texts_per_request = 50
+
+    def __init__(self, auth_key: str, eager_validate: bool = False):
         """
         Initialize DeepL backend.
 
+        The auth key is checked with a usage request before the first API
+        call, or right away with eager_validate=True. Lazy validation saves a
+        round trip for backends that never make a request.
+
         Args:
             auth_key: DeepL API authentication key
+            eager_validate: If True, check the auth key now (fail fast)
 
         Raises:
-            TranslationError: If deepl package not installed or auth key invalid
+            TranslationError: If deepl package not installed, or (with
+                eager_validate) auth key invalid
         """
         if deepl is None:
             raise TranslationError(
@@ -516,16 +581,41 @@ class DeepLBackend:
         self.translator = deepl.Translator(auth_key)
         self.glossary_id: Optional[str] = None
 
-        # Validate auth key by checking usage (fail fast)
-        try:
-            self.translator.get_usage()
-        except deepl.AuthorizationException:
-            raise TranslationError(
-                "Invalid DeepL API key. Get your key at https://www.deepl.com/pro-api\n"
-                "Or set environment variable: export DEEPL_AUTH_KEY=your-key-here"
-            )
-        except Exception as e:
-            raise TranslationError(f"Failed to initialize DeepL API: {e}")
+        # (msgid, source_lang, target_lang, context) -> translation, oldest first
+        self._cache: OrderedDict[Tuple[str, str, str, Optional[str]], str] = OrderedDict()
+        self._cache_lock = threading.Lock()  # translate_entries_bulk() uses threads
+        self._cache_generation = 0  # Bumped by _clear_cache()
+
+        self._validated = False
+        self._validate_lock = threading.Lock()
+        if eager_validate:
+            self._validate()
+
+    def _validate(self) -> None:
+        """
+        Check the auth key by requesting usage, once per backend.
+
+        Raises:
+            TranslationError: If auth key invalid or the API is unreachable
+        """
+        if self._validated:
+            return
+
+        with self._validate_lock:
+            if self._validated:
+                return
+
+            try:
+                self.translator.get_usage()
+            except deepl.AuthorizationException:
+                raise TranslationError(
+                    "Invalid DeepL API key. Get your key at https://www.deepl.com/pro-api\n"
+                    "Or set environment variable: export DEEPL_AUTH_KEY=your-key-here"
+                )
+            except Exception as e:
+                raise TranslationError(f"Failed to initialize DeepL API: {e}")
+
+            self._validated = True
 
     def translate_entry(
         self,
@@ -539,13 +629,16 @@ class DeepLBackend:
         Translate a single entry with full pipeline protection.
 
         Pipeline:
-            1. Pre-filter: Check passthrough conditions
+            1. Pre-filter: Check passthrough conditions, then the cache
             2. Decode HTML entities
             3. Split multiline
-            4. For each line: tokenize → DeepL API → restore → normalize spacing
+            4. Tokenize each line → DeepL API (one request) → restore → normalize spacing
             5. Rejoin multiline
             6. Re-encode HTML entities
 
+        Results are cached per (msgid, languages, context) until the
+        glossary changes; the oldest entries are dropped past cache_size.
+
         Args:
             msgid: Source text to translate
             source_lang: Source language code
@@ -563,15 +656,24 @@ class DeepLBackend:
         if is_passthrough(msgid):
             return msgid
 
+        # Repeated request: reuse the earlier translation
+        key = (msgid, source_lang, target_lang, context)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+            generation = self._cache_generation
+
         # Decode HTML entities
         decoded, entities = protect_entities(msgid)
 
-        # Handle multiline
+        # Handle multiline: translate all non-empty lines in one request
         if '\n' in decoded:
             lines = decoded.split('\n')
-            translated_lines = translate_multiline(
+            translated_lines = translate_multiline_batch(
                 lines,
-                self._translate_single_line,
+                self._translate_lines,
                 source_lang,
                 target_lang,
                 context
@@ -583,8 +685,63 @@ class DeepLBackend:
         # Re-encode HTML entities
         result = restore_entities(result, entities)
 
+        with self._cache_lock:
+            # Skip results from before a glossary change cleared the cache
+            if generation == self._cache_generation:
+                self._cache[key] = result
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
         return result
 
+    def translate_entries_bulk(
+        self,
+        msgids: List[str],
+        source_lang: str,
+        target_lang: str,
+        contexts: Optional[List[Optional[str]]] = None,
+        max_workers: int = 8
+    ) -> List[Union[str, TranslationError]]:
+        """
+        Translate many entries with several requests in flight at once.
+
+        Translation is bound by HTTP latency, so entries are sent from a
+        thread pool. Identical (msgid, context) pairs are translated once.
+        A failed entry doesn't stop the others: its TranslationError is
+        returned in its place.
+
+        Args:
+            msgids: Source texts to translate
+            source_lang: Source language code
+            target_lang: Target language code
+            contexts: Optional context hint per msgid (same length as msgids)
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            Translation or TranslationError per msgid, in input order
+        """
+        if contexts is None:
+            contexts = [None] * len(msgids)
+
+        def translate(key: Tuple[str, Optional[str]]) -> Union[str, TranslationError]:
+            msgid, context = key
+            try:
+                return self.translate_entry(msgid, source_lang, target_lang, context)
+            except TranslationError as e:
+                return e
+
+        keys = list(zip(msgids, contexts))
+        unique_keys = list(dict.fromkeys(keys))
+
+        workers = min(max_workers, len(unique_keys))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = dict(zip(unique_keys, executor.map(translate, unique_keys)))
+        else:
+            results = {key: translate(key) for key in unique_keys}
+
+        return [results[key] for key in keys]
+
     def _translate_single_line(
         self,
         text: str,
@@ -607,12 +764,93 @@ class DeepLBackend:
         Raises:
             TranslationError: If API call fails
         """
-        # Tokenize: wrap placeholders in XML tags
-        wrapped, placeholders = tokenize(text)
+        result = self._call_api(self._prepare(text), source_lang, target_lang, context)
+        return self._finish(result.text)
+
+    def _translate_lines(
+        self,
+        lines: List[str],
+        source_lang: str,
+        target_lang: str,
+        context: Optional[str] = None
+    ) -> List[str]:
+        """
+        Translate several lines with placeholder protection in list requests.
+
+        Lines are sent max_texts_per_request at a time. Each line is still
+        translated on its own: DeepL translates every text of a list request
+        separately and returns results in the same order.
+
+        Args:
+            lines: Lines to translate (no newlines)
+            source_lang: Source language code
+            target_lang: Target language code
+            context: Optional context hint
+
+        Returns:
+            Translated lines with placeholders preserved, in input order
+
+        Raises:
+            TranslationError: If API call fails
+        """
+        translated = []
+        for start in range(0, len(lines), self.max_texts_per_request):
+            batch = lines[start:start + self.max_texts_per_request]
+            results = self._call_api(
+                [self._prepare(line) for line in batch], source_lang, target_lang, context
+            )
+            translated.extend(self._finish(result.text) for result in results)
+        return translated
+
+    @staticmethod
+    def _prepare(text: str) -> str:
+        """Wrap placeholders in XML tags and escape the rest for DeepL."""
+        # Tokenize: wrap placeholders in XML tags. Every placeholder starts
+        # with '%' or '{', so plain sentences skip the regex.
+        if '%' in text or '{' in text:
+            wrapped, placeholders = tokenize(text)
+        else:
+            wrapped = text
 
         # Escape XML-unsafe characters (&, <, >) outside tags
         # This ensures valid XML for DeepL's tag_handling="xml"
-        escaped = escape_xml_text(wrapped)
+        return escape_xml_text(wrapped)
+
+    @staticmethod
+    def _finish(translated: str) -> str:
+        """Turn DeepL's XML output back into plain text with placeholders."""
+        # Unescape XML entities before removing tags
+        unescaped = unescape_xml_text(translated)
+
+        # Restore: remove XML tag wrappers
+        restored = restore(unescaped)
+
+        # Normalize spacing around placeholders
+        return normalize_spacing(restored)
+
+    def _call_api(
+        self,
+        text: Union[str, List[str]],
+        source_lang: str,
+        target_lang: str,
+        context: Optional[str] = None
+    ):
+        """
+        Send prepared text (one string or a list) to DeepL.
+
+        Args:
+            text: XML-prepared text, or a list of them
+            source_lang: Source language code
+            target_lang: Target language code
+            context: Optional context hint
+
+        Returns:
+            A deepl TextResult for a string, a list of them for a list
+
+        Raises:
+            TranslationError: If API call fails
+        """
+        self._validate()
 
         # Map language codes to DeepL format
         # Source language: base code only (EN, not EN-US)
@@ -620,14 +858,8 @@ class DeepLBackend:
         source_lang = map_source_lang(source_lang)
         target_lang = map_target_lang(target_lang)
 
-        # Build API parameters
-        kwargs = {
-            'text': escaped,
-            'source_lang': source_lang,
-            'target_lang': target_lang,
-            'tag_handling': 'xml',
-            'ignore_tags': 'x',  # Strategy C: ignore content inside <x> tags
-        }
+        # Optional API parameters
+        kwargs = {}
 
         # Add context if available
         if context:
@@ -639,8 +871,13 @@ class DeepLBackend:
 
         # Call DeepL API
         try:
-            result = self.translator.translate_text(**kwargs)
-            translated = result.text
+            return self.translator.translate_text(
+                text=text,
+                source_lang=source_lang,
+                target_lang=target_lang,
+                **DEEPL_TAG_OPTIONS,
+                **kwargs
+            )
         except deepl.QuotaExceededException:
             raise TranslationError(
                 "DeepL API quota exceeded. Check your usage at https://www.deepl.com/pro-account/usage"
@@ -648,17 +885,6 @@ class DeepLBackend:
         except Exception as e:
             raise TranslationError(f"DeepL API error: {e}")
 
-        # Unescape XML entities before removing tags
-        unescaped = unescape_xml_text(translated)
-
-        # Restore: remove XML tag wrappers
-        restored = restore(unescaped)
-
-        # Normalize spacing around placeholders
-        normalized = normalize_spacing(restored)
-
-        return normalized
-
     def estimate_characters(self, entries: List[str]) -> int:
         """
         Estimate total character count for translation cost calculation.
@@ -669,11 +895,7 @@ class DeepLBackend:
         Returns:
             Total character count (excluding passthrough entries)
         """
-        total = 0
-        for entry in entries:
-            if not is_passthrough(entry):
-                total += len(entry)
-        return total
+        return sum(len(entry) for entry in entries if not is_passthrough(entry))
 
     def create_glossary(
         self,
@@ -695,6 +917,9 @@ class DeepLBackend:
             target_lang: Target language code
             name: Glossary name (default: polyglott_ephemeral)
 
+        Raises:
+            TranslationError: If the auth key hasn't been validated yet and is invalid
+
         Note:
             Failures are logged but don't stop translation (graceful degradation).
             Glossary creation requires specific language pair support in DeepL.
@@ -702,6 +927,8 @@ class DeepLBackend:
         if not terms:
             return  # No terms, skip glossary creation
 
+        self._validate()
+
         try:
             # Map language codes to DeepL format
             # Source language: base code only (EN, not EN-US)
@@ -717,6 +944,7 @@ class DeepLBackend:
                 entries=terms
             )
             self.glossary_id = glossary.glossary_id
+            self._clear_cache()  # Earlier translations didn't use the glossary
 
         except Exception as e:
             # Graceful degradation: warn but continue without glossary
@@ -742,3 +970,10 @@ class DeepLBackend:
                 pass
             finally:
                 self.glossary_id = None
+                self._clear_cache()  # Translations made with the glossary
+
+    def _clear_cache(self) -> None:
+        """Drop cached translations, including ones still being translated."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_generation += 1
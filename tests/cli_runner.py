@@ -0,0 +1,43 @@
+"""In-process runner for the polyglott CLI, shared by the CLI tests.
+
+Run as a script, it reads a JSON list of argv lists from stdin, runs each
+one in this interpreter and writes the results to stdout as JSON.
+"""
+
+import contextlib
+import io
+import json
+import subprocess
+import sys
+from typing import List
+
+from polyglott.cli import main
+
+
+def run_cli(argv: List[str]) -> subprocess.CompletedProcess:
+    """Run the polyglott CLI in-process, capturing its output.
+
+    Avoids interpreter startup per call. The result mirrors what
+    subprocess.run(..., capture_output=True, text=True) would return.
+
+    Args:
+        argv: Arguments after the program name (e.g., ["import", ...])
+
+    Returns:
+        CompletedProcess with returncode, stdout and stderr
+    """
+    out, err = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            code = main(argv)
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else int(e.code is not None)
+    return subprocess.CompletedProcess(argv, code, out.getvalue(), err.getvalue())
+
+
+if __name__ == "__main__":
+    results = [
+        {"returncode": r.returncode, "stdout": r.stdout, "stderr": r.stderr}
+        for r in map(run_cli, json.load(sys.stdin))
+    ]
+    json.dump(results, sys.stdout)
@@ -0,0 +1,183 @@
+"""Shared pytest configuration for the POlyglott test suite."""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pytest
+
+from polyglott.linter import Glossary
+from polyglott.parser import POEntryData, POParser
+
+# POEntryData fields that tests rarely care about
+_ENTRY_DEFAULTS = dict(
+    msgctxt=None,
+    extracted_comments="",
+    translator_comments="",
+    references="",
+    fuzzy=False,
+    obsolete=False,
+    is_plural=False,
+    plural_index=None,
+    source_file=None,
+)
+
+
+def pytest_configure(config):
+    """Register markers used by the suite.
+
+    xdist_group is defined by pytest-xdist; registering it here keeps runs
+    without xdist free of unknown-marker warnings. With xdist, run
+    ``pytest -n auto --dist loadgroup`` so tests sharing a group (and the
+    same fixture files) land on one worker. Session fixtures are built once
+    per worker, so shared read-only data stays safe under xdist. slow marks
+    subprocess-driven tests. benchmark marks performance tests, which are
+    skipped unless selected with ``pytest -m benchmark``.
+    """
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): run tests with the same group name on one xdist worker"
+    )
+    config.addinivalue_line(
+        "markers",
+        "slow: runs the CLI in a subprocess; deselect with -m 'not slow'"
+    )
+    config.addinivalue_line(
+        "markers",
+        "benchmark: performance test, run only with -m benchmark; "
+        "timed when pytest-benchmark is installed"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmark tests unless the -m expression asks for them."""
+    if "benchmark" in (config.getoption("markexpr") or ""):
+        return
+
+    skip = pytest.mark.skip(reason="benchmark test; run with -m benchmark")
+    for item in items:
+        if item.get_closest_marker("benchmark"):
+            item.add_marker(skip)
+
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    @pytest.fixture
+    def benchmark():
+        """Stand-in for pytest-benchmark's fixture when it isn't installed.
+
+        Calls the function once and returns its result, so benchmark tests
+        still check correctness without the timing machinery.
+        """
+        def _run(func, *args, **kwargs):
+            return func(*args, **kwargs)
+
+        return _run
+
+
+def _ramdisk_root() -> Optional[Path]:
+    """Find a RAM-backed directory for temporary test output.
+
+    POLYGLOTT_TEST_TMPDIR overrides the detection (e.g., to point CI at its
+    own tmpfs mount). Otherwise /dev/shm is used when it is writable.
+
+    Returns:
+        Directory path, or None if no RAM-backed location is available
+    """
+    override = os.environ.get("POLYGLOTT_TEST_TMPDIR")
+    if override:
+        return Path(override)
+
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        return shm
+
+    return None
+
+
+@pytest.fixture(scope="session", autouse=True)
+def ramdisk_tempdir():
+    """Redirect tempfile output to a RAM-backed directory for the session.
+
+    CLI tests write their CSV and PO output through NamedTemporaryFile and
+    TemporaryDirectory. Keeping those files on tmpfs avoids disk write-back
+    on CI runners. Each session (and each xdist worker) gets its own subdir.
+    """
+    root = _ramdisk_root()
+    if root is None:
+        yield None
+        return
+
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    session_dir = tempfile.mkdtemp(prefix=f"polyglott-tests-{os.getpid()}-{worker}-", dir=root)
+
+    original = tempfile.tempdir
+    tempfile.tempdir = session_dir
+    try:
+        yield Path(session_dir)
+    finally:
+        tempfile.tempdir = original
+        shutil.rmtree(session_dir, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def make_entry():
+    """Factory for POEntryData with defaults for everything but msgid/msgstr.
+
+    Usage: make_entry(msgid="Hello", msgstr="Hallo", fuzzy=True)
+    """
+    def _make_entry(msgid: str = "", msgstr: str = "", **fields) -> POEntryData:
+        return POEntryData(msgid=msgid, msgstr=msgstr, **{**_ENTRY_DEFAULTS, **fields})
+
+    return _make_entry
+
+
+@pytest.fixture(scope="module")
+def bulk_entries(make_entry):
+    """10,000 synthetic entries, built once per module.
+
+    Gives the exporter a realistic workload without paying the
+    construction cost in every test. Tests must not mutate the list.
+    """
+    return [make_entry(msgid=f"k{i}", msgstr=f"v{i}") for i in range(10_000)]
+
+
+@pytest.fixture(scope="session")
+def make_glossary():
+    """Factory for Glossary objects, cached by YAML text for the session.
+
+    Tests only read glossaries, so identical YAML can share one instance
+    instead of being parsed again.
+
+    Usage: make_glossary("language: de\\nterms:\\n  file: Datei\\n")
+    """
+    cache: Dict[str, Glossary] = {}
+
+    def _make_glossary(yaml_text: str) -> Glossary:
+        if yaml_text not in cache:
+            cache[yaml_text] = Glossary.from_string(yaml_text)
+        return cache[yaml_text]
+
+    return _make_glossary
+
+
+@pytest.fixture(scope="session")
+def parsed_po():
+    """Parse PO fixture files with POParser, once per session.
+
+    Callers must treat the returned list as read-only.
+
+    Usage: entries = parsed_po(FIXTURES_DIR / "complex.po")
+    """
+    memo: Dict[Path, List[POEntryData]] = {}
+
+    def _parsed_po(path) -> List[POEntryData]:
+        key = Path(path).resolve()
+        if key not in memo:
+            memo[key] = POParser(path).parse()
+        return memo[key]
+
+    return _parsed_po
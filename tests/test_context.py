@@ -4,6 +4,8 @@ import pytest
 from pathlib import Path
 
 from polyglott.context import (
+    CompiledRules,
+    compile_rules,
     load_context_rules,
     load_preset,
     match_context,
@@ -12,6 +14,68 @@ from polyglott.context import (
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
+# Rule sets for TestMatchContext, compiled once for the whole module
+FORMS_RULE = {'pattern': 'forms.py', 'context': 'form_label'}
+MODELS_RULE = {'pattern': 'models.py', 'context': 'field_label'}
+VIEWS_RULE = {'pattern': 'views.py', 'context': 'message'}
+
+RULE_SETS = {
+    'forms': CompiledRules([FORMS_RULE]),
+    'forms_models': CompiledRules([FORMS_RULE, MODELS_RULE]),
+    'forms_models_views': CompiledRules([FORMS_RULE, MODELS_RULE, VIEWS_RULE]),
+    'app_then_forms': CompiledRules([{'pattern': 'app/', 'context': 'generic'}, FORMS_RULE]),
+    'forms_dir': CompiledRules([{'pattern': 'forms/', 'context': 'form_label'}]),
+    'empty': CompiledRules([]),
+}
+
+# (rule set, references, expected context, expected context_sources)
+MATCH_CASES = [
+    pytest.param('forms_models', 'myapp/forms.py:10', 'form_label', '',
+                 id='single_reference_matches_first_rule'),
+    pytest.param('forms_models', 'myapp/models.py:25', 'field_label', '',
+                 id='single_reference_matches_second_rule'),
+    pytest.param('forms', 'myapp/unknown.py:10', '', '',
+                 id='no_rule_matches'),
+    # 'app/' matches first, so should return 'generic'
+    pytest.param('app_then_forms', 'myapp/forms.py:10', 'generic', '',
+                 id='rule_order_matters'),
+    pytest.param('forms', 'myapp/forms.py:12345', 'form_label', '',
+                 id='line_number_stripped'),
+    # Unanimous, so sources is empty
+    pytest.param('forms', 'myapp/forms.py:10 myapp/forms.py:20', 'form_label', '',
+                 id='multiple_references_same_context'),
+    # 2 form_label, 1 field_label -> form_label wins
+    pytest.param('forms_models', 'myapp/forms.py:10 myapp/forms.py:20 myapp/models.py:30', 'form_label',
+                 'myapp/forms.py=form_label;myapp/models.py=field_label',
+                 id='multiple_references_clear_majority'),
+    # 1 form_label, 1 field_label -> tie
+    pytest.param('forms_models', 'myapp/forms.py:10 myapp/models.py:30', 'ambiguous',
+                 'myapp/forms.py=form_label;myapp/models.py=field_label',
+                 id='multiple_references_tie'),
+    pytest.param('forms_models_views', 'forms.py:1 models.py:2 views.py:3', 'ambiguous',
+                 'forms.py=form_label;models.py=field_label;views.py=message',
+                 id='multiple_references_three_way_tie'),
+    # Only matched references count
+    pytest.param('forms', 'myapp/forms.py:10 myapp/unknown.py:20', 'form_label', '',
+                 id='mixed_matched_and_unmatched'),
+    pytest.param('forms', '', '', '',
+                 id='empty_references'),
+    pytest.param('forms', '   ', '', '',
+                 id='whitespace_only_references'),
+    pytest.param('empty', 'myapp/forms.py:10', '', '',
+                 id='empty_rules_list'),
+    # Semicolon-separated filepath=context pairs
+    pytest.param('forms_models', 'app/forms.py:10 app/models.py:20', 'ambiguous',
+                 'app/forms.py=form_label;app/models.py=field_label',
+                 id='context_sources_format'),
+    # Pattern matching is substring-based
+    pytest.param('forms_dir', 'myapp/forms/user_forms.py:10', 'form_label', '',
+                 id='substring_matching'),
+    # Filepaths may contain colons; only the right-most one is stripped
+    pytest.param('forms', 'path:with:colons/forms.py:10', 'form_label', '',
+                 id='multiple_colons_in_reference'),
+]
+
 
 class TestLoadContextRules:
     """Test suite for load_context_rules function."""
@@ -55,6 +119,24 @@ class TestLoadContextRules:
             load_context_rules(FIXTURES_DIR / "context_missing_context.yaml")
         assert "context" in str(exc_info.value)
 
+    def test_edited_file_is_reloaded(self, tmp_path):
+        """Test that the load cache picks up changes to the rules file."""
+        rules_file = tmp_path / "rules.yaml"
+        rules_file.write_text("rules:\n  - pattern: a.py\n    context: first\n")
+        assert load_context_rules(rules_file)[0]["context"] == "first"
+
+        rules_file.write_text("rules:\n  - pattern: a.py\n    context: second_one\n")
+        assert load_context_rules(rules_file)[0]["context"] == "second_one"
+
+    def test_returned_rules_are_independent_copies(self):
+        """Test that mutating loaded rules doesn't affect later loads."""
+        rules = load_context_rules(FIXTURES_DIR / "context_rules.yaml")
+        rules[0]["context"] = "mutated"
+        rules.clear()
+
+        reloaded = load_context_rules(FIXTURES_DIR / "context_rules.yaml")
+        assert reloaded[0] == {"pattern": "tables.py", "context": "column_header"}
+
 
 class TestLoadPreset:
     """Test suite for load_preset function."""
@@ -85,202 +167,51 @@ class TestLoadPreset:
         assert isinstance(PRESETS['django'], list)
 
 
-class TestMatchContext:
-    """Test suite for match_context function."""
-
-    def test_single_reference_matches_first_rule(self):
-        """Test reference matches first rule."""
-        rules = [
-            {'pattern': 'forms.py', 'context': 'form_label'},
-            {'pattern': 'models.py', 'context': 'field_label'},
-        ]
-        context, sources = match_context('myapp/forms.py:10', rules)
-
-        assert context == 'form_label'
-        assert sources == ''
-
-    def test_single_reference_matches_second_rule(self):
-        """Test reference matches second rule when first doesn't match."""
-        rules = [
-            {'pattern': 'forms.py', 'context': 'form_label'},
-            {'pattern': 'models.py', 'context': 'field_label'},
-        ]
-        context, sources = match_context('myapp/models.py:25', rules)
-
-        assert context == 'field_label'
-        assert sources == ''
+class TestCompiledRules:
+    """Test suite for compiled context rules."""
 
-    def test_no_rule_matches(self):
-        """Test no rule matches returns empty context."""
-        rules = [
+    def test_first_rule_wins_regardless_of_position(self):
+        """Test rule order decides, not where the pattern occurs in the path."""
+        compiled = CompiledRules([
             {'pattern': 'forms.py', 'context': 'form_label'},
-        ]
-        context, sources = match_context('myapp/unknown.py:10', rules)
-
-        assert context == ''
-        assert sources == ''
-
-    def test_rule_order_matters(self):
-        """Test rule order matters - first match wins."""
-        rules = [
             {'pattern': 'app/', 'context': 'generic'},
-            {'pattern': 'forms.py', 'context': 'form_label'},
-        ]
-        # 'app/' matches first, so should return 'generic'
-        context, sources = match_context('myapp/forms.py:10', rules)
+        ])
 
-        assert context == 'generic'
-        assert sources == ''
+        assert compiled.match('myapp/forms.py') == 'form_label'
+        assert compiled.match('myapp/views.py') == 'generic'
+        assert compiled.match('other/views.py') == ''
 
-    def test_line_number_stripped(self):
-        """Test line number is correctly stripped from reference."""
-        rules = [
-            {'pattern': 'forms.py', 'context': 'form_label'},
-        ]
-        context, sources = match_context('myapp/forms.py:12345', rules)
+    def test_patterns_are_literal(self):
+        """Test regex metacharacters in patterns are matched literally."""
+        compiled = CompiledRules([{'pattern': 'a.b', 'context': 'dotted'}])
 
-        assert context == 'form_label'
-        assert sources == ''
+        assert compiled.match('x/a.b/y.py') == 'dotted'
+        assert compiled.match('x/axb/y.py') == ''
 
-    def test_multiple_references_same_context(self):
-        """Test all references match same context."""
-        rules = [
-            {'pattern': 'forms.py', 'context': 'form_label'},
-        ]
-        context, sources = match_context('myapp/forms.py:10 myapp/forms.py:20', rules)
+    def test_compile_rules_is_cached(self):
+        """Test identical rule lists share one compiled instance."""
+        rules = [{'pattern': 'forms.py', 'context': 'form_label'}]
+        compiled = compile_rules(rules)
 
-        assert context == 'form_label'
-        assert sources == ''  # Unanimous, so sources is empty
+        assert compile_rules(list(rules)) is compiled
+        assert compile_rules(compiled) is compiled
+        assert len(compiled) == 1
 
-    def test_multiple_references_clear_majority(self):
-        """Test clear majority context wins."""
-        rules = [
-            {'pattern': 'forms.py', 'context': 'form_label'},
-            {'pattern': 'models.py', 'context': 'field_label'},
-        ]
-        # 2 form_label, 1 field_label -> form_label wins
-        context, sources = match_context(
-            'myapp/forms.py:10 myapp/forms.py:20 myapp/models.py:30',
-            rules
-        )
-
-        assert context == 'form_label'
-        assert sources != ''  # Should be populated
-        assert 'myapp/forms.py=form_label' in sources
-        assert 'myapp/models.py=field_label' in sources
-
-    def test_multiple_references_tie(self):
-        """Test tie results in 'ambiguous'."""
-        rules = [
-            {'pattern': 'forms.py', 'context': 'form_label'},
-            {'pattern': 'models.py', 'context': 'field_label'},
-        ]
-        # 1 form_label, 1 field_label -> tie
-        context, sources = match_context(
-            'myapp/forms.py:10 myapp/models.py:30',
-            rules
-        )
-
-        assert context == 'ambiguous'
-        assert sources != ''
-        assert 'myapp/forms.py=form_label' in sources
-        assert 'myapp/models.py=field_label' in sources
-
-    def test_multiple_references_three_way_tie(self):
-        """Test three-way tie results in 'ambiguous'."""
-        rules = [
-            {'pattern': 'forms.py', 'context': 'form_label'},
-            {'pattern': 'models.py', 'context': 'field_label'},
-            {'pattern': 'views.py', 'context': 'message'},
-        ]
-        # 1 of each -> three-way tie
-        context, sources = match_context(
-            'forms.py:1 models.py:2 views.py:3',
-            rules
-        )
-
-        assert context == 'ambiguous'
-        assert sources != ''
-
-    def test_mixed_matched_and_unmatched(self):
-        """Test mix of matched and unmatched references."""
-        rules = [
-            {'pattern': 'forms.py', 'context': 'form_label'},
-        ]
-        # Only forms.py matches, unknown.py doesn't
-        context, sources = match_context(
-            'myapp/forms.py:10 myapp/unknown.py:20',
-            rules
-        )
-
-        # Only matched reference counts
-        assert context == 'form_label'
-        assert sources == ''  # Only one matched context
-
-    def test_empty_references(self):
-        """Test entry with no references."""
-        rules = [
-            {'pattern': 'forms.py', 'context': 'form_label'},
-        ]
-        context, sources = match_context('', rules)
 
-        assert context == ''
-        assert sources == ''
-
-    def test_whitespace_only_references(self):
-        """Test entry with whitespace-only references."""
-        rules = [
-            {'pattern': 'forms.py', 'context': 'form_label'},
-        ]
-        context, sources = match_context('   ', rules)
-
-        assert context == ''
-        assert sources == ''
-
-    def test_empty_rules_list(self):
-        """Test empty rules list returns empty context."""
-        context, sources = match_context('myapp/forms.py:10', [])
+class TestMatchContext:
+    """Test suite for match_context function."""
 
-        assert context == ''
-        assert sources == ''
+    @pytest.mark.parametrize("rule_set, references, expected_context, expected_sources", MATCH_CASES)
+    def test_match_context(self, rule_set, references, expected_context, expected_sources):
+        """Test context and context_sources for each reference pattern."""
+        context, sources = match_context(references, RULE_SETS[rule_set])
 
-    def test_context_sources_format(self):
-        """Test context_sources format is correct."""
-        rules = [
-            {'pattern': 'forms.py', 'context': 'form_label'},
-            {'pattern': 'models.py', 'context': 'field_label'},
-        ]
-        context, sources = match_context(
-            'app/forms.py:10 app/models.py:20',
-            rules
-        )
-
-        # Should be semicolon-separated filepath=context pairs
-        assert ';' in sources
-        parts = sources.split(';')
-        assert len(parts) == 2
-        assert 'app/forms.py=form_label' in parts
-        assert 'app/models.py=field_label' in parts
-
-    def test_substring_matching(self):
-        """Test that pattern matching is substring-based."""
-        rules = [
-            {'pattern': 'forms/', 'context': 'form_label'},
-        ]
-        # Should match any path containing 'forms/'
-        context, sources = match_context('myapp/forms/user_forms.py:10', rules)
-
-        assert context == 'form_label'
-        assert sources == ''
+        assert context == expected_context
+        assert sources == expected_sources
 
-    def test_multiple_colons_in_reference(self):
-        """Test handling of file paths with colons."""
-        rules = [
-            {'pattern': 'forms.py', 'context': 'form_label'},
-        ]
-        # Edge case: what if filepath itself contains colons?
-        # We strip from the RIGHT-most colon
-        context, sources = match_context('path:with:colons/forms.py:10', rules)
+    def test_plain_rule_list(self):
+        """Test that a list of rule dicts works without compiling first."""
+        context, sources = match_context('myapp/models.py:25', [FORMS_RULE, MODELS_RULE])
 
-        assert context == 'form_label'
+        assert context == 'field_label'
         assert sources == ''
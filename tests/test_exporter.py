@@ -2,237 +2,183 @@
 
 import csv
 import io
-import sys
-from pathlib import Path
-from tempfile import NamedTemporaryFile
+import os
 
 import pytest
 
-from polyglott.parser import POEntryData
 from polyglott.exporter import export_to_csv
 from polyglott.linter import Severity, Violation
 
+SINGLE_FILE_COLUMNS = [
+    "msgid", "msgstr", "msgctxt",
+    "extracted_comments", "translator_comments", "references",
+    "fuzzy", "obsolete", "is_plural", "plural_index"
+]
+
 
 class TestExporter:
     """Test suite for CSV exporter."""
 
-    def test_export_single_file_schema(self):
-        """Test CSV schema for single-file mode."""
+    @pytest.mark.parametrize("multi_file, expected_columns", [
+        pytest.param(False, SINGLE_FILE_COLUMNS, id="single_file"),
+        pytest.param(True, ["source_file"] + SINGLE_FILE_COLUMNS, id="multi_file"),
+    ])
+    def test_export_schema(self, make_entry, multi_file, expected_columns):
+        """Test CSV schema for single-file and multi-file mode."""
         entries = [
-            POEntryData(
+            make_entry(
                 msgid="Hello",
                 msgstr="Hallo",
-                msgctxt=None,
                 extracted_comments="Test comment",
-                translator_comments="",
                 references="main.py:10",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file=None
+                source_file="test.po"
             )
         ]
 
         output = io.StringIO()
-        # Redirect stdout temporarily
-        old_stdout = sys.stdout
-        sys.stdout = output
-        export_to_csv(entries)
-        sys.stdout = old_stdout
+        export_to_csv(entries, multi_file=multi_file, stream=output)
 
         # Parse CSV output
-        output.seek(0)
-        reader = csv.DictReader(output)
+        content = output.getvalue()
+        reader = csv.reader(io.StringIO(content))
+        header = next(reader)
         rows = list(reader)
 
-        # Check schema
-        expected_columns = [
-            "msgid", "msgstr", "msgctxt",
-            "extracted_comments", "translator_comments", "references",
-            "fuzzy", "obsolete", "is_plural", "plural_index"
-        ]
-        assert list(rows[0].keys()) == expected_columns
+        # Check schema (source_file comes first in multi-file mode)
+        assert header == expected_columns
 
         # Check data
-        assert rows[0]["msgid"] == "Hello"
-        assert rows[0]["msgstr"] == "Hallo"
-        assert rows[0]["fuzzy"] == "False"
-
-    def test_export_multi_file_schema(self):
-        """Test CSV schema for multi-file mode."""
-        entries = [
-            POEntryData(
-                msgid="Hello",
-                msgstr="Hallo",
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file="test.po"
-            )
-        ]
-
-        output = io.StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        export_to_csv(entries, multi_file=True)
-        sys.stdout = old_stdout
-
-        output.seek(0)
-        reader = csv.DictReader(output)
-        rows = list(reader)
-
-        # Check that source_file is first column
-        columns = list(rows[0].keys())
-        assert columns[0] == "source_file"
-        assert rows[0]["source_file"] == "test.po"
-
-    def test_export_unicode_content(self):
+        row = rows[0]
+        assert row[header.index("msgid")] == "Hello"
+        assert row[header.index("msgstr")] == "Hallo"
+        assert row[header.index("fuzzy")] == "False"
+        if multi_file:
+            assert row[0] == "test.po"
+
+    def test_export_unicode_content(self, make_entry):
         """Test handling of Unicode characters in CSV."""
         entries = [
-            POEntryData(
-                msgid="German",
-                msgstr="Äpfel, Öfen, Straße",
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-            ),
-            POEntryData(
-                msgid="Emoji",
-                msgstr="🎉 🚀 ❤️",
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-            )
+            make_entry(msgid="German", msgstr="Äpfel, Öfen, Straße"),
+            make_entry(msgid="Emoji", msgstr="🎉 🚀 ❤️")
         ]
 
         output = io.StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        export_to_csv(entries)
-        sys.stdout = old_stdout
+        export_to_csv(entries, stream=output)
 
-        output.seek(0)
-        reader = csv.DictReader(output)
-        rows = list(reader)
+        content = output.getvalue()
+        rows = list(csv.DictReader(io.StringIO(content)))
 
         # Check Unicode is preserved
         assert rows[0]["msgstr"] == "Äpfel, Öfen, Straße"
         assert rows[1]["msgstr"] == "🎉 🚀 ❤️"
 
-    def test_export_csv_escaping(self):
+    def test_export_csv_escaping(self, make_entry):
         """Test CSV escaping of special characters."""
         entries = [
-            POEntryData(
+            make_entry(
                 msgid='Test "quotes" and commas, here',
-                msgstr='Result with "quotes", commas, and\nnewlines',
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
+                msgstr='Result with "quotes", commas, and\nnewlines'
             )
         ]
 
         output = io.StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        export_to_csv(entries)
-        sys.stdout = old_stdout
+        export_to_csv(entries, stream=output)
 
-        output.seek(0)
-        reader = csv.DictReader(output)
-        rows = list(reader)
+        content = output.getvalue()
+        rows = list(csv.DictReader(io.StringIO(content)))
 
         # CSV reader should handle escaping automatically
         assert 'quotes' in rows[0]["msgid"]
         assert 'commas' in rows[0]["msgid"]
         assert 'newlines' in rows[0]["msgstr"]
 
-    def test_export_sorting(self):
+    @pytest.mark.parametrize("sort_by, expected_msgids", [
+        ("msgid", ["Apple", "Mango", "Zebra"]),
+        ("msgstr", ["Zebra", "Mango", "Apple"]),
+    ])
+    def test_export_sorting(self, make_entry, sort_by, expected_msgids):
         """Test sorting by different fields."""
         entries = [
-            POEntryData("Zebra", "Z", None, "", "", "", False, False, False, None),
-            POEntryData("Apple", "A", None, "", "", "", False, False, False, None),
-            POEntryData("Mango", "M", None, "", "", "", False, False, False, None),
+            make_entry(msgid="Zebra", msgstr="A"),
+            make_entry(msgid="Apple", msgstr="Z"),
+            make_entry(msgid="Mango", msgstr="M"),
         ]
 
         output = io.StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        export_to_csv(entries, sort_by="msgid")
-        sys.stdout = old_stdout
+        export_to_csv(entries, sort_by=sort_by, stream=output)
 
-        output.seek(0)
-        reader = csv.DictReader(output)
-        rows = list(reader)
+        content = output.getvalue()
+        reader = csv.reader(io.StringIO(content))
+        msgid_idx = next(reader).index("msgid")
 
         # Check sorting
-        assert rows[0]["msgid"] == "Apple"
-        assert rows[1]["msgid"] == "Mango"
-        assert rows[2]["msgid"] == "Zebra"
+        assert [row[msgid_idx] for row in reader] == expected_msgids
 
-    def test_export_to_file(self):
+    def test_export_bulk_sorted(self, bulk_entries):
+        """Test sorting a large entry list writes every row in msgid order."""
+        output = io.StringIO()
+        export_to_csv(bulk_entries, sort_by="msgid", stream=output)
+
+        content = output.getvalue()
+        assert content.count("\n") == len(bulk_entries) + 1
+
+        msgids = [row[0] for row in csv.reader(io.StringIO(content))][1:]
+        assert msgids == sorted(entry.msgid for entry in bulk_entries)
+
+    @pytest.mark.benchmark(group="csv-export")
+    def test_export_csv_throughput(self, benchmark, make_entry, tmp_path):
+        """Test exporting a million rows to a file."""
+        entries = [make_entry(msgid=f"k{i}", msgstr=f"v{i}") for i in range(1_000_000)]
+        output_file = tmp_path / "big.csv"
+
+        benchmark(export_to_csv, entries, output_file=str(output_file))
+
+        assert output_file.read_bytes().count(b"\n") == len(entries) + 1
+
+    def test_export_to_file(self, make_entry, tmp_path):
         """Test exporting to a file."""
         entries = [
-            POEntryData("Hello", "Hallo", None, "", "", "", False, False, False, None),
+            make_entry(msgid="Hello", msgstr="Hallo"),
         ]
+        output_file = tmp_path / "test.csv"
 
-        with NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as f:
-            output_file = f.name
-
-        try:
-            export_to_csv(entries, output_file=output_file)
+        export_to_csv(entries, output_file=str(output_file))
 
-            # Read back and verify
-            with open(output_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                rows = list(reader)
-
-            assert len(rows) == 1
-            assert rows[0]["msgid"] == "Hello"
-            assert rows[0]["msgstr"] == "Hallo"
-        finally:
-            Path(output_file).unlink()
+        # Compare raw bytes: also pins encoding, BOM and line terminators
+        expected = os.linesep.join([
+            ",".join(SINGLE_FILE_COLUMNS),
+            "Hello,Hallo,,,,,False,False,False,",
+            "",
+        ])
+        assert output_file.read_bytes() == expected.encode("utf-8")
 
     def test_export_empty_dataframe(self):
         """Test exporting empty entry list."""
         output = io.StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        export_to_csv([])
-        sys.stdout = old_stdout
-
-        output.seek(0)
-        content = output.read()
+        export_to_csv([], stream=output)
 
         # Should have headers but no data rows
-        lines = content.strip().split('\n')
-        assert len(lines) == 1  # Header only
-        assert "msgid" in lines[0]
+        content = output.getvalue()
+        assert content.count("\n") == 1  # Header only
+        assert content.rstrip("\r\n").split(",") == SINGLE_FILE_COLUMNS
+
+    def test_export_defaults_to_stdout(self, make_entry, capsys):
+        """Test that output goes to stdout when no file or stream is given."""
+        entries = [
+            make_entry(msgid="Hello", msgstr="Hallo"),
+        ]
+
+        export_to_csv(entries)
+
+        content = capsys.readouterr().out
+        rows = list(csv.DictReader(io.StringIO(content)))
+        assert len(rows) == 1
+        assert rows[0]["msgstr"] == "Hallo"
 
-    def test_invalid_sort_field(self):
+    def test_invalid_sort_field(self, make_entry):
         """Test error handling for invalid sort field."""
         entries = [
-            POEntryData("Test", "Test", None, "", "", "", False, False, False, None),
+            make_entry(msgid="Test", msgstr="Test"),
         ]
 
         with pytest.raises(ValueError, match="Invalid sort field"):
@@ -242,21 +188,13 @@ class TestExporter:
 class TestLintMode:
     """Test suite for lint mode CSV export."""
 
-    def test_lint_mode_schema(self):
-        """Test CSV schema for lint mode."""
-        entry = POEntryData(
-            msgid="Test",
-            msgstr="",
-            msgctxt=None,
-            extracted_comments="",
-            translator_comments="",
-            references="file.py:10",
-            fuzzy=False,
-            obsolete=False,
-            is_plural=False,
-            plural_index=None,
-            source_file=None
-        )
+    @pytest.mark.parametrize("multi_file, first_column", [
+        pytest.param(False, "msgid", id="single_file"),
+        pytest.param(True, "source_file", id="multi_file"),
+    ])
+    def test_lint_mode_schema(self, make_entry, multi_file, first_column):
+        """Test CSV schema for lint mode, with and without multi-file."""
+        entry = make_entry(msgid="Test", msgstr="", references="file.py:10", source_file="test.po")
 
         violation = Violation(
             entry=entry,
@@ -266,17 +204,14 @@ class TestLintMode:
         )
 
         output = io.StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        export_to_csv([], lint_mode=True, violations=[violation])
-        sys.stdout = old_stdout
+        export_to_csv([], lint_mode=True, violations=[violation], multi_file=multi_file, stream=output)
 
-        output.seek(0)
-        reader = csv.DictReader(output)
-        rows = list(reader)
+        content = output.getvalue()
+        rows = list(csv.DictReader(io.StringIO(content)))
 
         # Check schema includes lint columns
         columns = list(rows[0].keys())
+        assert columns[0] == first_column
         assert "severity" in columns
         assert "check" in columns
         assert "message" in columns
@@ -286,74 +221,14 @@ class TestLintMode:
         assert rows[0]["severity"] == "error"
         assert rows[0]["check"] == "untranslated"
         assert rows[0]["message"] == "Entry is not translated"
+        if multi_file:
+            assert rows[0]["source_file"] == "test.po"
 
-    def test_lint_mode_multi_file_schema(self):
-        """Test CSV schema for lint mode with multi-file."""
-        entry = POEntryData(
-            msgid="Test",
-            msgstr="",
-            msgctxt=None,
-            extracted_comments="",
-            translator_comments="",
-            references="",
-            fuzzy=False,
-            obsolete=False,
-            is_plural=False,
-            plural_index=None,
-            source_file="test.po"
-        )
-
-        violation = Violation(
-            entry=entry,
-            severity=Severity.WARNING,
-            check_name="fuzzy",
-            message="Entry is marked as fuzzy"
-        )
-
-        output = io.StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        export_to_csv([], lint_mode=True, violations=[violation], multi_file=True)
-        sys.stdout = old_stdout
-
-        output.seek(0)
-        reader = csv.DictReader(output)
-        rows = list(reader)
-
-        # Check source_file is first column
-        columns = list(rows[0].keys())
-        assert columns[0] == "source_file"
-        assert rows[0]["source_file"] == "test.po"
-
-    def test_lint_mode_multiple_violations(self):
+    def test_lint_mode_multiple_violations(self, make_entry):
         """Test lint mode with multiple violations."""
-        entry1 = POEntryData(
-            msgid="Test1",
-            msgstr="",
-            msgctxt=None,
-            extracted_comments="",
-            translator_comments="",
-            references="",
-            fuzzy=False,
-            obsolete=False,
-            is_plural=False,
-            plural_index=None,
-            source_file=None
-        )
+        entry1 = make_entry(msgid="Test1", msgstr="")
 
-        entry2 = POEntryData(
-            msgid="Test2",
-            msgstr="Test",
-            msgctxt=None,
-            extracted_comments="",
-            translator_comments="",
-            references="",
-            fuzzy=True,
-            obsolete=False,
-            is_plural=False,
-            plural_index=None,
-            source_file=None
-        )
+        entry2 = make_entry(msgid="Test2", msgstr="Test", fuzzy=True)
 
         violations = [
             Violation(entry1, Severity.ERROR, "untranslated", "Entry is not translated"),
@@ -361,76 +236,46 @@ class TestLintMode:
         ]
 
         output = io.StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        export_to_csv([], lint_mode=True, violations=violations)
-        sys.stdout = old_stdout
+        export_to_csv([], lint_mode=True, violations=violations, stream=output)
 
-        output.seek(0)
-        reader = csv.DictReader(output)
+        content = output.getvalue()
+        reader = csv.reader(io.StringIO(content))
+        severity_idx = next(reader).index("severity")
         rows = list(reader)
 
         # Should have two rows (one per violation)
-        assert len(rows) == 2
-        assert rows[0]["severity"] == "error"
-        assert rows[1]["severity"] == "warning"
+        assert [row[severity_idx] for row in rows] == ["error", "warning"]
 
     def test_lint_mode_empty_violations(self):
         """Test lint mode with no violations."""
         output = io.StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        export_to_csv([], lint_mode=True, violations=[])
-        sys.stdout = old_stdout
-
-        output.seek(0)
-        content = output.read()
+        export_to_csv([], lint_mode=True, violations=[], stream=output)
 
         # Should have headers but no data rows
-        lines = content.strip().split('\n')
-        assert len(lines) == 1  # Header only
-        assert "severity" in lines[0]
-        assert "check" in lines[0]
-        assert "message" in lines[0]
+        content = output.getvalue()
+        assert content.count("\n") == 1  # Header only
+        assert content.rstrip("\r\n").split(",")[-3:] == ["severity", "check", "message"]
 
     def test_lint_mode_without_violations_raises_error(self):
         """Test that lint mode requires violations parameter."""
         with pytest.raises(ValueError, match="violations required"):
             export_to_csv([], lint_mode=True)
 
-    def test_lint_mode_all_severity_levels(self):
-        """Test lint mode with all severity levels."""
-        entry = POEntryData(
-            msgid="Test",
-            msgstr="",
-            msgctxt=None,
-            extracted_comments="",
-            translator_comments="",
-            references="",
-            fuzzy=False,
-            obsolete=False,
-            is_plural=False,
-            plural_index=None,
-            source_file=None
-        )
-
-        violations = [
-            Violation(entry, Severity.ERROR, "error_check", "Error"),
-            Violation(entry, Severity.WARNING, "warning_check", "Warning"),
-            Violation(entry, Severity.INFO, "info_check", "Info"),
-        ]
+    @pytest.mark.parametrize("severity, label", [
+        (Severity.ERROR, "error"),
+        (Severity.WARNING, "warning"),
+        (Severity.INFO, "info"),
+    ])
+    def test_lint_mode_severity_levels(self, make_entry, severity, label):
+        """Test that each severity level is exported by its value."""
+        entry = make_entry(msgid="Test", msgstr="")
+        violations = [Violation(entry, severity, f"{label}_check", label.capitalize())]
 
         output = io.StringIO()
-        old_stdout = sys.stdout
-        sys.stdout = output
-        export_to_csv([], lint_mode=True, violations=violations)
-        sys.stdout = old_stdout
+        export_to_csv([], lint_mode=True, violations=violations, stream=output)
 
-        output.seek(0)
-        reader = csv.DictReader(output)
-        rows = list(reader)
+        content = output.getvalue()
+        rows = list(csv.DictReader(io.StringIO(content)))
 
-        assert len(rows) == 3
-        assert rows[0]["severity"] == "error"
-        assert rows[1]["severity"] == "warning"
-        assert rows[2]["severity"] == "info"
+        assert len(rows) == 1
+        assert rows[0]["severity"] == label
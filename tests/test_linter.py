@@ -1,6 +1,7 @@
 """Tests for the linter module."""
 
 import pytest
+from pathlib import Path
 
 from polyglott.linter import (
     Glossary,
@@ -15,10 +16,12 @@ from polyglott.linter import (
     run_checks,
     _extract_placeholders,
 )
-from polyglott.parser import POEntryData, POParser
+from polyglott.parser import POEntryData
 
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def simple_entry():
     """Create a simple translated entry."""
     return POEntryData(
@@ -36,7 +39,7 @@ def simple_entry():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def untranslated_entry():
     """Create an untranslated entry."""
     return POEntryData(
@@ -54,7 +57,7 @@ def untranslated_entry():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fuzzy_entry():
     """Create a fuzzy entry."""
     return POEntryData(
@@ -72,7 +75,7 @@ def fuzzy_entry():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def obsolete_entry():
     """Create an obsolete entry."""
     return POEntryData(
@@ -90,7 +93,7 @@ def obsolete_entry():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def format_mismatch_entry():
     """Create an entry with format mismatch."""
     return POEntryData(
@@ -108,55 +111,74 @@ def format_mismatch_entry():
     )
 
 
-class TestBuiltinChecks:
-    """Test built-in check functions."""
+@pytest.fixture(scope="session")
+def pipeline_glossary(make_glossary):
+    """Glossary with a single lowercase 'pipeline' term."""
+    return make_glossary("language: de\nterms:\n  pipeline: Pipeline\n")
 
-    def test_check_untranslated(self, simple_entry, untranslated_entry):
-        """Test untranslated check."""
-        # Should not flag translated entry
-        assert check_untranslated(simple_entry) is None
 
-        # Should flag untranslated entry
-        violation = check_untranslated(untranslated_entry)
-        assert violation is not None
-        assert violation.severity == Severity.ERROR
-        assert violation.check_name == "untranslated"
+@pytest.fixture(scope="session")
+def mixed_case_glossary(make_glossary):
+    """Glossary whose keys use assorted capitalization."""
+    return make_glossary("""language: de
+terms:
+  File: Datei
+  Pipeline: Pipeline
+  NODE: Knoten
+  eDge: Kante
+""")
 
-    def test_check_fuzzy(self, simple_entry, fuzzy_entry):
-        """Test fuzzy check."""
-        # Should not flag non-fuzzy entry
-        assert check_fuzzy(simple_entry) is None
 
-        # Should flag fuzzy entry
-        violation = check_fuzzy(fuzzy_entry)
-        assert violation is not None
-        assert violation.severity == Severity.WARNING
-        assert violation.check_name == "fuzzy"
+@pytest.fixture(scope="session")
+def format_issues_entries(parsed_po):
+    """Entries parsed from format_issues.po, shared read-only."""
+    return parsed_po(FIXTURES_DIR / "format_issues.po")
 
-    def test_check_obsolete(self, simple_entry, obsolete_entry):
-        """Test obsolete check."""
-        # Should not flag non-obsolete entry
-        assert check_obsolete(simple_entry) is None
 
-        # Should flag obsolete entry
-        violation = check_obsolete(obsolete_entry)
-        assert violation is not None
-        assert violation.severity == Severity.INFO
-        assert violation.check_name == "obsolete"
+@pytest.fixture(scope="session")
+def complex_entries(parsed_po):
+    """Entries parsed from complex.po, shared read-only."""
+    return parsed_po(FIXTURES_DIR / "complex.po")
+
+
+@pytest.fixture(scope="session")
+def all_checks():
+    """Snapshot of every registered check, taken once per session."""
+    return registry.get_all_checks()
+
 
-    def test_check_format_mismatch(self, simple_entry, format_mismatch_entry, untranslated_entry):
-        """Test format mismatch check."""
-        # Should not flag entry without format strings
-        assert check_format_mismatch(simple_entry) is None
+@pytest.fixture(scope="session")
+def active_checks():
+    """Names of the checks active without filters, taken once per session."""
+    return tuple(registry.get_active_checks())
 
+
+class TestBuiltinChecks:
+    """Test built-in check functions."""
+
+    @pytest.mark.parametrize("check, negative, positive, severity, name", [
+        (check_untranslated, "simple_entry", "untranslated_entry", Severity.ERROR, "untranslated"),
+        (check_fuzzy, "simple_entry", "fuzzy_entry", Severity.WARNING, "fuzzy"),
+        (check_obsolete, "simple_entry", "obsolete_entry", Severity.INFO, "obsolete"),
+        (check_format_mismatch, "simple_entry", "format_mismatch_entry", Severity.ERROR, "format_mismatch"),
+    ], ids=["untranslated", "fuzzy", "obsolete", "format_mismatch"])
+    def test_builtin_check(self, request, check, negative, positive, severity, name):
+        """Test each check ignores a clean entry and flags its target entry."""
+        # Should not flag the clean entry
+        assert check(request.getfixturevalue(negative)) is None
+
+        # Should flag the entry the check targets
+        violation = check(request.getfixturevalue(positive))
+        assert violation is not None
+        assert violation.severity == severity
+        assert violation.check_name == name
+
+    def test_format_mismatch_missing_placeholder(self, format_mismatch_entry, untranslated_entry):
+        """Test format mismatch reports missing placeholders, skipping untranslated entries."""
         # Should not flag untranslated entry
         assert check_format_mismatch(untranslated_entry) is None
 
-        # Should flag format mismatch
         violation = check_format_mismatch(format_mismatch_entry)
-        assert violation is not None
-        assert violation.severity == Severity.ERROR
-        assert violation.check_name == "format_mismatch"
         assert "missing" in violation.message
 
     def test_format_mismatch_extra_placeholder(self):
@@ -219,6 +241,12 @@ class TestExtractPlaceholders:
         placeholders = _extract_placeholders(text)
         assert placeholders == {"%(name)s", "{0}"}
 
+    def test_extract_nested_styles(self):
+        """Test that placeholders nested in each other are all found."""
+        text = "{%(name)s} and %(a{b}c)s"
+        placeholders = _extract_placeholders(text)
+        assert placeholders == {"{%(name)s}", "%(name)s", "%(a{b}c)s", "{b}"}
+
     def test_extract_no_placeholders(self):
         """Test text with no placeholders."""
         text = "Hello world"
@@ -238,6 +266,19 @@ class TestGlossary:
         assert glossary.language == "de"
         assert glossary.terms == {"file": "Datei", "folder": "Ordner"}
 
+    def test_from_string(self):
+        """Test loading a glossary from YAML text."""
+        glossary = Glossary.from_string("language: de\nterms:\n  File: Datei\n")
+        assert glossary.filepath is None
+        assert glossary.language == "de"
+        assert glossary.terms == {"file": "Datei"}
+        assert glossary.check_term("Open the file", "Öffnen Sie die Akte") is not None
+
+    def test_from_string_invalid_yaml(self):
+        """Test loading invalid YAML text."""
+        with pytest.raises(ValueError, match="Invalid YAML"):
+            Glossary.from_string("invalid: [yaml structure")
+
     def test_load_nonexistent_glossary(self):
         """Test loading a nonexistent glossary."""
         with pytest.raises(FileNotFoundError):
@@ -251,29 +292,23 @@ class TestGlossary:
         with pytest.raises(ValueError, match="Invalid YAML"):
             Glossary(str(glossary_file))
 
-    def test_load_no_terms_section(self, tmp_path):
+    def test_load_no_terms_section(self):
         """Test loading glossary without terms section."""
-        glossary_file = tmp_path / "no_terms.yaml"
-        glossary_file.write_text("language: de\n")
-
         with pytest.raises(ValueError, match="must have a 'terms' section"):
-            Glossary(str(glossary_file))
+            Glossary.from_string("language: de\n")
 
-    def test_load_empty_terms(self, tmp_path):
+    def test_load_empty_terms(self):
         """Test loading glossary with empty terms."""
-        glossary_file = tmp_path / "empty_terms.yaml"
-        glossary_file.write_text("language: de\nterms: {}\n")
-
         with pytest.raises(ValueError, match="'terms' section is empty"):
-            Glossary(str(glossary_file))
+            Glossary.from_string("language: de\nterms: {}\n")
 
-    def test_load_terms_as_list(self, tmp_path):
+    def test_load_terms_as_list(self):
         """Test loading glossary with terms as list instead of dict.
 
         This reproduces the bug: 'list' object has no attribute 'items'
         """
-        glossary_file = tmp_path / "list_terms.yaml"
-        glossary_file.write_text("""language: de
+        with pytest.raises(ValueError, match="must be a dictionary"):
+            Glossary.from_string("""language: de
 terms:
   - source: file
     target: Datei
@@ -281,131 +316,92 @@ terms:
     target: Ordner
 """)
 
-        with pytest.raises(ValueError, match="must be a dictionary"):
-            Glossary(str(glossary_file))
-
-    def test_source_term_case_insensitive_key(self, tmp_path):
+    def test_source_term_case_insensitive_key(self, make_glossary):
         """Test that glossary keys are normalized to lowercase.
 
         Glossary: 'File: Datei' (capital F)
         Source: 'open the file' (lowercase f)
         Should match!
         """
-        glossary_file = tmp_path / "glossary.yaml"
-        glossary_file.write_text("language: de\nterms:\n  File: Datei\n")
-
-        glossary = Glossary(str(glossary_file))
+        glossary = make_glossary("language: de\nterms:\n  File: Datei\n")
 
         # Lowercase in source should match uppercase glossary key
         error = glossary.check_term("Open the file", "Öffnen Sie die Datei")
         assert error is None
 
-    def test_source_term_case_insensitive_matching(self, tmp_path):
+    @pytest.mark.parametrize("msgid, msgstr", [
+        ("pipeline", "Pipeline"),
+        ("Pipeline", "Pipeline"),
+        ("PIPELINE", "Pipeline"),
+        ("The pipeline is", "Die Pipeline ist"),
+        ("The Pipeline is", "Die Pipeline ist"),
+        ("THE PIPELINE IS", "Die Pipeline ist"),
+    ])
+    def test_source_term_case_insensitive_matching(self, pipeline_glossary, msgid, msgstr):
         """Test case-insensitive matching for source terms."""
-        glossary_file = tmp_path / "glossary.yaml"
-        glossary_file.write_text("language: de\nterms:\n  pipeline: Pipeline\n")
-
-        glossary = Glossary(str(glossary_file))
-
-        # All these should match
-        test_cases = [
-            ("pipeline", "Pipeline"),
-            ("Pipeline", "Pipeline"),
-            ("PIPELINE", "Pipeline"),
-            ("The pipeline is", "Die Pipeline ist"),
-            ("The Pipeline is", "Die Pipeline ist"),
-            ("THE PIPELINE IS", "Die Pipeline ist"),
-        ]
-
-        for msgid, msgstr in test_cases:
-            error = glossary.check_term(msgid, msgstr)
-            assert error is None, f"Failed for msgid='{msgid}'"
-
-    def test_translation_case_insensitive_matching(self, tmp_path):
+        assert pipeline_glossary.check_term(msgid, msgstr) is None
+
+    @pytest.mark.parametrize("msgstr", [
+        "pipeline",  # lowercase
+        "Pipeline",  # exact match
+        "PIPELINE",  # uppercase
+        "Die pipeline ist",  # in sentence
+        "Die Pipeline ist",  # in sentence, capitalized
+    ])
+    def test_translation_case_insensitive_matching(self, pipeline_glossary, msgstr):
         """Test case-insensitive matching for translations."""
-        glossary_file = tmp_path / "glossary.yaml"
-        glossary_file.write_text("language: de\nterms:\n  pipeline: Pipeline\n")
-
-        glossary = Glossary(str(glossary_file))
-
-        # All these translations should match (case-insensitive)
-        test_cases = [
-            ("pipeline", "pipeline"),  # lowercase
-            ("pipeline", "Pipeline"),  # exact match
-            ("pipeline", "PIPELINE"),  # uppercase
-            ("pipeline", "Die pipeline ist"),  # in sentence
-            ("pipeline", "Die Pipeline ist"),  # in sentence, capitalized
-        ]
-
-        for msgid, msgstr in test_cases:
-            error = glossary.check_term(msgid, msgstr)
-            assert error is None, f"Failed for msgstr='{msgstr}'"
-
-    def test_mixed_case_glossary_keys(self, tmp_path):
+        assert pipeline_glossary.check_term("pipeline", msgstr) is None
+
+    @pytest.mark.parametrize("msgid, msgstr", [
+        ("Open the file", "Öffnen Sie die Datei"),
+        ("pipeline status", "Pipeline-Status"),
+        ("graph node", "Graph-Knoten"),
+        ("edge weight", "Kante Gewicht"),
+    ])
+    def test_mixed_case_glossary_keys(self, mixed_case_glossary, msgid, msgstr):
         """Test that mixed-case glossary keys are normalized."""
-        glossary_file = tmp_path / "glossary.yaml"
-        glossary_file.write_text("""language: de
-terms:
-  File: Datei
-  Pipeline: Pipeline
-  NODE: Knoten
-  eDge: Kante
-""")
-
-        glossary = Glossary(str(glossary_file))
-
         # All lowercase source terms should match
-        assert glossary.check_term("Open the file", "Öffnen Sie die Datei") is None
-        assert glossary.check_term("pipeline status", "Pipeline-Status") is None
-        assert glossary.check_term("graph node", "Graph-Knoten") is None
-        assert glossary.check_term("edge weight", "Kante Gewicht") is None
+        assert mixed_case_glossary.check_term(msgid, msgstr) is None
 
-    def test_check_term_match(self, tmp_path):
+    def test_check_term_match(self, make_glossary):
         """Test glossary term checking with correct term."""
-        glossary_file = tmp_path / "glossary.yaml"
-        glossary_file.write_text("language: de\nterms:\n  file: Datei\n")
-
-        glossary = Glossary(str(glossary_file))
+        glossary = make_glossary("language: de\nterms:\n  file: Datei\n")
         error = glossary.check_term("Open the file", "Öffnen Sie die Datei")
         assert error is None
 
-    def test_check_term_mismatch(self, tmp_path):
+    def test_check_term_mismatch(self, make_glossary):
         """Test glossary term checking with incorrect term."""
-        glossary_file = tmp_path / "glossary.yaml"
-        glossary_file.write_text("language: de\nterms:\n  file: Datei\n")
-
-        glossary = Glossary(str(glossary_file))
+        glossary = make_glossary("language: de\nterms:\n  file: Datei\n")
         error = glossary.check_term("Open the file", "Öffnen Sie die Akte")
         assert error is not None
         assert "Datei" in error
         assert "file" in error
 
-    def test_check_term_word_boundary(self, tmp_path):
-        """Test glossary respects word boundaries."""
-        glossary_file = tmp_path / "glossary.yaml"
-        glossary_file.write_text("language: de\nterms:\n  file: Datei\n")
+    def test_check_term_reports_missing_term(self, make_glossary):
+        """Test that the term missing from the translation is reported."""
+        glossary = make_glossary("language: de\nterms:\n  file: Datei\n  folder: Ordner\n")
+        error = glossary.check_term("Move the file to a folder", "Datei in Verzeichnis verschieben")
+        assert error is not None
+        assert "Ordner" in error
+        assert "Datei" not in error
 
-        glossary = Glossary(str(glossary_file))
+    def test_check_term_word_boundary(self, make_glossary):
+        """Test glossary respects word boundaries."""
+        glossary = make_glossary("language: de\nterms:\n  file: Datei\n")
         # "profile" should not match "file"
         error = glossary.check_term("View user profile", "Benutzerprofil anzeigen")
         assert error is None
 
-    def test_check_term_case_insensitive_source(self, tmp_path):
+    def test_check_term_case_insensitive_source(self, make_glossary):
         """Test glossary source matching is case-insensitive."""
-        glossary_file = tmp_path / "glossary.yaml"
-        glossary_file.write_text("language: de\nterms:\n  file: Datei\n")
-
-        glossary = Glossary(str(glossary_file))
+        glossary = make_glossary("language: de\nterms:\n  file: Datei\n")
         # "File" (capital F) should match "file"
         error = glossary.check_term("Open the File", "Öffnen Sie die Datei")
         assert error is None
 
-    def test_check_term_untranslated(self, tmp_path):
+    def test_check_term_untranslated(self, make_glossary):
         """Test glossary skips untranslated entries."""
-        glossary_file = tmp_path / "glossary.yaml"
-        glossary_file.write_text("language: de\nterms:\n  file: Datei\n")
-
-        glossary = Glossary(str(glossary_file))
+        glossary = make_glossary("language: de\nterms:\n  file: Datei\n")
         error = glossary.check_term("Open the file", "")
         assert error is None
 
@@ -418,12 +414,9 @@ class TestTermMismatchCheck:
         violation = check_term_mismatch(simple_entry, glossary=None)
         assert violation is None
 
-    def test_check_term_mismatch_with_glossary(self, tmp_path):
+    def test_check_term_mismatch_with_glossary(self, make_glossary):
         """Test term mismatch check with glossary."""
-        glossary_file = tmp_path / "glossary.yaml"
-        glossary_file.write_text("language: de\nterms:\n  file: Datei\n")
-
-        glossary = Glossary(str(glossary_file))
+        glossary = make_glossary("language: de\nterms:\n  file: Datei\n")
 
         # Entry with correct term
         entry = POEntryData(
@@ -465,19 +458,16 @@ class TestTermMismatchCheck:
 class TestCheckRegistry:
     """Test check registry."""
 
-    def test_registry_has_checks(self):
+    def test_registry_has_checks(self, all_checks):
         """Test registry contains expected checks."""
-        checks = registry.get_all_checks()
-        assert "untranslated" in checks
-        assert "fuzzy" in checks
-        assert "obsolete" in checks
-        assert "format_mismatch" in checks
-        assert "term_mismatch" in checks
+        checks = all_checks
+        expected = {"untranslated", "fuzzy", "obsolete", "format_mismatch", "term_mismatch"}
+        missing = expected - checks.keys()
+        assert not missing, f"Missing checks: {sorted(missing)}"
 
-    def test_get_active_checks_no_filter(self):
+    def test_get_active_checks_no_filter(self, active_checks):
         """Test getting all checks without filters."""
-        checks = registry.get_active_checks()
-        assert len(checks) >= 5  # At least the 5 built-in checks
+        assert len(active_checks) >= 5  # At least the 5 built-in checks
 
     def test_get_active_checks_include(self):
         """Test filtering with include list."""
@@ -537,21 +527,17 @@ class TestRunChecks:
 class TestIntegrationWithParser:
     """Test linter integration with parser."""
 
-    def test_lint_format_issues_po(self):
+    def test_lint_format_issues_po(self, format_issues_entries):
         """Test linting format_issues.po fixture."""
-        parser = POParser("tests/fixtures/format_issues.po")
-        entries = parser.parse()
-        violations = run_checks(entries, include_checks=["format_mismatch"])
+        violations = run_checks(format_issues_entries, include_checks=["format_mismatch"])
 
         # Should find format mismatches
         assert len(violations) > 0
         assert all(v.check_name == "format_mismatch" for v in violations)
 
-    def test_lint_complex_po(self):
+    def test_lint_complex_po(self, complex_entries):
         """Test linting complex.po fixture."""
-        parser = POParser("tests/fixtures/complex.po")
-        entries = parser.parse()
-        violations = run_checks(entries)
+        violations = run_checks(complex_entries)
 
         # Should find violations (untranslated, fuzzy, obsolete)
         assert len(violations) > 0
@@ -1,13 +1,15 @@
 """Tests for master CSV functionality."""
 
 import csv
-import subprocess
-import sys
+import dataclasses
+import io
+import shutil
 from pathlib import Path
-from tempfile import TemporaryDirectory
+from typing import Dict, List, Optional
 
 import pytest
 
+from cli_runner import run_cli
 from polyglott.master import (
     MasterEntry,
     deduplicate_entries,
@@ -16,16 +18,160 @@ from polyglott.master import (
     load_master,
     save_master,
     infer_language,
-    _resolve_msgstr_conflict,
+    POLYGLOTT_COLUMNS,
     _check_glossary_score,
-    _compute_context
 )
-from polyglott.parser import POEntryData, POParser, MultiPOParser
+from polyglott.parser import POEntryData, MultiPOParser
 from polyglott.linter import Glossary
-from polyglott.context import load_context_rules
+from polyglott.context import CompiledRules
 
 # Test fixtures directory
 FIXTURES_DIR = Path(__file__).parent / "fixtures" / "master"
+DJANGO_PO = str(FIXTURES_DIR / "django.po")
+FORMS_PO = str(FIXTURES_DIR / "forms.po")
+ALL_PO_GLOB = str(FIXTURES_DIR / "*.po")
+GLOSSARY_DE = str(FIXTURES_DIR / "glossary_de.yaml")
+MASTER_EXISTING = str(FIXTURES_DIR / "master_existing.csv")
+
+# Context rules shared by the create/merge tests; never modified
+CONTEXT_RULES_BASIC = [
+    {'pattern': 'forms.py', 'context': 'form_label'},
+    {'pattern': 'models.py', 'context': 'field_label'},
+    {'pattern': 'views.py', 'context': 'message'}
+]
+CONTEXT_RULES_FORMS = [
+    {'pattern': 'forms.py', 'context': 'form_label'}
+]
+CONTEXT_RULES_EXTENDED = [
+    {'pattern': 'forms.py', 'context': 'form_label'},
+    {'pattern': 'forms/login.py', 'context': 'login_form'},
+    {'pattern': 'forms/contact.py', 'context': 'contact_form'},
+    {'pattern': 'admin.py', 'context': 'admin'}
+]
+
+# POEntryData fields the master tests rarely care about
+_PO_DEFAULTS = dict(
+    msgctxt=None,
+    extracted_comments="",
+    translator_comments="",
+    fuzzy=False,
+    obsolete=False,
+    is_plural=False,
+    plural_index=None,
+)
+
+
+def _po(msgid: str, msgstr: str, references: str = "f.py:1",
+        source_file: Optional[str] = "t.po", **fields) -> POEntryData:
+    """Build a POEntryData with defaults for the boilerplate fields."""
+    if not fields:
+        # Common case: positional construction, in POEntryData field order
+        return POEntryData(msgid, msgstr, None, "", "", references, False, False, False, None, source_file)
+    return POEntryData(
+        msgid=msgid,
+        msgstr=msgstr,
+        references=references,
+        source_file=source_file,
+        **{**_PO_DEFAULTS, **fields}
+    )
+
+
+def _me(msgid: str, msgstr: str, status: str, score: str = "", context: str = "",
+        context_sources: str = "", **fields) -> MasterEntry:
+    """Build a MasterEntry with empty score and context by default."""
+    return MasterEntry(
+        msgid=msgid,
+        msgstr=msgstr,
+        status=status,
+        score=score,
+        context=context,
+        context_sources=context_sources,
+        **fields
+    )
+
+
+def _by_msgid(entries: List[MasterEntry]) -> Dict[str, MasterEntry]:
+    """Index master entries by msgid for direct lookups."""
+    return {entry.msgid: entry for entry in entries}
+
+
+def _read_header(path: Path) -> List[str]:
+    """Read the column names of a CSV written by save_master.
+
+    Only the first line is read. Header names never contain quotes or
+    commas, so stripping the QUOTE_ALL quotes is enough.
+    """
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        header = f.readline()
+    return [name.strip('"') for name in header.rstrip('\r\n').split(',')]
+
+
+# (initial status, initial msgstr, PO msgstr or None if missing from PO,
+#  expected status, expected msgstr)
+MERGE_CASES = [
+    pytest.param("accepted", "Benutzername", "Benutzername", "accepted", "Benutzername",
+                 id="accepted_matching"),
+    # Existing msgstr preserved
+    pytest.param("accepted", "Passwort", "Kennwort", "conflict", "Passwort",
+                 id="accepted_divergent_conflict"),
+    pytest.param("accepted", "Alter Eintrag", None, "stale", "Alter Eintrag",
+                 id="accepted_missing_stale"),
+    pytest.param("rejected", "Schlechte Übersetzung", "Schlechte Übersetzung", "rejected",
+                 "Schlechte Übersetzung", id="rejected_present"),
+    pytest.param("rejected", "Abgelehnt", None, "stale", "Abgelehnt",
+                 id="rejected_missing"),
+    pytest.param("review", "Senden", "Absenden", "review", "Absenden",
+                 id="review_updated"),
+    pytest.param("review", "Überprüfung", None, "stale", "Überprüfung",
+                 id="review_missing"),
+    pytest.param("machine", "Maschine", "Maschine Neu", "machine", "Maschine Neu",
+                 id="machine_updated"),
+    pytest.param("machine", "Maschine", None, "stale", "Maschine",
+                 id="machine_missing"),
+    pytest.param("empty", "", "", "empty", "",
+                 id="empty_still_empty"),
+    pytest.param("empty", "", None, "stale", "",
+                 id="empty_missing"),
+    pytest.param("conflict", "Konflikt", "Widerspruch", "conflict", "Konflikt",
+                 id="conflict_present"),
+    pytest.param("conflict", "Konflikt", None, "stale", "Konflikt",
+                 id="conflict_missing"),
+    # Score is not assigned on reappearance
+    pytest.param("stale", "Veraltet", "Veraltet Neu", "review", "Veraltet Neu",
+                 id="stale_reappears"),
+]
+
+
+@pytest.fixture(scope="session")
+def glossary_de():
+    """German glossary fixture, loaded once and shared read-only."""
+    return Glossary(GLOSSARY_DE)
+
+
+@pytest.fixture(scope="session")
+def django_entries(parsed_po):
+    """Entries parsed from django.po, shared read-only."""
+    return parsed_po(DJANGO_PO)
+
+
+@pytest.fixture(scope="session")
+def django_master_csv(tmp_path_factory, django_entries):
+    """Master CSV for django.po, as a fresh import writes it.
+
+    Built once per session. Tests that modify it must copy it first.
+    """
+    path = tmp_path_factory.mktemp("django_master") / "polyglott-accepted-de.csv"
+    save_master(create_master(django_entries), str(path))
+    return path
+
+
+@pytest.fixture(scope="session")
+def multi_entries():
+    """Entries parsed from django.po and forms.po, shared read-only."""
+    return MultiPOParser([
+        DJANGO_PO,
+        FORMS_PO
+    ]).parse()
 
 
 class TestDeduplication:
@@ -34,32 +180,8 @@ class TestDeduplication:
     def test_same_msgid_same_msgstr(self):
         """Test deduplication when msgstr values match."""
         entries = [
-            POEntryData(
-                msgid="Hello",
-                msgstr="Hallo",
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="file1.py:10",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file="django.po"
-            ),
-            POEntryData(
-                msgid="Hello",
-                msgstr="Hallo",
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="file2.py:20",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file="forms.po"
-            )
+            _po("Hello", "Hallo", references="file1.py:10", source_file="django.po"),
+            _po("Hello", "Hallo", references="file2.py:20", source_file="forms.po")
         ]
 
         result = deduplicate_entries(entries)
@@ -74,45 +196,9 @@ class TestDeduplication:
     def test_same_msgid_different_msgstr_majority(self):
         """Test majority voting when msgstr values differ."""
         entries = [
-            POEntryData(
-                msgid="Hello",
-                msgstr="Hallo",
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="file1.py:10",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file="file1.po"
-            ),
-            POEntryData(
-                msgid="Hello",
-                msgstr="Hallo",
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="file2.py:20",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file="file2.po"
-            ),
-            POEntryData(
-                msgid="Hello",
-                msgstr="Grüß Gott",
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="file3.py:30",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file="file3.po"
-            )
+            _po("Hello", "Hallo", references="file1.py:10", source_file="file1.po"),
+            _po("Hello", "Hallo", references="file2.py:20", source_file="file2.po"),
+            _po("Hello", "Grüß Gott", references="file3.py:30", source_file="file3.po")
         ]
 
         result = deduplicate_entries(entries)
@@ -123,32 +209,8 @@ class TestDeduplication:
     def test_same_msgid_empty_vs_nonempty(self):
         """Test that non-empty msgstr beats empty."""
         entries = [
-            POEntryData(
-                msgid="Hello",
-                msgstr="",
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="file1.py:10",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file="file1.po"
-            ),
-            POEntryData(
-                msgid="Hello",
-                msgstr="Hallo",
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="file2.py:20",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file="file2.po"
-            )
+            _po("Hello", "", references="file1.py:10", source_file="file1.po"),
+            _po("Hello", "Hallo", references="file2.py:20", source_file="file2.po")
         ]
 
         result = deduplicate_entries(entries)
@@ -159,32 +221,8 @@ class TestDeduplication:
     def test_reference_aggregation(self):
         """Test that references are properly aggregated and deduplicated."""
         entries = [
-            POEntryData(
-                msgid="Hello",
-                msgstr="Hallo",
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="file1.py:10 file2.py:20",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file="file1.po"
-            ),
-            POEntryData(
-                msgid="Hello",
-                msgstr="Hallo",
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="file2.py:20 file3.py:30",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file="file2.po"
-            )
+            _po("Hello", "Hallo", references="file1.py:10 file2.py:20", source_file="file1.po"),
+            _po("Hello", "Hallo", references="file2.py:20 file3.py:30", source_file="file2.po")
         ]
 
         result = deduplicate_entries(entries)
@@ -192,39 +230,13 @@ class TestDeduplication:
         refs = result["Hello"].references.split()
         # Should have 3 unique references
         assert len(refs) == 3
-        assert "file1.py:10" in refs
-        assert "file2.py:20" in refs
-        assert "file3.py:30" in refs
+        assert set(refs) == {"file1.py:10", "file2.py:20", "file3.py:30"}
 
     def test_majority_voting_tie(self):
         """Test tie-breaking: first encountered wins."""
         entries = [
-            POEntryData(
-                msgid="Hello",
-                msgstr="Hallo",
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="file1.py:10",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file="file1.po"
-            ),
-            POEntryData(
-                msgid="Hello",
-                msgstr="Grüß Gott",
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="file2.py:20",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file="file2.po"
-            )
+            _po("Hello", "Hallo", references="file1.py:10", source_file="file1.po"),
+            _po("Hello", "Grüß Gott", references="file2.py:20", source_file="file2.po")
         ]
 
         result = deduplicate_entries(entries)
@@ -236,61 +248,38 @@ class TestDeduplication:
 class TestGlossaryScoring:
     """Tests for glossary scoring logic."""
 
-    def test_exact_match_scores_10(self):
-        """Test that exact glossary match assigns score 10."""
-        glossary = Glossary(str(FIXTURES_DIR / "glossary_de.yaml"))
-
-        score = _check_glossary_score("Username", "Benutzername", glossary)
-        assert score == "10"
-
-    def test_partial_match_no_score(self):
-        """Test that partial match doesn't assign score."""
-        glossary = Glossary(str(FIXTURES_DIR / "glossary_de.yaml"))
-
+    @pytest.mark.parametrize("msgid, msgstr, use_glossary, expected", [
+        # Exact glossary match assigns score 10
+        pytest.param("Username", "Benutzername", True, "10", id="exact_match_scores_10"),
         # msgstr doesn't match glossary term
-        score = _check_glossary_score("Username", "Nutzername", glossary)
-        assert score == ""
-
-    def test_no_glossary_no_score(self):
-        """Test that no glossary means no score."""
-        score = _check_glossary_score("Username", "Benutzername", None)
-        assert score == ""
-
-    def test_case_insensitive_match(self):
-        """Test that glossary matching is case-insensitive."""
-        glossary = Glossary(str(FIXTURES_DIR / "glossary_de.yaml"))
-
+        pytest.param("Username", "Nutzername", True, "", id="partial_match_no_score"),
+        pytest.param("Username", "Benutzername", False, "", id="no_glossary_no_score"),
         # Different case but should still match
-        score = _check_glossary_score("username", "benutzername", glossary)
-        assert score == "10"
+        pytest.param("username", "benutzername", True, "10", id="case_insensitive_match"),
+    ])
+    def test_glossary_score(self, glossary_de, msgid, msgstr, use_glossary, expected):
+        """Test the score assigned for each glossary match situation."""
+        glossary = glossary_de if use_glossary else None
+        assert _check_glossary_score(msgid, msgstr, glossary) == expected
 
 
 class TestCreateMaster:
     """Tests for initial master CSV creation."""
 
-    def test_create_from_single_file(self):
-        """Test creating master from a single PO file."""
-        parser = POParser(str(FIXTURES_DIR / "django.po"))
-        entries = parser.parse()
-
-        result = create_master(entries)
+    def test_create_from_single_file(self, django_entries):
+        """Test creating master from a single PO file, sorted by msgid."""
+        result = create_master(django_entries)
 
         # Should have 6 entries (excluding header)
         assert len(result) == 6
 
-        # Check entries are sorted by msgid
+        # Check entries are sorted by msgid for stable diffs
         msgids = [e.msgid for e in result]
         assert msgids == sorted(msgids)
 
-    def test_create_from_multiple_files(self):
+    def test_create_from_multiple_files(self, multi_entries):
         """Test creating master from multiple PO files with deduplication."""
-        parser = MultiPOParser([
-            str(FIXTURES_DIR / "django.po"),
-            str(FIXTURES_DIR / "forms.po")
-        ])
-        entries = parser.parse()
-
-        result = create_master(entries)
+        result = create_master(multi_entries)
 
         # Should have deduplicated entries
         msgids = [e.msgid for e in result]
@@ -298,16 +287,14 @@ class TestCreateMaster:
         assert msgids.count("Username") == 1
         assert msgids.count("Password") == 1
 
-    def test_status_empty_vs_review(self):
+    def test_status_empty_vs_review(self, django_entries):
         """Test that status is 'empty' for untranslated, 'review' for translated."""
-        parser = POParser(str(FIXTURES_DIR / "django.po"))
-        entries = parser.parse()
-
-        result = create_master(entries)
+        result = create_master(django_entries)
+        by_msgid = _by_msgid(result)
 
         # Find specific entries
-        invalid_creds = next((e for e in result if e.msgid == "Invalid credentials"), None)
-        username = next((e for e in result if e.msgid == "Username"), None)
+        invalid_creds = by_msgid.get("Invalid credentials")
+        username = by_msgid.get("Username")
 
         assert invalid_creds is not None
         assert invalid_creds.status == "empty"
@@ -315,22 +302,14 @@ class TestCreateMaster:
         assert username is not None
         assert username.status == "review"
 
-    def test_context_populated(self):
+    def test_context_populated(self, django_entries):
         """Test that context is computed when rules provided."""
-        parser = POParser(str(FIXTURES_DIR / "django.po"))
-        entries = parser.parse()
-
-        context_rules = [
-            {'pattern': 'forms.py', 'context': 'form_label'},
-            {'pattern': 'models.py', 'context': 'field_label'},
-            {'pattern': 'views.py', 'context': 'message'}
-        ]
-
-        result = create_master(entries, None, context_rules)
+        result = create_master(django_entries, None, CONTEXT_RULES_BASIC)
+        by_msgid = _by_msgid(result)
 
         # Find specific entries
-        username = next((e for e in result if e.msgid == "Username"), None)
-        login_msg = next((e for e in result if e.msgid == "Login successful"), None)
+        username = by_msgid.get("Username")
+        login_msg = by_msgid.get("Login successful")
 
         assert username is not None
         assert username.context == "form_label"
@@ -338,468 +317,76 @@ class TestCreateMaster:
         assert login_msg is not None
         assert login_msg.context == "message"
 
-    def test_sorted_by_msgid(self):
-        """Test that master entries are sorted by msgid."""
-        parser = POParser(str(FIXTURES_DIR / "django.po"))
-        entries = parser.parse()
+    def test_context_with_compiled_rules(self, django_entries):
+        """Test that precompiled rules give the same contexts as a rule list."""
+        from_list = create_master(django_entries, None, CONTEXT_RULES_BASIC)
+        compiled = create_master(django_entries, None, CompiledRules(CONTEXT_RULES_BASIC))
 
-        result = create_master(entries)
-
-        msgids = [e.msgid for e in result]
-        assert msgids == sorted(msgids)
+        assert [(e.context, e.context_sources) for e in compiled] == \
+            [(e.context, e.context_sources) for e in from_list]
 
 
 class TestMergeMaster:
     """Tests for merge workflow with status transitions."""
 
-    def test_merge_accepted_matching(self):
-        """Test accepted entry with matching PO stays unchanged."""
-        existing = {
-            "Username": MasterEntry(
-                msgid="Username",
-                msgstr="Benutzername",
-                status="accepted",
-                score="10",
-                context="form_label",
-                context_sources=""
-            )
-        }
-
-        po_entries = [
-            POEntryData(
-                msgid="Username",
-                msgstr="Benutzername",
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="forms.py:10",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file="django.po"
-            )
-        ]
-
-        result = merge_master(existing, po_entries)
-
-        assert len(result) == 1
-        assert result[0].status == "accepted"
-        assert result[0].msgstr == "Benutzername"
-
-    def test_merge_accepted_divergent_conflict(self):
-        """Test accepted entry with divergent PO becomes conflict."""
-        existing = {
-            "Password": MasterEntry(
-                msgid="Password",
-                msgstr="Passwort",
-                status="accepted",
-                score="10",
-                context="form_label",
-                context_sources=""
-            )
-        }
-
-        po_entries = [
-            POEntryData(
-                msgid="Password",
-                msgstr="Kennwort",  # Different translation
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="forms.py:15",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file="forms.po"
-            )
-        ]
+    @pytest.mark.parametrize("init_status, init_msgstr, po_msgstr, exp_status, exp_msgstr", MERGE_CASES)
+    def test_merge_status_transition(self, init_status, init_msgstr, po_msgstr, exp_status, exp_msgstr):
+        """Test the status and msgstr an existing entry ends up with after merge."""
+        existing = {"Key": _me("Key", init_msgstr, init_status)}
+        po_entries = [] if po_msgstr is None else [_po("Key", po_msgstr)]
 
         result = merge_master(existing, po_entries)
 
         assert len(result) == 1
-        assert result[0].status == "conflict"
-        # Existing msgstr preserved
-        assert result[0].msgstr == "Passwort"
-
-    def test_merge_accepted_missing_stale(self):
-        """Test accepted entry missing from PO becomes stale."""
-        existing = {
-            "Old Entry": MasterEntry(
-                msgid="Old Entry",
-                msgstr="Alter Eintrag",
-                status="accepted",
-                score="",
-                context="",
-                context_sources=""
-            )
-        }
-
-        po_entries = []  # Empty, entry not in PO files
-
-        result = merge_master(existing, po_entries)
-
-        assert len(result) == 1
-        assert result[0].status == "stale"
-        assert result[0].msgstr == "Alter Eintrag"
-
-    def test_merge_rejected_present(self):
-        """Test rejected entry present in PO stays rejected."""
-        existing = {
-            "Bad Translation": MasterEntry(
-                msgid="Bad Translation",
-                msgstr="Schlechte Übersetzung",
-                status="rejected",
-                score="",
-                context="",
-                context_sources=""
-            )
-        }
-
-        po_entries = [
-            POEntryData(
-                msgid="Bad Translation",
-                msgstr="Schlechte Übersetzung",
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="file.py:10",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file="test.po"
-            )
-        ]
-
-        result = merge_master(existing, po_entries)
-
-        assert len(result) == 1
-        assert result[0].status == "rejected"
-
-    def test_merge_rejected_missing(self):
-        """Test rejected entry missing from PO becomes stale."""
-        existing = {
-            "Rejected": MasterEntry(
-                msgid="Rejected",
-                msgstr="Abgelehnt",
-                status="rejected",
-                score="",
-                context="",
-                context_sources=""
-            )
-        }
-
-        po_entries = []
-
-        result = merge_master(existing, po_entries)
-
-        assert len(result) == 1
-        assert result[0].status == "stale"
+        assert result[0].status == exp_status
+        assert result[0].msgstr == exp_msgstr
+        # No glossary, so no score is assigned on any transition
+        assert result[0].score == ""
 
-    def test_merge_review_updated(self):
-        """Test review entry gets msgstr updated from PO."""
+    def test_merge_status_transitions_batched(self):
+        """Test all MERGE_CASES together in one merge, as a real rescan does."""
+        cases = {case.id: case.values for case in MERGE_CASES}
         existing = {
-            "Submit": MasterEntry(
-                msgid="Submit",
-                msgstr="Senden",
-                status="review",
-                score="",
-                context="form_label",
-                context_sources=""
-            )
+            case_id: _me(case_id, init_msgstr, init_status)
+            for case_id, (init_status, init_msgstr, _, _, _) in cases.items()
         }
-
         po_entries = [
-            POEntryData(
-                msgid="Submit",
-                msgstr="Absenden",  # Updated translation
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="forms.py:20",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file="django.po"
-            )
+            _po(case_id, po_msgstr)
+            for case_id, (_, _, po_msgstr, _, _) in cases.items()
+            if po_msgstr is not None
         ]
 
-        result = merge_master(existing, po_entries)
+        result = _by_msgid(merge_master(existing, po_entries))
 
-        assert len(result) == 1
-        assert result[0].status == "review"
-        assert result[0].msgstr == "Absenden"  # Updated
-
-    def test_merge_review_missing(self):
-        """Test review entry missing from PO becomes stale."""
-        existing = {
-            "Review": MasterEntry(
-                msgid="Review",
-                msgstr="Überprüfung",
-                status="review",
-                score="",
-                context="",
-                context_sources=""
-            )
+        assert result.keys() == cases.keys()
+        outcomes = {case_id: (entry.status, entry.msgstr) for case_id, entry in result.items()}
+        expected = {
+            case_id: (exp_status, exp_msgstr)
+            for case_id, (_, _, _, exp_status, exp_msgstr) in cases.items()
         }
+        assert outcomes == expected
 
-        po_entries = []
-
-        result = merge_master(existing, po_entries)
-
-        assert len(result) == 1
-        assert result[0].status == "stale"
-
-    def test_merge_machine_updated(self):
-        """Test machine entry gets msgstr updated from PO."""
-        existing = {
-            "Machine": MasterEntry(
-                msgid="Machine",
-                msgstr="Maschine",
-                status="machine",
-                score="",
-                context="",
-                context_sources=""
-            )
-        }
-
-        po_entries = [
-            POEntryData(
-                msgid="Machine",
-                msgstr="Maschine Neu",  # Updated
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="file.py:10",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file="test.po"
-            )
-        ]
-
-        result = merge_master(existing, po_entries)
-
-        assert result[0].msgstr == "Maschine Neu"
-
-    def test_merge_machine_missing(self):
-        """Test machine entry missing from PO becomes stale."""
-        existing = {
-            "Machine": MasterEntry(
-                msgid="Machine",
-                msgstr="Maschine",
-                status="machine",
-                score="",
-                context="",
-                context_sources=""
-            )
-        }
-
-        po_entries = []
-
-        result = merge_master(existing, po_entries)
-
-        assert result[0].status == "stale"
-
-    def test_merge_empty_now_translated(self):
+    def test_merge_empty_now_translated(self, glossary_de):
         """Test empty entry now has translation becomes review with score."""
         existing = {
-            "Empty": MasterEntry(
-                msgid="Empty",
-                msgstr="",
-                status="empty",
-                score="",
-                context="",
-                context_sources=""
-            )
+            "Empty": _me("Empty", "", "empty")
         }
 
         po_entries = [
-            POEntryData(
-                msgid="Empty",
-                msgstr="Leer",
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="file.py:10",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file="test.po"
-            )
+            _po("Empty", "Leer", references="file.py:10", source_file="test.po")
         ]
 
-        glossary = Glossary(str(FIXTURES_DIR / "glossary_de.yaml"))
-
-        result = merge_master(existing, po_entries, glossary)
+        result = merge_master(existing, po_entries, glossary_de)
 
         assert result[0].status == "review"
         assert result[0].msgstr == "Leer"
 
-    def test_merge_empty_still_empty(self):
-        """Test empty entry still empty stays empty."""
-        existing = {
-            "Empty": MasterEntry(
-                msgid="Empty",
-                msgstr="",
-                status="empty",
-                score="",
-                context="",
-                context_sources=""
-            )
-        }
-
-        po_entries = [
-            POEntryData(
-                msgid="Empty",
-                msgstr="",  # Still empty
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="file.py:10",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file="test.po"
-            )
-        ]
-
-        result = merge_master(existing, po_entries)
-
-        assert result[0].status == "empty"
-
-    def test_merge_empty_missing(self):
-        """Test empty entry missing from PO becomes stale."""
-        existing = {
-            "Empty": MasterEntry(
-                msgid="Empty",
-                msgstr="",
-                status="empty",
-                score="",
-                context="",
-                context_sources=""
-            )
-        }
-
-        po_entries = []
-
-        result = merge_master(existing, po_entries)
-
-        assert result[0].status == "stale"
-
-    def test_merge_conflict_present(self):
-        """Test conflict entry present in PO stays conflict."""
-        existing = {
-            "Conflict": MasterEntry(
-                msgid="Conflict",
-                msgstr="Konflikt",
-                status="conflict",
-                score="",
-                context="",
-                context_sources=""
-            )
-        }
-
-        po_entries = [
-            POEntryData(
-                msgid="Conflict",
-                msgstr="Widerspruch",  # Different but doesn't matter
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="file.py:10",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file="test.po"
-            )
-        ]
-
-        result = merge_master(existing, po_entries)
-
-        assert result[0].status == "conflict"
-        assert result[0].msgstr == "Konflikt"  # Preserved
-
-    def test_merge_conflict_missing(self):
-        """Test conflict entry missing from PO becomes stale."""
-        existing = {
-            "Conflict": MasterEntry(
-                msgid="Conflict",
-                msgstr="Konflikt",
-                status="conflict",
-                score="",
-                context="",
-                context_sources=""
-            )
-        }
-
-        po_entries = []
-
-        result = merge_master(existing, po_entries)
-
-        assert result[0].status == "stale"
-
-    def test_merge_stale_reappears(self):
-        """Test stale entry reappearing becomes review."""
-        existing = {
-            "Stale": MasterEntry(
-                msgid="Stale",
-                msgstr="Veraltet",
-                status="stale",
-                score="",
-                context="",
-                context_sources=""
-            )
-        }
-
-        po_entries = [
-            POEntryData(
-                msgid="Stale",
-                msgstr="Veraltet Neu",  # Reappears
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="file.py:10",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file="test.po"
-            )
-        ]
-
-        result = merge_master(existing, po_entries)
-
-        assert result[0].status == "review"
-        assert result[0].msgstr == "Veraltet Neu"
-        # Score should NOT be assigned on reappearance
-        assert result[0].score == ""
-
     def test_merge_new_msgid(self):
         """Test new msgid added to master."""
         existing = {}
 
         po_entries = [
-            POEntryData(
-                msgid="New Entry",
-                msgstr="Neuer Eintrag",
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="file.py:10",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file="test.po"
-            )
+            _po("New Entry", "Neuer Eintrag", references="file.py:10", source_file="test.po")
         ]
 
         result = merge_master(existing, po_entries)
@@ -815,30 +402,17 @@ class TestScorePreservation:
     def test_existing_score_preserved_on_rescan(self):
         """Test that existing scores are preserved during rescan."""
         existing = {
-            "Username": MasterEntry(
-                msgid="Username",
-                msgstr="Benutzername",
-                status="accepted",
+            "Username": _me(
+                "Username",
+                "Benutzername",
+                "accepted",
                 score="10",
-                context="form_label",
-                context_sources=""
+                context="form_label"
             )
         }
 
         po_entries = [
-            POEntryData(
-                msgid="Username",
-                msgstr="Benutzername",
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="forms.py:10",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file="django.po"
-            )
+            _po("Username", "Benutzername", references="forms.py:10", source_file="django.po")
         ]
 
         result = merge_master(existing, po_entries)
@@ -848,30 +422,11 @@ class TestScorePreservation:
     def test_manual_score_preserved(self):
         """Test that manually assigned scores are preserved."""
         existing = {
-            "Custom": MasterEntry(
-                msgid="Custom",
-                msgstr="Angepasst",
-                status="accepted",
-                score="8",  # Manual score
-                context="",
-                context_sources=""
-            )
+            "Custom": _me("Custom", "Angepasst", "accepted", score="8")
         }
 
         po_entries = [
-            POEntryData(
-                msgid="Custom",
-                msgstr="Angepasst",
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="file.py:10",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file="test.po"
-            )
+            _po("Custom", "Angepasst", references="file.py:10", source_file="test.po")
         ]
 
         result = merge_master(existing, po_entries)
@@ -885,402 +440,364 @@ class TestContextRefresh:
     def test_context_refreshed_for_accepted(self):
         """Test that context is refreshed even for accepted entries."""
         existing = {
-            "Username": MasterEntry(
-                msgid="Username",
-                msgstr="Benutzername",
-                status="accepted",
+            "Username": _me(
+                "Username",
+                "Benutzername",
+                "accepted",
                 score="10",
-                context="old_context",  # Will be updated
-                context_sources=""
+                context="old_context"
             )
         }
 
         po_entries = [
-            POEntryData(
-                msgid="Username",
-                msgstr="Benutzername",
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="forms.py:10",  # Should match form_label
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file="django.po"
-            )
+            _po("Username", "Benutzername", references="forms.py:10", source_file="django.po")
         ]
 
-        context_rules = [
-            {'pattern': 'forms.py', 'context': 'form_label'}
-        ]
-
-        result = merge_master(existing, po_entries, None, context_rules)
+        result = merge_master(existing, po_entries, None, CONTEXT_RULES_FORMS)
 
         assert result[0].context == "form_label"  # Refreshed
 
-    def test_context_aggregates_all_files(self):
+    def test_context_aggregates_all_files(self, multi_entries):
         """Test that context aggregates references from all files."""
-        parser = MultiPOParser([
-            str(FIXTURES_DIR / "django.po"),
-            str(FIXTURES_DIR / "forms.po")
-        ])
-        entries = parser.parse()
-
-        context_rules = [
-            {'pattern': 'forms.py', 'context': 'form_label'},
-            {'pattern': 'forms/login.py', 'context': 'login_form'},
-            {'pattern': 'forms/contact.py', 'context': 'contact_form'},
-            {'pattern': 'admin.py', 'context': 'admin'}
-        ]
-
-        result = create_master(entries, None, context_rules)
+        result = create_master(multi_entries, None, CONTEXT_RULES_EXTENDED)
+        by_msgid = _by_msgid(result)
 
         # Find "Username" which appears in both files
-        username = next((e for e in result if e.msgid == "Username"), None)
+        username = by_msgid.get("Username")
 
         assert username is not None
         # Should have references from both files
 
 
+class TestMasterEntry:
+    """Tests for the MasterEntry container."""
+
+    def test_entry_is_slotted_and_mutable(self):
+        """Test that entries have no __dict__ but fields can still be updated."""
+        entry = _me("Hello", "", "empty")
+
+        assert not hasattr(entry, "__dict__")
+        with pytest.raises(AttributeError):
+            entry.unknown_field = True
+
+        entry.msgstr = "Hallo"
+        entry.status = "machine"
+        assert entry == _me("Hello", "Hallo", "machine")
+
+    def test_po_helper_positional_fast_path(self):
+        """Test that _po's positional construction matches the keyword path."""
+        assert _po("Hello", "Hallo") == _po("Hello", "Hallo", fuzzy=False)
+
+
 class TestCSVIO:
     """Tests for CSV input/output."""
 
-    def test_save_utf8_bom(self):
+    def test_save_utf8_bom(self, tmp_path):
         """Test that saved CSV has UTF-8 BOM."""
         entries = [
-            MasterEntry(
-                msgid="Hello",
-                msgstr="Hallo",
-                status="review",
-                score="",
-                context="",
-                context_sources=""
-            )
+            _me("Hello", "Hallo", "review")
         ]
 
-        with TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "test.csv"
-            save_master(entries, str(output_path))
+        output_path = tmp_path / "test.csv"
+        save_master(entries, str(output_path))
 
-            # Read raw bytes
-            with open(output_path, 'rb') as f:
-                content = f.read()
+        # Check for BOM; only the first three bytes are needed
+        with open(output_path, 'rb') as f:
+            assert f.read(3) == b'\xef\xbb\xbf'
 
-            # Check for BOM
-            assert content.startswith(b'\xef\xbb\xbf')
-
-    def test_save_quote_all(self):
+    def test_save_quote_all(self, tmp_path):
         """Test that all fields are quoted."""
         entries = [
-            MasterEntry(
-                msgid="Hello",
-                msgstr="Hallo",
-                status="review",
-                score="10",
-                context="message",
-                context_sources=""
-            )
+            _me("Hello", "Hallo", "review", score="10", context="message")
         ]
 
-        with TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "test.csv"
-            save_master(entries, str(output_path))
+        output_path = tmp_path / "test.csv"
+        save_master(entries, str(output_path))
 
-            with open(output_path, 'r', encoding='utf-8-sig') as f:
-                lines = f.readlines()
+        # Only the first data line is needed; skip the header without reading the rest
+        with open(output_path, 'rb') as f:
+            f.readline()
+            data_line = f.readline()
 
-            # Check data line (skip header)
-            data_line = lines[1]
-            # All fields should be quoted
-            assert data_line.startswith('"')
-            assert data_line.strip().endswith('"')
+        # All fields should be quoted
+        assert data_line.startswith(b'"')
+        assert data_line.rstrip(b'\r\n').endswith(b'"')
 
-    def test_load_save_roundtrip(self):
+    def test_load_save_roundtrip(self, tmp_path):
         """Test that load/save roundtrip preserves data."""
         entries = [
-            MasterEntry(
-                msgid="Hello",
-                msgstr="Hallo",
-                status="accepted",
+            _me(
+                "Hello",
+                "Hallo",
+                "accepted",
                 score="10",
                 context="message",
                 context_sources="file1.py=msg;file2.py=label"
             ),
-            MasterEntry(
-                msgid="Goodbye",
-                msgstr="Auf Wiedersehen",
-                status="review",
-                score="",
-                context="",
-                context_sources=""
-            )
+            _me("Goodbye", "Auf Wiedersehen", "review")
         ]
 
-        with TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "test.csv"
+        output_path = tmp_path / "test.csv"
+
+        # Save
+        save_master(entries, str(output_path))
+
+        # Load
+        loaded = load_master(str(output_path))
+
+        # Compare
+        assert len(loaded) == 2
+        assert "Hello" in loaded
+        assert loaded["Hello"].msgstr == "Hallo"
+        assert loaded["Hello"].status == "accepted"
+        assert loaded["Hello"].score == "10"
+        assert loaded["Hello"].context == "message"
+        assert loaded["Hello"].context_sources == "file1.py=msg;file2.py=label"
+
+    def test_load_short_rows_and_blank_lines(self, tmp_path):
+        """Test that truncated rows load with empty cells and blank lines are skipped."""
+        csv_path = tmp_path / "test.csv"
+        csv_path.write_text(
+            'msgid,msgstr,status,notes\n'
+            'Hello,Hallo\n'
+            '\n'
+            'Bye,Tschüss,review,checked\n',
+            encoding='utf-8'
+        )
+
+        loaded = load_master(str(csv_path))
+
+        assert list(loaded) == ["Hello", "Bye"]
+        assert loaded["Hello"].status == ""
+        assert loaded["Hello"].extra_columns == {"notes": ""}
+        assert loaded["Bye"].extra_columns == {"notes": "checked"}
+
+    def test_stream_matches_file(self, tmp_path):
+        """Test that saving to a stream gives the file content minus the BOM."""
+        entries = [_me("Hello", "Hallo", "review", extra_columns={"notes": "a, \"b\""})]
+        output_path = tmp_path / "test.csv"
+        stream = io.StringIO(newline='')
 
-            # Save
-            save_master(entries, str(output_path))
+        save_master(entries, str(output_path))
+        save_master(entries, stream)
 
-            # Load
-            loaded = load_master(str(output_path))
+        assert output_path.read_bytes() == b'\xef\xbb\xbf' + stream.getvalue().encode('utf-8')
+        assert load_master(io.StringIO(stream.getvalue(), newline='')) == load_master(str(output_path))
 
-            # Compare
-            assert len(loaded) == 2
-            assert "Hello" in loaded
-            assert loaded["Hello"].msgstr == "Hallo"
-            assert loaded["Hello"].status == "accepted"
-            assert loaded["Hello"].score == "10"
-            assert loaded["Hello"].context == "message"
-            assert loaded["Hello"].context_sources == "file1.py=msg;file2.py=label"
+    def test_load_stream_with_bom(self):
+        """Test that a BOM left in a text stream doesn't hide the msgid column."""
+        loaded = load_master(io.StringIO('\ufeff"msgid","msgstr"\r\n"Hello","Hallo"\r\n', newline=''))
 
-    def test_column_order(self):
+        assert loaded["Hello"].msgstr == "Hallo"
+
+    def test_load_shares_status_strings(self):
+        """Test that rows with the same status share one string object."""
+        loaded = load_master(io.StringIO(
+            '"msgid","msgstr","status"\r\n"Hello","Hallo","accepted"\r\n"World","Welt","accepted"\r\n',
+            newline=''
+        ))
+
+        assert loaded["Hello"].status is loaded["World"].status
+
+    def test_column_order(self, tmp_path):
         """Test that columns are in correct order."""
         entries = [
-            MasterEntry(
-                msgid="Hello",
-                msgstr="Hallo",
-                status="review",
-                score="",
-                context="",
-                context_sources=""
-            )
+            _me("Hello", "Hallo", "review")
         ]
 
-        with TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "test.csv"
-            save_master(entries, str(output_path))
+        output_path = tmp_path / "test.csv"
+        save_master(entries, str(output_path))
 
-            with open(output_path, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
-                fieldnames = reader.fieldnames
+        fieldnames = _read_header(output_path)
 
-            expected = ['msgid', 'msgstr', 'status', 'score', 'context', 'context_sources', 'candidate']
-            assert fieldnames == expected
+        expected = ['msgid', 'msgstr', 'status', 'score', 'context', 'context_sources', 'candidate']
+        assert fieldnames == expected
 
 
 class TestCLIMaster:
     """Integration tests for CLI master CSV commands (migrated to import subcommand)."""
 
-    def test_master_creates_new_csv(self):
+    def test_master_creates_new_csv(self, django_master_csv, tmp_path):
         """Test creating new master CSV via CLI."""
-        with TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "polyglott-accepted-de.csv"
-
-            result = subprocess.run(
-                [
-                    sys.executable, "-m", "polyglott", "import",
-                    "--master", str(output_path),
-                    str(FIXTURES_DIR / "django.po")
-                ],
-                capture_output=True,
-                text=True
-            )
+        output_path = tmp_path / "polyglott-accepted-de.csv"
 
-            assert result.returncode == 0
-            assert output_path.exists()
+        result = run_cli([
+            "import",
+            "--master", str(output_path),
+            DJANGO_PO
+        ])
+
+        assert result.returncode == 0
+        assert output_path.exists()
 
-            # Load and verify
-            with open(output_path, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
-                rows = list(reader)
+        # Load and verify
+        with open(output_path, 'r', encoding='utf-8-sig') as f:
+            reader = csv.DictReader(f)
+            rows = list(reader)
 
-            assert len(rows) == 6  # 6 entries in django.po
+        assert len(rows) == 6  # 6 entries in django.po
 
-    def test_master_updates_existing(self):
+        # The shared fixture must match what the CLI writes
+        assert output_path.read_bytes() == django_master_csv.read_bytes()
+
+    def test_master_updates_existing(self, tmp_path):
         """Test updating existing master CSV."""
-        with TemporaryDirectory() as tmpdir:
-            # Copy existing master
-            import shutil
-            master_path = Path(tmpdir) / "polyglott-accepted-de.csv"
-            shutil.copy(FIXTURES_DIR / "master_existing.csv", master_path)
-
-            # Run import to update with multiple files
-            result = subprocess.run(
-                [
-                    sys.executable, "-m", "polyglott", "import",
-                    "--master", str(master_path),
-                    "--include", str(FIXTURES_DIR / "*.po")
-                ],
-                capture_output=True,
-                text=True
-            )
+        # Copy existing master
+        master_path = tmp_path / "polyglott-accepted-de.csv"
+        shutil.copyfile(MASTER_EXISTING, master_path)
+
+        # Run import to update with multiple files
+        result = run_cli([
+            "import",
+            "--master", str(master_path),
+            "--include", ALL_PO_GLOB
+        ])
 
+        assert result.returncode == 0
+
+        # Load and verify
+        loaded = load_master(str(master_path))
+
+        # "Will be stale" should now be stale (not in current PO files)
+        assert "Will be stale" in loaded
+        assert loaded["Will be stale"].status == "stale"
+
+    def test_master_import_parallel_matches_serial(self, tmp_path):
+        """Test that --jobs parses the PO files in parallel with the serial result."""
+        paths = {}
+        for jobs in ["1", "2"]:
+            paths[jobs] = tmp_path / f"jobs{jobs}" / "polyglott-accepted-de.csv"
+            paths[jobs].parent.mkdir()
+            shutil.copyfile(MASTER_EXISTING, paths[jobs])
+
+            result = run_cli([
+                "import",
+                "--master", str(paths[jobs]),
+                "--include", ALL_PO_GLOB,
+                "--jobs", jobs
+            ])
             assert result.returncode == 0
 
-            # Load and verify
-            loaded = load_master(str(master_path))
-
-            # "Will be stale" should now be stale (not in current PO files)
-            assert "Will be stale" in loaded
-            assert loaded["Will be stale"].status == "stale"
+        assert paths["2"].read_bytes() == paths["1"].read_bytes()
 
-    def test_master_with_context_rules(self):
+    def test_master_with_context_rules(self, tmp_path):
         """Test master CSV with context rules."""
-        with TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "polyglott-accepted-de.csv"
+        output_path = tmp_path / "polyglott-accepted-de.csv"
 
-            # Create simple context rules
-            rules_path = Path(tmpdir) / "rules.yaml"
-            rules_path.write_text("""rules:
+        # Create simple context rules
+        rules_path = tmp_path / "rules.yaml"
+        rules_path.write_text("""rules:
   - pattern: 'forms.py'
     context: 'form_label'
   - pattern: 'views.py'
     context: 'message'
 """)
 
-            result = subprocess.run(
-                [
-                    sys.executable, "-m", "polyglott", "import",
-                    "--master", str(output_path),
-                    str(FIXTURES_DIR / "django.po"),
-                    "--context-rules", str(rules_path)
-                ],
-                capture_output=True,
-                text=True
-            )
+        result = run_cli([
+            "import",
+            "--master", str(output_path),
+            DJANGO_PO,
+            "--context-rules", str(rules_path)
+        ])
 
-            assert result.returncode == 0
+        assert result.returncode == 0
 
-            # Load and verify context
-            loaded = load_master(str(output_path))
-            assert loaded["Username"].context == "form_label"
-            assert loaded["Login successful"].context == "message"
+        # Load and verify context
+        loaded = load_master(str(output_path))
+        assert loaded["Username"].context == "form_label"
+        assert loaded["Login successful"].context == "message"
 
-    def test_master_with_glossary(self):
+    def test_master_with_glossary(self, tmp_path):
         """Test master CSV with glossary scoring."""
-        with TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "polyglott-accepted-de.csv"
-
-            result = subprocess.run(
-                [
-                    sys.executable, "-m", "polyglott", "import",
-                    "--master", str(output_path),
-                    str(FIXTURES_DIR / "django.po"),
-                    "--glossary", str(FIXTURES_DIR / "glossary_de.yaml")
-                ],
-                capture_output=True,
-                text=True
-            )
+        output_path = tmp_path / "polyglott-accepted-de.csv"
 
-            assert result.returncode == 0
+        result = run_cli([
+            "import",
+            "--master", str(output_path),
+            DJANGO_PO,
+            "--glossary", GLOSSARY_DE
+        ])
+
+        assert result.returncode == 0
 
-            # Load and verify scores
-            loaded = load_master(str(output_path))
+        # Load and verify scores
+        loaded = load_master(str(output_path))
 
-            # These should have score 10 (exact glossary matches)
-            assert loaded["Username"].score == "10"
-            assert loaded["Password"].score == "10"
-            assert loaded["Submit"].score == "10"
-            assert loaded["User"].score == "10"
+        # These should have score 10 (exact glossary matches)
+        assert loaded["Username"].score == "10"
+        assert loaded["Password"].score == "10"
+        assert loaded["Submit"].score == "10"
+        assert loaded["User"].score == "10"
 
-    def test_master_mutually_exclusive_with_output(self):
+    def test_master_mutually_exclusive_with_output(self, tmp_path):
         """Test that import and scan are separate (no longer mutually exclusive)."""
         # This test is no longer applicable since import is a separate subcommand
         # Just verify that scan works without master flag
-        with TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "output.csv"
-
-            result = subprocess.run(
-                [
-                    sys.executable, "-m", "polyglott", "scan",
-                    str(FIXTURES_DIR / "django.po"),
-                    "-o", str(output_path)
-                ],
-                capture_output=True,
-                text=True
-            )
+        output_path = tmp_path / "output.csv"
 
-            assert result.returncode == 0
+        result = run_cli([
+            "scan",
+            DJANGO_PO,
+            "-o", str(output_path)
+        ])
+
+        assert result.returncode == 0
 
-    def test_master_invalid_filename(self):
+    def test_master_invalid_filename(self, tmp_path):
         """Test that invalid master filename is rejected."""
-        with TemporaryDirectory() as tmpdir:
-            invalid_path = Path(tmpdir) / "invalid-name.csv"
-
-            result = subprocess.run(
-                [
-                    sys.executable, "-m", "polyglott", "import",
-                    "--master", str(invalid_path),
-                    str(FIXTURES_DIR / "django.po")
-                ],
-                capture_output=True,
-                text=True
-            )
+        invalid_path = tmp_path / "invalid-name.csv"
+
+        result = run_cli([
+            "import",
+            "--master", str(invalid_path),
+            DJANGO_PO
+        ])
 
-            assert result.returncode == 1
-            assert "Cannot infer target language" in result.stderr
+        assert result.returncode == 1
+        assert "Cannot infer target language" in result.stderr
 
-    def test_master_no_po_files(self):
+    def test_master_no_po_files(self, tmp_path):
         """Test error when no PO files found (Stage 5.1)."""
-        with TemporaryDirectory() as tmpdir:
-            master_path = Path(tmpdir) / "polyglott-accepted-de.csv"
-
-            result = subprocess.run(
-                [
-                    sys.executable, "-m", "polyglott", "import",
-                    "--master", str(master_path),
-                    "--include", "*.nonexistent"
-                ],
-                capture_output=True,
-                text=True
-            )
+        master_path = tmp_path / "polyglott-accepted-de.csv"
+
+        result = run_cli([
+            "import",
+            "--master", str(master_path),
+            "--include", "*.nonexistent"
+        ])
 
-            assert result.returncode == 1
-            # Should warn about no matches
-            assert "Pattern '*.nonexistent' matched no files" in result.stderr
-            assert "No PO files specified" in result.stderr
+        assert result.returncode == 1
+        # Should warn about no matches
+        assert "Pattern '*.nonexistent' matched no files" in result.stderr
+        assert "No PO files specified" in result.stderr
 
-    def test_conflict_detection_roundtrip(self):
+    def test_conflict_detection_roundtrip(self, django_master_csv, tmp_path):
         """Test conflict detection in full workflow."""
-        with TemporaryDirectory() as tmpdir:
-            master_path = Path(tmpdir) / "polyglott-accepted-de.csv"
-
-            # Initial import
-            subprocess.run(
-                [
-                    sys.executable, "-m", "polyglott", "import",
-                    "--master", str(master_path),
-                    str(FIXTURES_DIR / "django.po")
-                ],
-                capture_output=True,
-                text=True
-            )
+        master_path = tmp_path / "polyglott-accepted-de.csv"
 
-            # Manually edit master to mark Password as accepted
-            loaded = load_master(str(master_path))
-            for msgid, entry in loaded.items():
-                if msgid == "Password":
-                    loaded[msgid] = MasterEntry(
-                        msgid=entry.msgid,
-                        msgstr=entry.msgstr,
-                        status="accepted",  # Mark as accepted
-                        score=entry.score,
-                        context=entry.context,
-                        context_sources=entry.context_sources
-                    )
-
-            save_master(list(loaded.values()), str(master_path))
-
-            # Re-import with forms.po which has different translation for Password
-            result = subprocess.run(
-                [
-                    sys.executable, "-m", "polyglott", "import",
-                    "--master", str(master_path),
-                    str(FIXTURES_DIR / "forms.po")
-                ],
-                capture_output=True,
-                text=True
-            )
+        # Start from the initial import of django.po
+        shutil.copyfile(django_master_csv, master_path)
 
-            assert result.returncode == 0
+        # Manually edit master to mark Password as accepted
+        loaded = load_master(str(master_path))
+        loaded["Password"] = dataclasses.replace(loaded["Password"], status="accepted")
+
+        save_master(list(loaded.values()), str(master_path))
+
+        # Re-import with forms.po which has different translation for Password
+        result = run_cli([
+            "import",
+            "--master", str(master_path),
+            FORMS_PO
+        ])
 
-            # Verify conflict detected
-            reloaded = load_master(str(master_path))
-            # Password in forms.po is "Kennwort" vs "Passwort" in django.po
-            assert reloaded["Password"].status == "conflict"
-            assert reloaded["Password"].msgstr == "Passwort"  # Original preserved
+        assert result.returncode == 0
+
+        # Verify conflict detected
+        reloaded = load_master(str(master_path))
+        # Password in forms.po is "Kennwort" vs "Passwort" in django.po
+        assert reloaded["Password"].status == "conflict"
+        assert reloaded["Password"].msgstr == "Passwort"  # Original preserved
 
 
 class TestLanguageInference:
@@ -1364,103 +881,58 @@ class TestStage7CandidateColumn:
 
     def test_master_entry_has_candidate_field(self):
         """Test that MasterEntry includes candidate field."""
-        entry = MasterEntry(
-            msgid="Save",
-            msgstr="Guardar",
-            status="accepted",
-            score="",
-            context="",
-            context_sources="",
-            candidate="Almacenar"
-        )
+        entry = _me("Save", "Guardar", "accepted", candidate="Almacenar")
         assert entry.candidate == "Almacenar"
 
     def test_candidate_empty_by_default(self):
         """Test that candidate defaults to empty string."""
-        entry = MasterEntry(
-            msgid="Save",
-            msgstr="Guardar",
-            status="accepted",
-            score="",
-            context="",
-            context_sources=""
-        )
+        entry = _me("Save", "Guardar", "accepted")
         assert entry.candidate == ''
 
-    def test_load_master_adds_missing_candidate_column(self):
+    def test_load_master_adds_missing_candidate_column(self, tmp_path):
         """Test that load_master adds candidate column if missing (pre-Stage 7 CSV)."""
-        with TemporaryDirectory() as tmpdir:
-            csv_path = Path(tmpdir) / "test.csv"
-
-            # Write CSV without candidate column (pre-Stage 7 format)
-            with open(csv_path, 'w', encoding='utf-8-sig', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=['msgid', 'msgstr', 'status', 'score', 'context', 'context_sources'], quoting=csv.QUOTE_ALL)
-                writer.writeheader()
-                writer.writerow({
-                    'msgid': 'Save',
-                    'msgstr': 'Guardar',
-                    'status': 'accepted',
-                    'score': '',
-                    'context': '',
-                    'context_sources': ''
-                })
-
-            # Load should add candidate column with empty value
-            result = load_master(str(csv_path))
-
-            assert 'Save' in result
-            assert result['Save'].candidate == ''
-
-    def test_save_and_load_roundtrip_with_candidate(self):
+        csv_path = tmp_path / "test.csv"
+
+        # Write CSV without candidate column (pre-Stage 7 format)
+        with open(csv_path, 'w', encoding='utf-8-sig', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=['msgid', 'msgstr', 'status', 'score', 'context', 'context_sources'], quoting=csv.QUOTE_ALL)
+            writer.writeheader()
+            writer.writerow({
+                'msgid': 'Save',
+                'msgstr': 'Guardar',
+                'status': 'accepted',
+                'score': '',
+                'context': '',
+                'context_sources': ''
+            })
+
+        # Load should add candidate column with empty value
+        result = load_master(str(csv_path))
+
+        assert 'Save' in result
+        assert result['Save'].candidate == ''
+
+    def test_save_and_load_roundtrip_with_candidate(self, tmp_path):
         """Test that candidate survives save → load roundtrip."""
-        with TemporaryDirectory() as tmpdir:
-            csv_path = Path(tmpdir) / "test.csv"
-
-            entries = [
-                MasterEntry(
-                    msgid="Save",
-                    msgstr="Guardar",
-                    status="machine",
-                    score="",
-                    context="",
-                    context_sources="",
-                    candidate="Almacenar"
-                )
-            ]
-
-            save_master(entries, str(csv_path))
-            loaded = load_master(str(csv_path))
-
-            assert loaded['Save'].candidate == "Almacenar"
+        csv_path = tmp_path / "test.csv"
+
+        entries = [
+            _me("Save", "Guardar", "machine", candidate="Almacenar")
+        ]
+
+        save_master(entries, str(csv_path))
+        loaded = load_master(str(csv_path))
+
+        assert loaded['Save'].candidate == "Almacenar"
 
     def test_merge_preserves_candidate_column(self):
         """Test that merge_master preserves candidate values."""
         existing = {
-            "Save": MasterEntry(
-                msgid="Save",
-                msgstr="Guardar",
-                status="machine",
-                score="",
-                context="",
-                context_sources="",
-                candidate="Almacenar"
-            )
+            "Save": _me("Save", "Guardar", "machine", candidate="Almacenar")
         }
 
         po_entries = [
-            POEntryData(
-                msgid="Save",
-                msgstr="Guardar",
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="file.py:10",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file="test.po"
-            )
+            _po("Save", "Guardar", references="file.py:10", source_file="test.po")
         ]
 
         result = merge_master(existing, po_entries)
@@ -1471,204 +943,161 @@ class TestStage7CandidateColumn:
 class TestStage7ColumnSovereignty:
     """Tests for Stage 7: column sovereignty (preserving user columns)."""
 
-    def test_load_preserves_user_columns(self):
+    def test_load_preserves_user_columns(self, tmp_path):
         """Test that load_master preserves user-added columns."""
-        with TemporaryDirectory() as tmpdir:
-            csv_path = Path(tmpdir) / "test.csv"
-
-            # Write CSV with user columns
-            with open(csv_path, 'w', encoding='utf-8-sig', newline='') as f:
-                fieldnames = ['msgid', 'msgstr', 'status', 'score', 'context', 'context_sources', 'candidate', 'notes', 'reviewer']
-                writer = csv.DictWriter(f, fieldnames=fieldnames, quoting=csv.QUOTE_ALL)
-                writer.writeheader()
-                writer.writerow({
-                    'msgid': 'Save',
-                    'msgstr': 'Guardar',
-                    'status': 'accepted',
-                    'score': '',
-                    'context': '',
-                    'context_sources': '',
-                    'candidate': '',
-                    'notes': 'needs review',
-                    'reviewer': 'Alice'
-                })
-
-            result = load_master(str(csv_path))
-
-            assert result['Save'].extra_columns['notes'] == 'needs review'
-            assert result['Save'].extra_columns['reviewer'] == 'Alice'
-
-    def test_save_preserves_user_columns(self):
+        csv_path = tmp_path / "test.csv"
+
+        # Write CSV with user columns
+        with open(csv_path, 'w', encoding='utf-8-sig', newline='') as f:
+            fieldnames = ['msgid', 'msgstr', 'status', 'score', 'context', 'context_sources', 'candidate', 'notes', 'reviewer']
+            writer = csv.DictWriter(f, fieldnames=fieldnames, quoting=csv.QUOTE_ALL)
+            writer.writeheader()
+            writer.writerow({
+                'msgid': 'Save',
+                'msgstr': 'Guardar',
+                'status': 'accepted',
+                'score': '',
+                'context': '',
+                'context_sources': '',
+                'candidate': '',
+                'notes': 'needs review',
+                'reviewer': 'Alice'
+            })
+
+        result = load_master(str(csv_path))
+
+        assert result['Save'].extra_columns['notes'] == 'needs review'
+        assert result['Save'].extra_columns['reviewer'] == 'Alice'
+
+    def test_save_preserves_user_columns(self, tmp_path):
         """Test that save_master preserves user-added columns."""
-        with TemporaryDirectory() as tmpdir:
-            csv_path = Path(tmpdir) / "test.csv"
-
-            entries = [
-                MasterEntry(
-                    msgid="Save",
-                    msgstr="Guardar",
-                    status="accepted",
-                    score="",
-                    context="",
-                    context_sources="",
-                    candidate="",
-                    extra_columns={'notes': 'needs review', 'reviewer': 'Alice'}
-                )
-            ]
-
-            save_master(entries, str(csv_path))
-
-            # Read back with csv module to verify
-            with open(csv_path, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
-                rows = list(reader)
-
-            assert len(rows) == 1
-            assert rows[0]['notes'] == 'needs review'
-            assert rows[0]['reviewer'] == 'Alice'
-
-    def test_column_order_polyglott_first(self):
+        csv_path = tmp_path / "test.csv"
+
+        entries = [
+            _me(
+                "Save",
+                "Guardar",
+                "accepted",
+                candidate="",
+                extra_columns={'notes': 'needs review', 'reviewer': 'Alice'}
+            )
+        ]
+
+        save_master(entries, str(csv_path))
+
+        # Read back with csv module to verify
+        with open(csv_path, 'r', encoding='utf-8-sig') as f:
+            reader = csv.DictReader(f)
+            rows = list(reader)
+
+        assert len(rows) == 1
+        assert rows[0]['notes'] == 'needs review'
+        assert rows[0]['reviewer'] == 'Alice'
+
+    def test_column_order_polyglott_first(self, tmp_path):
         """Test that POlyglott columns come first, user columns after."""
-        with TemporaryDirectory() as tmpdir:
-            csv_path = Path(tmpdir) / "test.csv"
-
-            # Create entry with user columns in mixed order
-            entries = [
-                MasterEntry(
-                    msgid="Save",
-                    msgstr="Guardar",
-                    status="accepted",
-                    score="",
-                    context="",
-                    context_sources="",
-                    candidate="",
-                    extra_columns={'priority': '1', 'reviewer': 'Alice', 'notes': 'check this'}
-                )
-            ]
-
-            save_master(entries, str(csv_path))
-
-            # Read header to check column order
-            with open(csv_path, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
-                cols = reader.fieldnames
-
-            # POlyglott columns should come first
-            from polyglott.master import POLYGLOTT_COLUMNS
-            for i, col in enumerate(POLYGLOTT_COLUMNS):
-                assert cols[i] == col
-
-            # User columns should come after
-            assert 'priority' in cols
-            assert 'reviewer' in cols
-            assert 'notes' in cols
+        csv_path = tmp_path / "test.csv"
+
+        # Create entry with user columns in mixed order
+        entries = [
+            _me(
+                "Save",
+                "Guardar",
+                "accepted",
+                candidate="",
+                extra_columns={'priority': '1', 'reviewer': 'Alice', 'notes': 'check this'}
+            )
+        ]
+
+        save_master(entries, str(csv_path))
+
+        # Read header to check column order
+        cols = _read_header(csv_path)
+
+        # POlyglott columns should come first
+        for i, col in enumerate(POLYGLOTT_COLUMNS):
+            assert cols[i] == col
+
+        # User columns should come after
+        assert 'priority' in cols
+        assert 'reviewer' in cols
+        assert 'notes' in cols
 
     def test_user_columns_survive_roundtrip(self):
         """Test that user columns survive save → load → save cycle."""
-        with TemporaryDirectory() as tmpdir:
-            csv_path = Path(tmpdir) / "test.csv"
-
-            # Original entries with user columns
-            original = [
-                MasterEntry(
-                    msgid="Save",
-                    msgstr="Guardar",
-                    status="accepted",
-                    score="",
-                    context="",
-                    context_sources="",
-                    candidate="",
-                    extra_columns={'notes': 'important', 'reviewer': 'Bob'}
-                )
-            ]
-
-            # Save → load → save → load
-            save_master(original, str(csv_path))
-            loaded1 = load_master(str(csv_path))
-            entries1 = list(loaded1.values())
-            save_master(entries1, str(csv_path))
-            loaded2 = load_master(str(csv_path))
-
-            # User columns should still be there
-            assert loaded2['Save'].extra_columns['notes'] == 'important'
-            assert loaded2['Save'].extra_columns['reviewer'] == 'Bob'
-
-    def test_different_entries_different_user_columns(self):
+        # Original entries with user columns
+        original = [
+            _me(
+                "Save",
+                "Guardar",
+                "accepted",
+                candidate="",
+                extra_columns={'notes': 'important', 'reviewer': 'Bob'}
+            )
+        ]
+
+        # Save → load → save → load, in memory
+        first, second = io.StringIO(newline=''), io.StringIO(newline='')
+        save_master(original, first)
+        first.seek(0)
+        loaded1 = load_master(first)
+        entries1 = list(loaded1.values())
+        save_master(entries1, second)
+        second.seek(0)
+        loaded2 = load_master(second)
+
+        # User columns should still be there
+        assert loaded2['Save'].extra_columns['notes'] == 'important'
+        assert loaded2['Save'].extra_columns['reviewer'] == 'Bob'
+
+    def test_different_entries_different_user_columns(self, tmp_path):
         """Test that entries can have different user columns."""
-        with TemporaryDirectory() as tmpdir:
-            csv_path = Path(tmpdir) / "test.csv"
-
-            entries = [
-                MasterEntry(
-                    msgid="Save",
-                    msgstr="Guardar",
-                    status="accepted",
-                    score="",
-                    context="",
-                    context_sources="",
-                    candidate="",
-                    extra_columns={'notes': 'A'}
-                ),
-                MasterEntry(
-                    msgid="Cancel",
-                    msgstr="Cancelar",
-                    status="accepted",
-                    score="",
-                    context="",
-                    context_sources="",
-                    candidate="",
-                    extra_columns={'reviewer': 'Bob'}
-                )
-            ]
-
-            save_master(entries, str(csv_path))
-
-            # Read back
-            with open(csv_path, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
-                rows = list(reader)
-
-            # Both columns should exist in CSV
-            assert 'notes' in rows[0]
-            assert 'reviewer' in rows[0]
-
-            # First entry has notes, no reviewer
-            assert rows[0]['notes'] == 'A'
-            assert rows[0]['reviewer'] == ''
-
-            # Second entry has reviewer, no notes
-            assert rows[1]['notes'] == ''
-            assert rows[1]['reviewer'] == 'Bob'
+        csv_path = tmp_path / "test.csv"
+
+        entries = [
+            _me("Save", "Guardar", "accepted", candidate="", extra_columns={'notes': 'A'}),
+            _me(
+                "Cancel",
+                "Cancelar",
+                "accepted",
+                candidate="",
+                extra_columns={'reviewer': 'Bob'}
+            )
+        ]
+
+        save_master(entries, str(csv_path))
+
+        # Read back
+        with open(csv_path, 'r', encoding='utf-8-sig') as f:
+            reader = csv.DictReader(f)
+            rows = list(reader)
+
+        # Both columns should exist in CSV
+        assert 'notes' in rows[0]
+        assert 'reviewer' in rows[0]
+
+        # First entry has notes, no reviewer
+        assert rows[0]['notes'] == 'A'
+        assert rows[0]['reviewer'] == ''
+
+        # Second entry has reviewer, no notes
+        assert rows[1]['notes'] == ''
+        assert rows[1]['reviewer'] == 'Bob'
 
     def test_merge_preserves_user_columns(self):
         """Test that merge_master preserves user columns from existing entries."""
         existing = {
-            "Save": MasterEntry(
-                msgid="Save",
-                msgstr="Guardar",
-                status="accepted",
-                score="",
-                context="",
-                context_sources="",
+            "Save": _me(
+                "Save",
+                "Guardar",
+                "accepted",
                 candidate="",
                 extra_columns={'notes': 'important', 'reviewer': 'Alice'}
             )
         }
 
         po_entries = [
-            POEntryData(
-                msgid="Save",
-                msgstr="Guardar",
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="file.py:10",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file="test.po"
-            )
+            _po("Save", "Guardar", references="file.py:10", source_file="test.po")
         ]
 
         result = merge_master(existing, po_entries)
@@ -1680,53 +1109,26 @@ class TestStage7ColumnSovereignty:
     def test_new_entries_have_empty_user_columns(self):
         """Test that new entries from merge have no user columns."""
         existing = {
-            "Save": MasterEntry(
-                msgid="Save",
-                msgstr="Guardar",
-                status="accepted",
-                score="",
-                context="",
-                context_sources="",
+            "Save": _me(
+                "Save",
+                "Guardar",
+                "accepted",
                 candidate="",
                 extra_columns={'notes': 'keep this'}
             )
         }
 
         po_entries = [
-            POEntryData(
-                msgid="Save",
-                msgstr="Guardar",
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="file.py:10",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file="test.po"
-            ),
-            POEntryData(
-                msgid="Cancel",
-                msgstr="Cancelar",
-                msgctxt=None,
-                extracted_comments="",
-                translator_comments="",
-                references="file.py:20",
-                fuzzy=False,
-                obsolete=False,
-                is_plural=False,
-                plural_index=None,
-                source_file="test.po"
-            )
+            _po("Save", "Guardar", references="file.py:10", source_file="test.po"),
+            _po("Cancel", "Cancelar", references="file.py:20", source_file="test.po")
         ]
 
         result = merge_master(existing, po_entries)
 
+        by_msgid = _by_msgid(result)
+
         # Existing entry keeps user columns
-        save_entry = [e for e in result if e.msgid == "Save"][0]
-        assert save_entry.extra_columns['notes'] == 'keep this'
+        assert by_msgid["Save"].extra_columns['notes'] == 'keep this'
 
         # New entry has no user columns
-        cancel_entry = [e for e in result if e.msgid == "Cancel"][0]
-        assert cancel_entry.extra_columns == {}
+        assert by_msgid["Cancel"].extra_columns == {}
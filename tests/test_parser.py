@@ -1,20 +1,39 @@
 """Tests for PO file parser."""
 
+import pickle
+from typing import Dict, List
+
+import polib
 import pytest
 from pathlib import Path
 
-from polyglott.parser import POParser, MultiPOParser, POEntryData, POStatistics
+from polyglott.parser import (
+    POParser,
+    MultiPOParser,
+    POEntryData,
+    POStatistics,
+    POStreamError,
+    iter_po_entries,
+    iter_po_messages,
+)
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
+def _by_msgid(entries: List[POEntryData]) -> Dict[str, POEntryData]:
+    """Index entries by msgid, keeping the first entry for each msgid."""
+    index: Dict[str, POEntryData] = {}
+    for entry in entries:
+        index.setdefault(entry.msgid, entry)
+    return index
+
+
 class TestPOParser:
     """Test suite for POParser."""
 
-    def test_parse_simple_file(self):
+    def test_parse_simple_file(self, parsed_po):
         """Test parsing a simple PO file."""
-        parser = POParser(FIXTURES_DIR / "simple.po")
-        entries = parser.parse()
+        entries = parsed_po(FIXTURES_DIR / "simple.po")
 
         # Should have 4 entries (excluding header)
         assert len(entries) == 4
@@ -27,10 +46,9 @@ class TestPOParser:
         assert not hello.obsolete
         assert not hello.is_plural
 
-    def test_parse_untranslated_entries(self):
+    def test_parse_untranslated_entries(self, parsed_po):
         """Test detection of untranslated entries."""
-        parser = POParser(FIXTURES_DIR / "simple.po")
-        entries = parser.parse()
+        entries = parsed_po(FIXTURES_DIR / "simple.po")
 
         # Find untranslated entries
         untranslated = [e for e in entries if e.msgstr == ""]
@@ -40,43 +58,42 @@ class TestPOParser:
         goodbye = next(e for e in entries if e.msgid == "Goodbye")
         assert goodbye.msgstr == ""
 
-    def test_parse_complex_metadata(self):
+    def test_parse_complex_metadata(self, parsed_po):
         """Test extraction of all metadata types."""
-        parser = POParser(FIXTURES_DIR / "complex.po")
-        entries = parser.parse()
+        entries = parsed_po(FIXTURES_DIR / "complex.po")
+
+        by_msgid = _by_msgid(entries)
 
         # Find entry with extracted comment
-        simple = next(e for e in entries if e.msgid == "Simple message")
+        simple = by_msgid["Simple message"]
         assert "Extracted comment" in simple.extracted_comments
         assert simple.references == "views.py:42 templates/home.html:15"
 
         # Find entry with context
-        home = next(e for e in entries if e.msgid == "Home")
+        home = by_msgid["Home"]
         assert home.msgctxt == "navigation"
         assert home.msgstr == "Start"
 
-    def test_parse_plural_forms(self):
+    def test_parse_plural_forms(self, parsed_po):
         """Test handling of plural entries."""
-        parser = POParser(FIXTURES_DIR / "complex.po")
-        entries = parser.parse()
+        entries = parsed_po(FIXTURES_DIR / "complex.po")
 
         # Find plural entries for "Item"
-        items = [e for e in entries if e.msgid == "Items" and e.is_plural]
+        items = {e.plural_index: e for e in entries if e.msgid == "Items" and e.is_plural}
         assert len(items) == 2  # Two plural forms
 
         # Check plural form 0
-        item_0 = next(e for e in items if e.plural_index == 0)
+        item_0 = items[0]
         assert item_0.msgstr == "Gegenstand"
         assert item_0.is_plural
 
         # Check plural form 1
-        item_1 = next(e for e in items if e.plural_index == 1)
+        item_1 = items[1]
         assert item_1.msgstr == "Gegenstände"
 
-    def test_parse_fuzzy_flag(self):
+    def test_parse_fuzzy_flag(self, parsed_po):
         """Test detection of fuzzy translations."""
-        parser = POParser(FIXTURES_DIR / "complex.po")
-        entries = parser.parse()
+        entries = parsed_po(FIXTURES_DIR / "complex.po")
 
         # Find fuzzy entries
         fuzzy_entries = [e for e in entries if e.fuzzy]
@@ -87,10 +104,9 @@ class TestPOParser:
         assert fuzzy_untrans.fuzzy
         assert fuzzy_untrans.msgstr == ""
 
-    def test_parse_obsolete_entries(self):
+    def test_parse_obsolete_entries(self, parsed_po):
         """Test handling of obsolete entries."""
-        parser = POParser(FIXTURES_DIR / "complex.po")
-        entries = parser.parse()
+        entries = parsed_po(FIXTURES_DIR / "complex.po")
 
         # Find obsolete entries
         obsolete = [e for e in entries if e.obsolete]
@@ -101,33 +117,33 @@ class TestPOParser:
         assert old.obsolete
         assert old.msgstr == "Alte Nachricht"
 
-    def test_parse_unicode_content(self):
+    def test_parse_unicode_content(self, parsed_po):
         """Test handling of Unicode characters."""
-        parser = POParser(FIXTURES_DIR / "unicode.po")
-        entries = parser.parse()
+        entries = parsed_po(FIXTURES_DIR / "unicode.po")
+
+        by_msgid = _by_msgid(entries)
 
         # German umlauts
-        german = next(e for e in entries if e.msgid == "German umlauts")
+        german = by_msgid["German umlauts"]
         assert "Äpfel" in german.msgstr
         assert "Straße" in german.msgstr
 
         # Emoji
-        emoji = next(e for e in entries if e.msgid == "Emoji support")
+        emoji = by_msgid["Emoji support"]
         assert "🎉" in emoji.msgstr
         assert "🚀" in emoji.msgstr
 
         # CJK characters
-        chinese = next(e for e in entries if e.msgid == "Chinese characters")
+        chinese = by_msgid["Chinese characters"]
         assert "你好世界" in chinese.msgstr
 
         # Arabic
-        arabic = next(e for e in entries if e.msgid == "Arabic script")
+        arabic = by_msgid["Arabic script"]
         assert "مرحبا" in arabic.msgstr
 
-    def test_parse_empty_file(self):
+    def test_parse_empty_file(self, parsed_po):
         """Test parsing an empty PO file (header only)."""
-        parser = POParser(FIXTURES_DIR / "empty.po")
-        entries = parser.parse()
+        entries = parsed_po(FIXTURES_DIR / "empty.po")
 
         # Should have 0 entries (header doesn't count)
         assert len(entries) == 0
@@ -150,6 +166,17 @@ class TestPOParser:
         assert stats.fuzzy == 0
         assert stats.plurals == 0
 
+    def test_statistics_match_polib_helpers(self):
+        """Test that the counts agree with polib's entry filters."""
+        parser = POParser(FIXTURES_DIR / "complex.po")
+        stats = parser.get_statistics()
+
+        po = parser.po
+        assert stats.total == len(po)
+        assert stats.untranslated == len(po.untranslated_entries())
+        assert stats.fuzzy == len(po.fuzzy_entries())
+        assert stats.plurals == sum(1 for entry in po if entry.msgid_plural)
+
     def test_file_not_found(self):
         """Test error handling for missing file."""
         with pytest.raises(FileNotFoundError):
@@ -161,6 +188,89 @@ class TestPOParser:
             POParser(FIXTURES_DIR / "malformed.po")
 
 
+class TestPOEntryData:
+    """Test suite for the POEntryData container."""
+
+    def test_entry_is_slotted(self, make_entry):
+        """Test that entries carry no per-instance __dict__."""
+        entry = make_entry(msgid="a", msgstr="b")
+
+        assert hasattr(POEntryData, "__slots__")
+        assert not hasattr(entry, "__dict__")
+        with pytest.raises(AttributeError):
+            entry.unknown_field = True
+
+    def test_entry_pickles(self, make_entry):
+        """Test that entries survive pickling (used by parallel parsing)."""
+        entry = make_entry(msgid="a", msgstr="b", references="x.py:1", source_file="de.po")
+
+        assert pickle.loads(pickle.dumps(entry)) == entry
+
+
+class TestIterPOEntries:
+    """Test suite for the streaming iter_po_entries reader."""
+
+    def test_matches_polib_on_fixtures(self):
+        """Test that streaming gives the same entries as POParser."""
+        for name in ["simple.po", "complex.po", "unicode.po", "context_test.po", "format_issues.po"]:
+            expected = POParser(FIXTURES_DIR / name).parse(source_file=name)
+            assert list(iter_po_entries(FIXTURES_DIR / name, source_file=name)) == expected, name
+
+    def test_obsolete_entries_come_last(self, tmp_path):
+        """Test that obsolete entries are yielded after active ones."""
+        po_file = tmp_path / "obsolete.po"
+        po_file.write_text(
+            'msgid ""\nmsgstr ""\n\n'
+            '#~ msgid "Old"\n#~ msgstr "Alt"\n\n'
+            '#, fuzzy\nmsgid "New"\nmsgstr "Neu"\n',
+            encoding="utf-8"
+        )
+
+        entries = list(iter_po_entries(po_file))
+
+        assert [(e.msgid, e.obsolete, e.fuzzy) for e in entries] == [
+            ("New", False, True),
+            ("Old", True, False),
+        ]
+
+    def test_empty_and_crlf_files(self, tmp_path):
+        """Test zero-byte files and CRLF line endings."""
+        empty = tmp_path / "empty.po"
+        empty.write_bytes(b"")
+        assert list(iter_po_entries(empty)) == []
+
+        crlf = tmp_path / "crlf.po"
+        crlf.write_bytes((FIXTURES_DIR / "simple.po").read_bytes().replace(b"\n", b"\r\n"))
+        assert list(iter_po_entries(crlf)) == POParser(crlf).parse()
+
+    def test_messages_match_polib_iteration(self):
+        """Test that iter_po_messages follows polib's POFile iteration."""
+        for name in ["simple.po", "complex.po", "unicode.po", "context_test.po"]:
+            expected = [(e.msgid, e.msgstr) for e in polib.pofile(str(FIXTURES_DIR / name))]
+            assert list(iter_po_messages(FIXTURES_DIR / name)) == expected, name
+
+    def test_malformed_file(self):
+        """Test that syntax errors raise POStreamError."""
+        with pytest.raises(POStreamError):
+            list(iter_po_entries(FIXTURES_DIR / "malformed.po"))
+
+    def test_non_utf8_charset(self, tmp_path):
+        """Test that non-UTF-8 files are left to polib."""
+        po_file = tmp_path / "latin1.po"
+        po_file.write_text(
+            'msgid ""\nmsgstr ""\n"Content-Type: text/plain; charset=ISO-8859-1\\n"\n\n'
+            'msgid "Käse"\nmsgstr "Fromage"\n',
+            encoding="latin-1"
+        )
+
+        with pytest.raises(POStreamError):
+            list(iter_po_entries(po_file))
+
+        # MultiPOParser falls back to polib, which decodes the file
+        entries = MultiPOParser([str(po_file)]).parse()
+        assert entries[0].msgid == "Käse"
+
+
 class TestMultiPOParser:
     """Test suite for MultiPOParser."""
 
@@ -199,6 +309,37 @@ class TestMultiPOParser:
         assert stats.untranslated >= 2
         assert stats.plurals >= 2
 
+    def test_parse_parallel_matches_serial(self):
+        """Test that parsing in worker processes gives the serial result."""
+        files = [
+            str(FIXTURES_DIR / "simple.po"),
+            str(FIXTURES_DIR / "complex.po"),
+            str(FIXTURES_DIR / "unicode.po"),
+        ]
+
+        serial = MultiPOParser(files).parse()
+        parallel = MultiPOParser(files, jobs=2).parse()
+
+        assert parallel == serial
+
+    def test_statistics_parallel_matches_serial(self):
+        """Test that combined statistics don't depend on the worker count."""
+        files = [
+            str(FIXTURES_DIR / "simple.po"),
+            str(FIXTURES_DIR / "complex.po"),
+            str(FIXTURES_DIR / "unicode.po"),
+        ]
+
+        serial = MultiPOParser(files).get_combined_statistics()
+        parallel = MultiPOParser(files, jobs=2).get_combined_statistics()
+
+        assert parallel == serial
+
+    def test_jobs_zero_uses_cpu_count(self):
+        """Test that jobs=0 means one worker per CPU."""
+        parser = MultiPOParser([], jobs=0)
+        assert parser.jobs >= 1
+
     def test_empty_file_list(self):
         """Test parsing with empty file list."""
         parser = MultiPOParser([])
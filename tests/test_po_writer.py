@@ -2,12 +2,19 @@
 
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from typing import Dict
 
 import polib
 import pytest
 
 from polyglott.master import MasterEntry
-from polyglott.po_writer import export_to_po, ExportResult
+from polyglott.parser import POEntryData, iter_po_entries
+from polyglott.po_writer import export_to_po, export_to_po_batch, ExportResult
+
+
+def _read_po(po_path) -> Dict[str, POEntryData]:
+    """Read back a PO file with the streaming reader, indexed by msgid."""
+    return {entry.msgid: entry for entry in iter_po_entries(po_path)}
 
 
 class TestExportBasics:
@@ -41,10 +48,9 @@ class TestExportBasics:
             assert result.overwrites == 0
 
             # Verify PO file was updated
-            po_loaded = polib.pofile(str(po_path))
-            entry = po_loaded.find("Hello")
+            entry = _read_po(po_path)["Hello"]
             assert entry.msgstr == "Hallo"
-            assert "fuzzy" not in entry.flags
+            assert not entry.fuzzy
 
     def test_entry_not_in_master_untouched(self):
         """Test that entries not in master are left untouched."""
@@ -75,8 +81,7 @@ class TestExportBasics:
             assert result.skips == 1
 
             # Verify "World" was not modified
-            po_loaded = polib.pofile(str(po_path))
-            world_entry = po_loaded.find("World")
+            world_entry = _read_po(po_path)["World"]
             assert world_entry.msgstr == "Welt"
 
     def test_empty_msgstr_in_master_skipped(self):
@@ -105,8 +110,7 @@ class TestExportBasics:
             assert result.skips == 1
 
             # PO entry should remain unchanged
-            po_loaded = polib.pofile(str(po_path))
-            entry = po_loaded.find("Hello")
+            entry = _read_po(po_path)["Hello"]
             assert entry.msgstr == "Old"
 
     def test_overwrite_existing_msgstr(self):
@@ -135,8 +139,7 @@ class TestExportBasics:
             assert result.overwrites == 1
 
             # Verify msgstr was updated
-            po_loaded = polib.pofile(str(po_path))
-            entry = po_loaded.find("Hello")
+            entry = _read_po(po_path)["Hello"]
             assert entry.msgstr == "New Translation"
 
 
@@ -165,10 +168,10 @@ class TestStatusFiltering:
             # Only accepted should be written
             assert result.writes == 1
 
-            po_loaded = polib.pofile(str(po_path))
-            assert po_loaded.find("Hello").msgstr == "Hallo"
-            assert po_loaded.find("World").msgstr == ""
-            assert po_loaded.find("Goodbye").msgstr == ""
+            po_loaded = _read_po(po_path)
+            assert po_loaded["Hello"].msgstr == "Hallo"
+            assert po_loaded["World"].msgstr == ""
+            assert po_loaded["Goodbye"].msgstr == ""
 
     def test_multiple_statuses(self):
         """Test exporting multiple statuses."""
@@ -192,10 +195,10 @@ class TestStatusFiltering:
             # Both accepted and machine should be written
             assert result.writes == 2
 
-            po_loaded = polib.pofile(str(po_path))
-            assert po_loaded.find("Hello").msgstr == "Hallo"
-            assert po_loaded.find("World").msgstr == "Welt"
-            assert po_loaded.find("Goodbye").msgstr == ""
+            po_loaded = _read_po(po_path)
+            assert po_loaded["Hello"].msgstr == "Hallo"
+            assert po_loaded["World"].msgstr == "Welt"
+            assert po_loaded["Goodbye"].msgstr == ""
 
 
 class TestFuzzyFlagHandling:
@@ -217,9 +220,8 @@ class TestFuzzyFlagHandling:
 
             export_to_po(master, str(po_path), {"accepted"})
 
-            po_loaded = polib.pofile(str(po_path))
-            entry = po_loaded.find("Hello")
-            assert "fuzzy" not in entry.flags
+            entry = _read_po(po_path)["Hello"]
+            assert not entry.fuzzy
 
     def test_machine_sets_fuzzy(self):
         """Test that machine status sets fuzzy flag."""
@@ -236,9 +238,8 @@ class TestFuzzyFlagHandling:
 
             export_to_po(master, str(po_path), {"machine"})
 
-            po_loaded = polib.pofile(str(po_path))
-            entry = po_loaded.find("Hello")
-            assert "fuzzy" in entry.flags
+            entry = _read_po(po_path)["Hello"]
+            assert entry.fuzzy
 
     def test_review_leaves_fuzzy_unchanged(self):
         """Test that review status leaves fuzzy flag unchanged."""
@@ -257,9 +258,8 @@ class TestFuzzyFlagHandling:
 
             export_to_po(master, str(po_path), {"review"})
 
-            po_loaded = polib.pofile(str(po_path))
-            entry = po_loaded.find("Hello")
-            assert "fuzzy" in entry.flags
+            entry = _read_po(po_path)["Hello"]
+            assert entry.fuzzy
 
             # Test with fuzzy flag absent
             po = polib.POFile()
@@ -273,9 +273,8 @@ class TestFuzzyFlagHandling:
 
             export_to_po(master, str(po_path), {"review"})
 
-            po_loaded = polib.pofile(str(po_path))
-            entry = po_loaded.find("World")
-            assert "fuzzy" not in entry.flags
+            entry = _read_po(po_path)["World"]
+            assert not entry.fuzzy
 
 
 class TestDryRun:
@@ -300,8 +299,7 @@ class TestDryRun:
             assert result.writes == 1
 
             # But file should not be modified
-            po_loaded = polib.pofile(str(po_path))
-            entry = po_loaded.find("Hello")
+            entry = _read_po(po_path)["Hello"]
             assert entry.msgstr == ""
 
     def test_dry_run_correct_summary(self):
@@ -410,6 +408,31 @@ class TestFullPathsInOutput:
             assert not any(detail.startswith("WRITE    django.po:") for detail in result.details)
 
 
+class TestBatchExport:
+    """Test exporting one master to several PO files."""
+
+    def test_batch_matches_single_exports(self, tmp_path):
+        """Test that each file gets the result export_to_po would give."""
+        paths = []
+        for name, msgstr in [("de.po", ""), ("at.po", "Servus")]:
+            po = polib.POFile()
+            po.append(polib.POEntry(msgid="Hello", msgstr=msgstr))
+            po.append(polib.POEntry(msgid="World", msgstr=""))
+            po.save(str(tmp_path / name))
+            paths.append(str(tmp_path / name))
+
+        master = [
+            MasterEntry(msgid="Hello", msgstr="Hallo", status="accepted", score="", context="", context_sources="")
+        ]
+
+        results = export_to_po_batch(master, paths, {"accepted"}, verbose=True)
+
+        assert [(r.writes, r.overwrites, r.skips) for r in results] == [(1, 0, 1), (0, 1, 1)]
+        assert all(paths[i] in results[i].details[0] for i in range(2))
+        for path in paths:
+            assert _read_po(path)["Hello"].msgstr == "Hallo"
+
+
 class TestIdempotency:
     """Test that export is idempotent in its reporting."""
 
@@ -459,6 +482,99 @@ class TestIdempotency:
             assert result.overwrites == 0
             assert result.skips == 1
 
+    def test_noop_export_leaves_file_untouched(self, tmp_path):
+        """Test that an export with nothing to change doesn't rewrite the file."""
+        po_path = tmp_path / "test.po"
+        # Not polib's own formatting, so a rewrite would show
+        content = 'msgid ""\nmsgstr ""\n\nmsgid "Hello"\nmsgstr ""\n"Hallo"\n\nmsgid "World"\nmsgstr ""\n'
+        po_path.write_text(content, encoding="utf-8")
+
+        master = [
+            MasterEntry(msgid="Hello", msgstr="Hallo", status="accepted", score="", context="", context_sources=""),
+            MasterEntry(msgid="World", msgstr="Welt", status="machine", score="", context="", context_sources=""),
+        ]
+
+        result = export_to_po(master, str(po_path), {"accepted"})
+
+        assert (result.writes, result.overwrites, result.skips) == (0, 0, 2)
+        assert po_path.read_text(encoding="utf-8") == content
+
+    def test_write_is_atomic_and_keeps_mode(self, tmp_path):
+        """Test that a rewrite replaces the file in one step and keeps its mode."""
+        po_path = tmp_path / "test.po"
+        po = polib.POFile()
+        po.append(polib.POEntry(msgid="Hello", msgstr=""))
+        po.save(str(po_path))
+        po_path.chmod(0o644)
+
+        master = [
+            MasterEntry(msgid="Hello", msgstr="Hallo", status="accepted", score="", context="", context_sources="")
+        ]
+
+        result = export_to_po(master, str(po_path), {"accepted"})
+
+        assert result.writes == 1
+        assert _read_po(po_path)["Hello"].msgstr == "Hallo"
+        assert po_path.stat().st_mode & 0o777 == 0o644
+        assert [p.name for p in tmp_path.iterdir()] == ["test.po"]
+
+    def test_write_through_symlink(self, tmp_path):
+        """Test that exporting to a symlinked PO file updates the link target."""
+        real_path = tmp_path / "real.po"
+        po = polib.POFile()
+        po.append(polib.POEntry(msgid="Hello", msgstr=""))
+        po.save(str(real_path))
+        link_path = tmp_path / "link.po"
+        link_path.symlink_to(real_path)
+
+        master = [
+            MasterEntry(msgid="Hello", msgstr="Hallo", status="accepted", score="", context="", context_sources="")
+        ]
+
+        result = export_to_po(master, str(link_path), {"accepted"})
+
+        assert result.writes == 1
+        assert link_path.is_symlink()
+        assert _read_po(real_path)["Hello"].msgstr == "Hallo"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["link.po", "real.po"]
+
+    def test_write_keeps_hard_links(self, tmp_path):
+        """Test that exporting to a hard-linked PO file updates every link."""
+        po_path = tmp_path / "test.po"
+        po = polib.POFile()
+        po.append(polib.POEntry(msgid="Hello", msgstr=""))
+        po.save(str(po_path))
+        other_path = tmp_path / "other.po"
+        other_path.hardlink_to(po_path)
+
+        master = [
+            MasterEntry(msgid="Hello", msgstr="Hallo", status="accepted", score="", context="", context_sources="")
+        ]
+
+        result = export_to_po(master, str(po_path), {"accepted"})
+
+        assert result.writes == 1
+        assert _read_po(other_path)["Hello"].msgstr == "Hallo"
+        assert po_path.stat().st_ino == other_path.stat().st_ino
+
+    def test_unchanged_polib_fallback_not_rewritten(self, tmp_path):
+        """Test that files polib has to load are only rewritten when they change."""
+        po_path = tmp_path / "latin1.po"
+        po = polib.POFile(encoding="iso-8859-1")
+        po.metadata = {"Content-Type": "text/plain; charset=ISO-8859-1"}
+        po.append(polib.POEntry(msgid="Käse", msgstr="Fromage"))
+        po.save(str(po_path))
+        before = po_path.stat().st_mtime_ns
+
+        master = [
+            MasterEntry(msgid="Käse", msgstr="Fromage", status="accepted", score="", context="", context_sources="")
+        ]
+
+        result = export_to_po(master, str(po_path), {"accepted"})
+
+        assert result.skips == 1
+        assert po_path.stat().st_mtime_ns == before
+
     def test_skip_verbose_output(self):
         """Test that skip actions appear in verbose output."""
         with TemporaryDirectory() as tmpdir:
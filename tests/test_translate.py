@@ -15,6 +15,7 @@ from polyglott.translate import (
     protect_entities,
     restore_entities,
     translate_multiline,
+    translate_multiline_batch,
     map_language_code,
     map_source_lang,
     map_target_lang,
@@ -51,6 +52,14 @@ class TestTokenization:
         assert '<x id="0">' in wrapped
         assert '<x id="1">' in wrapped
 
+    def test_tokenize_ids_follow_text_order(self):
+        """Test that IDs are assigned in order of first appearance."""
+        text = "{count} items for %(user)s"
+        wrapped, placeholders = tokenize(text)
+
+        assert placeholders == ['{count}', '%(user)s']
+        assert wrapped == '<x id="0">{count}</x> items for <x id="1">%(user)s</x>'
+
     def test_tokenize_multiple_same_placeholder(self):
         """Test duplicate placeholders."""
         text = "%(name)s loves %(name)s"
@@ -83,6 +92,13 @@ class TestTokenization:
 
         assert restored == "User %(user)s has {count} items"
 
+    def test_restore_leaves_malformed_tags(self):
+        """Test that only complete <x id="N">...</x> wrappers are removed."""
+        text = '<x id="a">%(a)s</x> <x id="1"></x> <x id="2">{b}</x>'
+        restored = restore(text)
+
+        assert restored == '<x id="a">%(a)s</x> <x id="1"></x> {b}'
+
     def test_restore_no_tags(self):
         """Test text without XML tags."""
         text = "Hello world"
@@ -193,6 +209,23 @@ class TestMultiline:
 
         translator_func.assert_called_with("Line 1", "en", "de", "admin")
 
+    def test_translate_multiline_batch_single_call(self):
+        """Test batch translator gets all non-empty lines in one call."""
+        lines = ["Line 1", "", "Line 2", "  "]
+        batch_func = Mock(side_effect=lambda texts, *args: [f"Translated: {t}" for t in texts])
+
+        result = translate_multiline_batch(lines, batch_func, "en", "de", "ctx")
+
+        assert result == ["Translated: Line 1", "", "Translated: Line 2", "  "]
+        batch_func.assert_called_once_with(["Line 1", "Line 2"], "en", "de", "ctx")
+
+    def test_translate_multiline_batch_only_empty_lines(self):
+        """Test batch translator is not called without anything to translate."""
+        batch_func = Mock()
+
+        assert translate_multiline_batch(["", ""], batch_func, "en", "de") == ["", ""]
+        batch_func.assert_not_called()
+
 
 class TestEntities:
     """Test HTML entity handling."""
@@ -248,6 +281,14 @@ class TestEntities:
 
         assert restored == '&lt;tag&gt; &amp; &quot;quote&quot;'
 
+    def test_entities_roundtrip_character_references(self):
+        """Test that restored entities aren't encoded again by later ones."""
+        text = "Tom &amp; Jerry&#59; 1 &lt; 2"
+        decoded, entities = protect_entities(text)
+
+        assert decoded == "Tom & Jerry; 1 < 2"
+        assert restore_entities(decoded, entities) == text
+
 
 class TestLanguageMapping:
     """Test language code mapping for DeepL."""
@@ -329,6 +370,23 @@ class TestDeepLBackend:
 
         assert backend.translator == mock_translator
         mock_deepl.Translator.assert_called_once_with("valid-key")
+        # Auth key is validated lazily, once, before the first API call
+        mock_translator.get_usage.assert_not_called()
+
+        mock_translator.translate_text.return_value = Mock(text="Hallo")
+        backend.translate_entry("Hello", "en", "de")
+        backend.translate_entry("World", "en", "de")
+        mock_translator.get_usage.assert_called_once()
+
+    @patch('polyglott.translate.deepl')
+    def test_init_eager_validate(self, mock_deepl):
+        """Test eager_validate checks the auth key during construction."""
+        mock_translator = Mock()
+        mock_translator.get_usage.return_value = Mock()
+        mock_deepl.Translator.return_value = mock_translator
+
+        DeepLBackend("valid-key", eager_validate=True)
+
         mock_translator.get_usage.assert_called_once()
 
     @patch('polyglott.translate.deepl')
@@ -344,10 +402,16 @@ class TestDeepLBackend:
         mock_deepl.AuthorizationException = MockAuthorizationException
 
         with pytest.raises(TranslationError) as exc_info:
-            DeepLBackend("invalid-key")
+            DeepLBackend("invalid-key", eager_validate=True)
 
         assert "Invalid DeepL API key" in str(exc_info.value)
 
+        # Lazily validated backends report it on first use
+        backend = DeepLBackend("invalid-key")
+        with pytest.raises(TranslationError, match="Invalid DeepL API key"):
+            backend.translate_entry("Hello", "en", "de")
+        mock_translator.translate_text.assert_not_called()
+
     @patch('polyglott.translate.deepl', None)
     def test_init_missing_deepl_package(self):
         """Test initialization when deepl package not installed."""
@@ -462,19 +526,127 @@ class TestDeepLBackend:
         """Test translating multiline text."""
         mock_translator = Mock()
         mock_translator.get_usage.return_value = Mock()
-        mock_translator.translate_text.side_effect = [
+        mock_translator.translate_text.return_value = [
             Mock(text="Zeile 1"),
             Mock(text="Zeile 2")
         ]
         mock_deepl.Translator.return_value = mock_translator
 
         backend = DeepLBackend("key")
-        result = backend.translate_entry("Line 1\nLine 2", "en", "de")
+        result = backend.translate_entry("Line 1\n\nLine 2", "en", "de")
+
+        assert result == "Zeile 1\n\nZeile 2"
+        # Should send all non-empty lines in one translate_text call
+        mock_translator.translate_text.assert_called_once()
+        assert mock_translator.translate_text.call_args.kwargs['text'] == ["Line 1", "Line 2"]
+
+    @patch('polyglott.translate.deepl')
+    def test_translate_entry_many_lines_split_into_requests(self, mock_deepl):
+        """Test entries with more lines than DeepL accepts per request."""
+        mock_translator = Mock()
+        mock_translator.get_usage.return_value = Mock()
+        mock_translator.translate_text.side_effect = lambda **kwargs: [
+            Mock(text=text.upper()) for text in kwargs['text']
+        ]
+        mock_deepl.Translator.return_value = mock_translator
+
+        lines = [f"line {i}" for i in range(120)]
+        backend = DeepLBackend("key")
+        result = backend.translate_entry("\n".join(lines), "en", "de")
+
+        assert result == "\n".join(line.upper() for line in lines)
+        batch_sizes = [len(call.kwargs['text']) for call in mock_translator.translate_text.call_args_list]
+        assert batch_sizes == [50, 50, 20]
+
+    @patch('polyglott.translate.deepl')
+    def test_translate_entry_repeated_uses_cache(self, mock_deepl):
+        """Test repeated requests are served from the cache."""
+        mock_translator = Mock()
+        mock_translator.get_usage.return_value = Mock()
+        mock_translator.translate_text.return_value = Mock(text="Speichern")
+        mock_deepl.Translator.return_value = mock_translator
+
+        backend = DeepLBackend("key")
+        first = backend.translate_entry("Save", "en", "de")
+        second = backend.translate_entry("Save", "en", "de")
+
+        assert first == second == "Speichern"
+        assert mock_translator.translate_text.call_count == 1
+
+        # Different context is a different request
+        backend.translate_entry("Save", "en", "de", context="toolbar")
+        assert mock_translator.translate_text.call_count == 2
+
+    @patch('polyglott.translate.deepl')
+    def test_translate_entry_cache_bounded_and_cleared(self, mock_deepl):
+        """Test the cache drops old entries and resets with the glossary."""
+        mock_translator = Mock()
+        mock_translator.get_usage.return_value = Mock()
+        mock_translator.translate_text.side_effect = lambda **kwargs: Mock(text=kwargs['text'].upper())
+        mock_translator.create_glossary.return_value = Mock(glossary_id="glossary-123")
+        mock_deepl.Translator.return_value = mock_translator
+
+        backend = DeepLBackend("key")
+        backend.cache_size = 2
+        for word in ["one", "two", "three"]:
+            backend.translate_entry(word, "en", "de")
+        assert mock_translator.translate_text.call_count == 3
+
+        backend.translate_entry("one", "en", "de")  # Evicted
+        assert mock_translator.translate_text.call_count == 4
+
+        backend.create_glossary({"three": "drei"}, "en", "de")
+        backend.translate_entry("three", "en", "de")  # Cache cleared
+        assert mock_translator.translate_text.call_count == 5
+
+    @patch('polyglott.translate.deepl')
+    def test_translate_entry_not_cached_across_glossary_change(self, mock_deepl):
+        """Test a translation finished after a glossary change isn't cached."""
+        mock_translator = Mock()
+        mock_translator.get_usage.return_value = Mock()
+        mock_translator.create_glossary.return_value = Mock(glossary_id="glossary-123")
+        mock_deepl.Translator.return_value = mock_translator
+        backend = DeepLBackend("key")
+
+        def translate_text(**kwargs):
+            # Another thread sets up a glossary while this request is in flight
+            if mock_translator.create_glossary.call_count == 0:
+                backend.create_glossary({"save": "sichern"}, "en", "de")
+            return Mock(text=kwargs['text'].upper())
+
+        mock_translator.translate_text.side_effect = translate_text
+
+        backend.translate_entry("Save", "en", "de")
+        backend.translate_entry("Save", "en", "de")
 
-        assert result == "Zeile 1\nZeile 2"
-        # Should call translate_text twice (once per line)
         assert mock_translator.translate_text.call_count == 2
 
+    @patch('polyglott.translate.deepl')
+    def test_translate_entries_bulk(self, mock_deepl):
+        """Test bulk translation keeps order, dedupes and reports failures in place."""
+        mock_translator = Mock()
+        mock_translator.get_usage.return_value = Mock()
+
+        def translate_text(**kwargs):
+            if kwargs['text'] == "Broken":
+                raise RuntimeError("bad request")
+            return Mock(text=kwargs['text'].upper())
+
+        mock_translator.translate_text.side_effect = translate_text
+        mock_deepl.Translator.return_value = mock_translator
+        mock_deepl.QuotaExceededException = type("MockQuotaExceededException", (Exception,), {})
+
+        backend = DeepLBackend("key")
+        results = backend.translate_entries_bulk(
+            ["Save", "Open", "Broken", "Save", "OK"], "en", "de", max_workers=4
+        )
+
+        assert results[:2] == ["SAVE", "OPEN"]
+        assert isinstance(results[2], TranslationError)
+        assert results[3:] == ["SAVE", "OK"]
+        # "Save" once, "Open" once, "Broken" once; "OK" is passthrough
+        assert mock_translator.translate_text.call_count == 3
+
     @patch('polyglott.translate.deepl')
     def test_translate_entry_with_entities(self, mock_deepl):
         """Test translating text with HTML entities."""